@@ -22,6 +22,17 @@ logger = logging.getLogger(__name__)
 class SafeAlternativesFinder:
     """Finds safe alternative videos for dangerous/AI content"""
     
+    # Broad animal vocabulary for _is_animal_related (substring match, like
+    # the original `any(k in title)` scan), compiled into one alternation
+    _ANIMAL_RELATED_KEYWORDS = [
+        'animal', 'dog', 'cat', 'bird', 'lion', 'tiger', 'bear',
+        'elephant', 'monkey', 'horse', 'rabbit', 'fish', 'shark',
+        'whale', 'dolphin', 'pet', 'puppy', 'kitten', 'wildlife',
+        'zoo', 'safari', 'nature', 'creature', 'beast', 'wolf',
+        'fox', 'deer', 'snake', 'reptile', 'insect', 'butterfly'
+    ]
+    _animal_related_re = re.compile("|".join(re.escape(k) for k in _ANIMAL_RELATED_KEYWORDS))
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with optional YouTube API key and load config files."""
         self.api_key = api_key or os.environ.get("YOUTUBE_API_KEY")
@@ -35,13 +46,17 @@ class SafeAlternativesFinder:
         self.real_animal_searches = self._load_json("real_animal_searches.json", [])
         self.trusted_channels = self._load_json("trusted_channels.json", [])
         
-        # Load fallback data
-        self.fallback_tutorials = self._load_json("fallback_tutorials.json", [])
-        self.fallback_entertainment = self._load_json("fallback_entertainment.json", [])
-        self.fallback_real_animals = self._load_json("fallback_real_animals.json", {})
+        # Load fallback data (read-only reference data, frozen into tuples;
+        # callers slice them into fresh lists for responses)
+        self.fallback_tutorials = tuple(self._load_json("fallback_tutorials.json", []))
+        self.fallback_entertainment = tuple(self._load_json("fallback_entertainment.json", []))
+        self.fallback_real_animals = {
+            animal: tuple(videos)
+            for animal, videos in self._load_json("fallback_real_animals.json", {}).items()
+        }
         
         # Flatten fallback videos for backwards compatibility if needed
-        self.fallback_real_videos = self.fallback_real_animals.get("default", [])
+        self.fallback_real_videos = self.fallback_real_animals.get("default", ())
 
     def _load_json(self, filename: str, default: Any) -> Any:
         """Load a JSON config file from the alternatives data directory."""
@@ -264,7 +279,7 @@ class SafeAlternativesFinder:
         if not self.enabled:
             return {
                 "enabled": True,
-                "alternatives": self.fallback_tutorials[:max_results],
+                "alternatives": list(self.fallback_tutorials[:max_results]),
                 "category_type": "ai_tutorials", 
                 "message": "🎓 Learn to create AI videos! (curated picks)",
                 "detected_subject": detected_subject,
@@ -333,7 +348,7 @@ class SafeAlternativesFinder:
         
         # Fall back to curated list if search returns nothing
         if not alternatives:
-            alternatives = self.fallback_tutorials[:max_results]
+            alternatives = list(self.fallback_tutorials[:max_results])
         
         subject_text = f" {detected_subject}" if detected_subject else ""
         format_text = "Shorts" if prefer_shorts else "tutorials"
@@ -356,7 +371,7 @@ class SafeAlternativesFinder:
         if not self.enabled:
             return {
                 "enabled": True,
-                "alternatives": self.fallback_entertainment[:max_results],
+                "alternatives": list(self.fallback_entertainment[:max_results]),
                 "category_type": "ai_entertainment",
                 "message": "🎨 Quality AI content (curated picks)",
                 "detected_subject": detected_subject,
@@ -423,7 +438,7 @@ class SafeAlternativesFinder:
         
         # Fall back to curated list if search returns nothing
         if not alternatives:
-            alternatives = self.fallback_entertainment[:max_results]
+            alternatives = list(self.fallback_entertainment[:max_results])
         
         subject_text = f" {detected_subject}" if detected_subject else ""
         format_text = "Shorts" if prefer_shorts else "videos"
@@ -543,15 +558,7 @@ class SafeAlternativesFinder:
     
     def _is_animal_related(self, title: str) -> bool:
         """Check if title seems to be about animals"""
-        animal_keywords = [
-            'animal', 'dog', 'cat', 'bird', 'lion', 'tiger', 'bear',
-            'elephant', 'monkey', 'horse', 'rabbit', 'fish', 'shark',
-            'whale', 'dolphin', 'pet', 'puppy', 'kitten', 'wildlife',
-            'zoo', 'safari', 'nature', 'creature', 'beast', 'wolf',
-            'fox', 'deer', 'snake', 'reptile', 'insect', 'butterfly'
-        ]
-        title_lower = title.lower()
-        return any(keyword in title_lower for keyword in animal_keywords)
+        return self._animal_related_re.search(title.lower()) is not None
     
     def _get_message(self, category_type: str, count: int, animal: str = None) -> str:
         """Get appropriate message for alternatives"""
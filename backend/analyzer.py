@@ -11,12 +11,23 @@ https://developers.google.com/youtube
 
 import re
 import asyncio
+import functools
 import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, TYPE_CHECKING
 from youtube_transcript_api import YouTubeTranscriptApi
 from safety_db import SafetyDatabase
 from youtube_data import YouTubeDataFetcher, analyze_comments
 
+try:
+    import ahocorasick  # Optional: one-pass trigger phrase search
+except ImportError:
+    ahocorasick = None
+
 if TYPE_CHECKING:
     from ai_reviewer import AIContextReviewer
 
@@ -30,6 +41,11 @@ MAX_DESCRIPTION_LENGTH = 2000
 MAX_CHANNEL_LENGTH = 200
 MAX_FULL_TEXT_LENGTH = 3000
 MAX_SIGNATURE_TEXT_LENGTH = 50000
+# Longest gap an unbounded ".*" / ".+" in a danger pattern (the ones run on
+# transcripts) may span. Several chain wildcards ("kid.*(without|no).*seatbelt"),
+# which is polynomial backtracking on transcript-length text if left unbounded.
+# Title/description patterns run on short, truncated text and keep theirs.
+MAX_PATTERN_GAP = 80
 
 # Scoring thresholds
 AI_CONTENT_MAX_SCORE = 20          # Max score when AI content detected
@@ -60,6 +76,264 @@ AI_HASHTAG_WITH_CHANNEL = 1        # Hashtags needed when combined with suspicio
 # Comment fetching
 MAX_COMMENTS_TO_FETCH = 100
 
+# Memo cache sizes (per analyzer). Metadata keys include the transcript
+# (up to MAX_SIGNATURE_TEXT_LENGTH chars), so that cache stays small.
+METADATA_MATCH_CACHE_SIZE = 512
+TITLE_RED_FLAG_CACHE_SIZE = 4096
+SIGNATURE_MATCH_CACHE_SIZE = 256
+TRANSCRIPT_CACHE_SIZE = 256         # Successful transcript fetches, by video ID
+TRANSCRIPT_CACHE_TTL_SECONDS = 3600 # Refetch after this, in case captions changed
+
+# Signature scans run on a small dedicated pool, off the event loop and
+# separate from the default executor that blocking transcript fetches use
+SCAN_EXECUTOR_WORKERS = min(4, os.cpu_count() or 1)
+_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=SCAN_EXECUTOR_WORKERS, thread_name_prefix="signature-scan")
+
+# Characters that make a description pattern a regex rather than a plain phrase
+_REGEX_METACHARS = frozenset(r'.*+?[](){}|\^$')
+
+
+def _bound_wildcards(pattern: str) -> str:
+    """
+    Rewrite ".*" / ".+" as ".{0,N}" / ".{1,N}" (N = MAX_PATTERN_GAP).
+    Escaped dots and dots inside character classes ("[.*]") are literal and
+    left alone.
+    """
+    out = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal member, not the end
+            j = i + 1 + pattern.startswith('^', i + 1)
+            j += pattern.startswith(']', j)
+            out.append(pattern[i:j])
+            i = j
+            continue
+        elif char == '.' and pattern[i + 1:i + 2] in ('*', '+'):
+            out.append(f".{{{0 if pattern[i + 1] == '*' else 1},{MAX_PATTERN_GAP}}}")
+            i += 2
+            continue
+        out.append(char)
+        i += 1
+    return ''.join(out)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_signature_pattern(pattern: str, bound_gaps: bool = False) -> re.Pattern | None:
+    """
+    Compile a signature regex once. bound_gaps caps its wildcards (see
+    MAX_PATTERN_GAP), for danger patterns run on transcripts. Returns None
+    if the pattern is invalid.
+    """
+    try:
+        return re.compile(_bound_wildcards(pattern) if bound_gaps else pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _description_regex(pattern: str) -> str:
+    """Regex source for a description pattern (plain phrases are escaped)."""
+    if not _REGEX_METACHARS.intersection(pattern):
+        return re.escape(pattern)
+    return pattern
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_phrase(pattern: str) -> str | None:
+    """
+    Lowercased pattern if it is a plain ASCII phrase with no regex syntax,
+    else None. On canonicalized (case-folded) text such a pattern matches
+    exactly when it is a substring, so `in` can stand in for re.search.
+    """
+    if pattern.isascii() and not _REGEX_METACHARS.intersection(pattern):
+        return pattern.lower()
+    return None
+
+
+def _compile_description_pattern(pattern: str) -> re.Pattern | None:
+    """Compile a description pattern, escaping it first if it is a plain phrase."""
+    return _compile_signature_pattern(_description_regex(pattern))
+
+
+# A numbered backreference (\1): group numbers shift once patterns are
+# joined, so such a pattern can't share a union with others
+_BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]")
+
+
+def _join_patterns(sources, bound_gaps: bool = False) -> re.Pattern | None:
+    """
+    Compile regex sources as one case-insensitive alternation (wildcards
+    bounded if bound_gaps).
+    Returns None if they can't share one regex: sources that are valid on
+    their own may still clash when joined (inline global flags, repeated
+    group names, backreferences).
+    """
+    if any(_BACKREFERENCE.search(source) for source in sources):
+        return None
+    try:
+        if bound_gaps:
+            sources = [_bound_wildcards(source) for source in sources]
+        return re.compile("|".join(f"(?:{source})" for source in sources), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern_union(patterns: tuple[str, ...], bound_gaps: bool = False) -> re.Pattern | None:
+    """
+    Join a signature's patterns into one alternation so the text is scanned
+    once. Used only as a fast-reject prefilter: on a hit, the individual
+    patterns are still tried in order so the reported match is unchanged.
+
+    The union is compiled directly; the patterns are only compiled one by
+    one (to find and leave out invalid ones) if that fails. Returns None if
+    there is no usable union (no valid pattern, or valid patterns that
+    can't be joined): callers then try the patterns one by one.
+    """
+    if not patterns:
+        return None
+    union = _join_patterns(patterns, bound_gaps)
+    if union is not None:
+        return union
+    valid = []
+    for pattern in patterns:
+        if _compile_signature_pattern(pattern, bound_gaps=bound_gaps) is None:
+            logger.warning(f"Invalid signature regex skipped: {pattern}")
+        else:
+            valid.append(pattern)
+    return _join_patterns(valid, bound_gaps) if valid else None
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_description_union(patterns: tuple[str, ...]) -> re.Pattern | None:
+    """Prefilter for description patterns. Invalid regexes are matched as
+    literals here, mirroring the substring fallback in the matcher."""
+    sources = tuple(_description_regex(p) for p in patterns)
+    if not sources:
+        return None
+    union = _join_patterns(sources)
+    if union is not None:
+        return union
+    return _compile_pattern_union(tuple(
+        source if _compile_signature_pattern(source) is not None else re.escape(pattern)
+        for source, pattern in zip(sources, patterns)
+    ))
+
+
+# Invisible characters used to split keywords ("r\u200bevenge")
+_ZERO_WIDTH_CHARS = {0x200B: None, 0x200C: None, 0x200D: None, 0x2060: None, 0xFEFF: None, 0x00AD: None}
+
+# Cyrillic/Greek letters that render like Latin ones ("r\u0435venge").
+# Lowercase only: text is case-folded before the table is applied.
+_HOMOGLYPHS = {
+    'а': 'a', 'в': 'b', 'е': 'e', 'ё': 'e', 'і': 'i', 'ї': 'i', 'ј': 'j', 'к': 'k',
+    'м': 'm', 'н': 'h', 'о': 'o', 'р': 'p', 'с': 'c', 'ѕ': 's', 'т': 't', 'у': 'y',
+    'х': 'x', 'ԁ': 'd', 'ԛ': 'q', 'ԝ': 'w', 'һ': 'h',
+    'α': 'a', 'ε': 'e', 'ι': 'i', 'κ': 'k', 'ν': 'v', 'ο': 'o', 'ρ': 'p', 'τ': 't',
+    'υ': 'u', 'χ': 'x',
+}
+_CANONICAL_TABLE = {**_ZERO_WIDTH_CHARS, **{ord(k): v for k, v in _HOMOGLYPHS.items()}}
+
+
+def _canonicalize(text: str) -> str:
+    """
+    Case-fold text and undo common keyword-evasion tricks in one pass:
+    NFKC (fullwidth/stylised letters), zero-width characters, and Latin
+    lookalikes. Plain ASCII text needs none of that and is just lowercased.
+    """
+    if text.isascii():
+        return text.lower()
+    return unicodedata.normalize('NFKC', text).casefold().translate(_CANONICAL_TABLE)
+
+
+# Zodiac emoji (♈-♓) — strong signal for occult content in non-Latin titles
+_ZODIAC_EMOJIS = frozenset('♈♉♊♋♌♍♎♏♐♑♒♓')
+
+# Known cross-script survivors: terms that still show up in non-Latin
+# (mostly Cyrillic) titles/descriptions of flagged categories
+_NON_LATIN_STATIC_HINTS = (
+    # Occult/astrology
+    'tarot', 'taro', 'zodiac', 'horoscope', 'astro',
+    'тар', 'зодиак', 'гороскоп', 'астро', 'таро',
+    # Pseudohistory
+    'tartaria', 'тартар', 'hyperborea', 'гиперборе',
+    'mud flood', 'antiquitech',
+    # Spiritual/wellness extremism
+    'pineal', 'пинеал', 'third eye', 'fluoride', 'chemtrail',
+    # Pop-culture subversion / RAC
+    'rac ', 'conan', 'fashwave', 'codreanu',
+    # General extremism
+    'nwo', 'cabal', 'каббал', 'zionist', 'сионист',
+)
+
+# Metadata match reason prefix -> (evidence type, label). The evidence value
+# is the rest of the reason, except for titles, which show the title itself.
+_EVIDENCE_KINDS = (
+    ("Title matches pattern: ", "title", "Title keyword detected"),
+    ("Description matches: ", "description", "Description contains"),
+    ("Description contains: ", "description", "Description contains"),
+    ("Co-occurrence signals: ", "co_occurrence", "Multiple harm signals co-occur"),
+    ("Known problematic channel: ", "channel", "Flagged channel"),
+    ("Known problematic hashtag: ", "hashtag", "Flagged hashtag"),
+)
+
+
+def _evidence_item(reason: str, title: str) -> dict:
+    """Structured evidence item ({type, label, value}) for one match reason."""
+    for prefix, kind, label in _EVIDENCE_KINDS:
+        if reason.startswith(prefix):
+            value = title[:80] if kind == "title" else reason[len(prefix):]
+            return {'type': kind, 'label': label, 'value': value}
+    return {'type': 'other', 'label': 'Signal', 'value': reason}
+
+
+class _ScanCache:
+    """
+    Bounded LRU memo of one analyzer's results, with an optional time to
+    live. Unlike lru_cache around a bound method it doesn't hold the
+    analyzer, so there is no reference cycle. Thread-safe (scans run on
+    worker threads); a call that raises stores nothing.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self._entries = OrderedDict()  # args -> (expiry or None, result)
+        self._lock = threading.Lock()
+
+    def call(self, func, *args):
+        """func(*args), served from the cache while a fresh entry exists."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(args)
+            if entry is not None and (entry[0] is None or entry[0] > now):
+                self._entries.move_to_end(args)
+                self.hits += 1
+                return entry[1]
+        result = func(*args)
+        with self._lock:
+            self._entries[args] = (None if self.ttl is None else now + self.ttl, result)
+            self._entries.move_to_end(args)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Canonical, stripped form of a short name (channel names repeat a lot)."""
+    return _canonicalize(text).strip()
+
 
 class SafetyAnalyzer:
     """
@@ -87,6 +361,180 @@ class SafetyAnalyzer:
         "technology connections", "bigclivedotcom"
     ]
     
+    # Heuristic patterns for impossible/AI content
+    # Animals that appear to talk, have conversations, or do impossible things
+    _impossible_patterns = [
+        # TWO animals having a conversation (dead giveaway for AI)
+        (re.compile(r"\b(two|2|both|pair)\b.{0,20}\b(parrot|bird|cat|dog|animal)s?\b.{0,30}\b(talk|convers|chat|argue|discuss|debate)", re.IGNORECASE),
+         "Two animals having a conversation (AI content)"),
+        (re.compile(r"\b(parrot|bird|cat|dog)s?\b.{0,20}\b(talk|convers|chat|argue)\b.{0,20}\b(each other|together|to one another)", re.IGNORECASE),
+         "Animals conversing with each other (AI content)"),
+        # Parrot/bird specific conversations
+        (re.compile(r"\b(parrot|parakeet|cockatoo|budgie|macaw)s?\b.{0,30}\b(conversation|talking to|chatting with|argues with|debates)", re.IGNORECASE),
+         "Parrots having human-like conversation (likely AI)"),
+        (re.compile(r"\b(parrot|bird)s?\b.{0,15}\b(having a|in a|long|full|real|actual)\b.{0,10}\b(conversation|discussion|debate|argument)", re.IGNORECASE),
+         "Animals having extended conversation (AI content)"),
+        # Generic talking animals - conversation keywords
+        (re.compile(r"\b(parrot|bird|cat|dog|monkey|ape|gorilla|chimp|elephant|lion|tiger|bear|fox|raccoon|squirrel|rabbit|hamster|horse|cow|pig|chicken|duck|goose|owl|crow|raven|fish|shark|whale|dolphin|seal|penguin|frog|turtle|snake|lizard|gecko|iguana|crocodile|alligator)\b.{0,40}\b(talk|talking|speaks|speaking|says|said|conversation|chat|chatting|argue|arguing|debate|interview|podcast|call|phone|answer|respond|tells|told|ask|asking|wants|demanded|yells|screaming|complain|rant|confess|admit|explain|announce|declare|insist|refuse|agree|disagree)\b", re.IGNORECASE),
+         "Animal appearing to communicate like a human"),
+        (re.compile(r"\b(talk|talking|speaks|speaking|says|said|conversation|chat|chatting|argue|arguing|debate|interview|podcast|call|phone|answer|respond|tells|told|ask|asking|wants|demanded|yells|screaming|complain|rant|confess|admit|explain|announce|declare|insist|refuse|agree|disagree)\b.{0,40}\b(parrot|bird|cat|dog|monkey|ape|gorilla|chimp|elephant|lion|tiger|bear|fox|raccoon|squirrel|rabbit|hamster|horse|cow|pig|chicken|duck|goose|owl|crow|raven|fish|shark|whale|dolphin|seal|penguin|frog|turtle|snake|lizard|gecko|iguana|crocodile|alligator)\b", re.IGNORECASE),
+         "Animal appearing to communicate like a human"),
+        # Animals wanting/demanding things (AI trope)
+        (re.compile(r"\b(parrot|bird|cat|dog|monkey|gorilla|raccoon|fox|bear|elephant|lion|tiger)\b.{0,20}\b(wants|needs|demands|orders|requests|insists|refuses|complains)\b.{0,20}\b(fbi|police|911|lawyer|manager|refund|divorce|custody|money|revenge)\b", re.IGNORECASE),
+         "Animal demanding human services (common AI trope)"),
+        # Animals doing impossible human activities
+        (re.compile(r"\b(cat|dog|bird|parrot|monkey|bear|lion|tiger|elephant|gorilla|raccoon|fox|squirrel|rabbit|fish|penguin|owl)\b.{0,30}\b(drive|driving|drove|cook|cooking|cooked|play piano|playing piano|type|typing|typed|text|texting|texted|email|emailing|read|reading|write|writing|wrote|paint|painting|painted|sing|singing|sang|dance|dancing|danced|ballet|opera|graduate|graduating|married|wedding|divorce|court|sue|lawsuit)\b", re.IGNORECASE),
+         "Animal performing impossible human activity"),
+        # Animals with jobs/professions
+        (re.compile(r"\b(cat|dog|bird|parrot|raccoon|monkey|bear)\b.{0,20}\b(lawyer|doctor|chef|pilot|driver|ceo|manager|employee|boss|judge|cop|officer|agent|detective)\b", re.IGNORECASE),
+         "Animal with human profession (likely AI)"),
+        # Impossible animal interactions
+        (re.compile(r"\b(cat|dog|bird|mouse|rabbit|hamster|fish|parrot)\b.{0,30}\b(save|saves|saved|rescue|rescues|rescued|hero|call 911|calls 911|called 911|call police|calls police|ambulance|fire department)\b", re.IGNORECASE),
+         "Animal performing heroic human actions"),
+        # Viral AI tropes
+        (re.compile(r"\b(animal|cat|dog|bird|parrot).{0,20}(facetime|video call|zoom|teams call|skype)\b", re.IGNORECASE),
+         "Animal on video call (common AI trope)"),
+        (re.compile(r"\b(cat|dog|parrot|bird).{0,20}(order|ordering|ordered|uber|doordash|pizza|food delivery|amazon|online shopping)\b", re.IGNORECASE),
+         "Animal ordering services (common AI trope)"),
+        # Animals in legal/dramatic situations
+        (re.compile(r"\b(cat|dog|parrot|bird|raccoon|monkey).{0,30}(court|trial|testif|lawyer|sue|custody|arrested|jail|prison|fbi|cia|police|detective|investigate)\b", re.IGNORECASE),
+         "Animal in legal/dramatic situation (likely AI)"),
+        # Animals with human emotions/drama
+        (re.compile(r"\b(cat|dog|parrot|bird|raccoon).{0,20}(breakup|broke up|cheating|cheated|divorce|married|wedding|pregnant|baby daddy|custody battle)\b", re.IGNORECASE),
+         "Animal in human relationship drama (likely AI)"),
+    ]
+    
+    # All impossible-content patterns as one alternation. Benign titles are the
+    # common case, so a single miss here skips the ordered per-pattern scan.
+    _impossible_any = re.compile(
+        "|".join(f"(?:{p.pattern})" for p, _ in _impossible_patterns), re.IGNORECASE
+    )
+
+    # SAFETY patterns - dangerous animals near children/babies
+    _dangerous_animal_child_patterns = [
+        (re.compile(r"\b(parrot|cockatoo|macaw|cockatiel|conure|african grey|amazon parrot|eclectus|bird)\b.{0,50}\b(baby|infant|newborn|toddler|child|kid|sleeping|nap|crib|bed)\b", re.IGNORECASE),
+         "SAFETY: Large parrot/bird near baby/child - parrots have powerful beaks (300+ PSI) that can cause serious injury"),
+        (re.compile(r"\b(baby|infant|newborn|toddler|child|kid|sleeping)\b.{0,50}\b(parrot|cockatoo|macaw|cockatiel|conure|african grey|bird)\b", re.IGNORECASE),
+         "SAFETY: Baby/child near large bird - birds can bite unpredictably and cause serious injury"),
+        # Anchored to line starts: same result, but linear instead of re-running both lookaheads at every offset
+        (re.compile(r"(?m:^)(?=.*\b(baby|infant|newborn|toddler)\b)(?=.*\b(parrot|cockatoo|macaw|bird)\b)", re.IGNORECASE),
+         "SAFETY: Video shows baby with parrot/bird - large birds have dangerous beaks and can injure infants"),
+        (re.compile(r"\b(pit ?bull|rottweiler|german shepherd|doberman|husky|malamute|akita|chow|mastiff|great dane|wolf ?dog)\b.{0,50}\b(baby|infant|newborn|toddler|sleep|alone|unsupervised)\b", re.IGNORECASE),
+         "SAFETY: Large/powerful dog near unsupervised baby - never leave children unattended with dogs"),
+        (re.compile(r"\b(baby|infant|newborn|toddler)\b.{0,50}\b(pit ?bull|rottweiler|husky|german shepherd|dog)\b.{0,30}\b(sleep|alone|unsupervised)\b", re.IGNORECASE),
+         "SAFETY: Baby sleeping near dog - dogs should never be left unsupervised with infants"),
+        (re.compile(r"(?m:^)(?=.*\b(baby|infant|newborn|toddler)\b)(?=.*\b(pit ?bull|rottweiler|husky|wolf|malamute)\b)", re.IGNORECASE),
+         "SAFETY: Video shows baby with large/powerful dog - dogs should never be left unsupervised with infants"),
+        (re.compile(r"\b(cat|kitten)\b.{0,40}\b(baby|infant|newborn)\b.{0,30}\b(sleep|sleeping|crib|face|breathing)\b", re.IGNORECASE),
+         "SAFETY: Cat near sleeping baby - cats can accidentally suffocate infants"),
+        (re.compile(r"\b(snake|python|boa|constrictor|reptile|monitor lizard|alligator|crocodile|wolf|coyote|fox|raccoon|monkey|chimp|chimpanzee|primate)\b.{0,50}\b(baby|infant|toddler|child|kid|play|hug|cuddle|sleep)\b", re.IGNORECASE),
+         "SAFETY: Wild/exotic animal near child - extremely dangerous, wild animals are unpredictable"),
+        (re.compile(r"\b(baby|infant|toddler|child|kid)\b.{0,50}\b(snake|python|boa|monitor|alligator|crocodile|wolf|coyote|monkey|chimp|primate)\b", re.IGNORECASE),
+         "SAFETY: Child near wild/exotic animal - these animals can cause severe injury or death"),
+        (re.compile(r"\b(baby|infant|newborn|toddler)\b.{0,40}\b(sleep|sleeping|nap)\b.{0,40}\b(with|next to|beside|near)\b.{0,30}\b(pet|animal|dog|cat|bird|parrot)\b", re.IGNORECASE),
+         "SAFETY: Baby sleeping with pet - animals should never be left unsupervised with sleeping infants"),
+    ]
+
+    # Suspicious channel name patterns (channels that typically post AI content),
+    # joined into one regex: only "does any match" matters
+    _suspicious_channel_any = re.compile("|".join([
+        r"talk\s*(with|to|ing)?\s*(rico|pet|animal|bird|parrot|cat|dog)",
+        r"(pet|animal|bird|parrot|cat|dog)\s*talk",
+        r"(funny|cute)\s*(pet|animal|bird|parrot|cat|dog)\s*video",
+        r"ai\s*(pet|animal|content|video|generated)",
+    ]), re.IGNORECASE)
+
+    # Hashtags that suggest AI-generated animal content. Plain substrings of
+    # the lowercased text, so no regex is needed.
+    _AI_HASHTAGS = (
+        "#talkingbird", "#talkingparrot", "#talkingcat", "#talkingdog",
+        "#talkinganimal", "#funnybirds", "#funnypetvideos", "#parrottalking",
+        "#birdtalking", "#cattalking", "#dogtalking", "#aianimals",
+        "#aigenerated", "#aiart", "#aivideo",
+    )
+
+    # Video tags that mark AI animal content
+    _SUSPICIOUS_TAGS = (
+        "talking parrot", "talking bird", "talking cat", "talking dog",
+        "ai generated", "ai video", "funny animals talking",
+    )
+
+    _dangerous_animal_child_any = re.compile(
+        "|".join(f"(?:{p.pattern})" for p, _ in _dangerous_animal_child_patterns), re.IGNORECASE
+    )
+
+    # Title/description red flag patterns — catch dangerous content even without transcript
+    # These detect misinformation, dangerous advice, and harmful content from metadata alone.
+    # Compiled once at import and shared by every analyzer.
+    _title_red_flag_patterns = [
+        # Medical misinformation
+        (re.compile(r"\b(cur(e|ed|es|ing)|heal(s|ed|ing)?|treat(s|ed|ing)?|fix(es|ed|ing)?|revers(e|ed|es|ing)|eliminat(e|ed|es|ing)|destroy(s|ed|ing)?)\b.{0,40}\b(cancer|tumor|diabetes|alzheimer|parkinson|autism|hiv|aids|herpes|lupus|ms|multiple sclerosis|depression|anxiety|adhd|ptsd|epilepsy|arthritis|asthma)\b", re.IGNORECASE),
+         ("medical", "high", "Claims to cure/treat serious medical conditions — may be dangerous misinformation")),
+        (re.compile(r"\b(doctors?|big pharma|hospital|they|government|fda|cdc)\b.{0,30}\b(don'?t want|hiding|won'?t tell|secret|lying|cover.?up|suppress|conceal|conspir)", re.IGNORECASE),
+         ("medical", "high", "Uses conspiracy framing against medical establishment — potential medical misinformation")),
+        (re.compile(r"\b(stop|quit|ditch|throw away|don'?t take|never take|avoid)\b.{0,20}\b(chemo|medication|medicine|pills?|insulin|vaccine|antibiotics|prescri)", re.IGNORECASE),
+         ("medical", "high", "Advises stopping medical treatment — dangerous medical misinformation")),
+        (re.compile(r"\b(miracle|secret|ancient|natural|home)\b.{0,20}\b(cure|remedy|treatment|healing|medicine|solution)\b", re.IGNORECASE),
+         ("medical", "medium", "Promotes unverified 'miracle' or 'secret' cure — verify with healthcare provider")),
+        (re.compile(r"\b(ivermectin|hydroxychloroquine|mms|turpentine|borax|colloidal silver|black salve|apricot seeds|laetrile)\b.{0,30}\b(cure|treat|heal|cancer|covid|virus)", re.IGNORECASE),
+         ("medical", "high", "Promotes debunked/dangerous substance as medical treatment")),
+
+        # Chemical dangers
+        (re.compile(r"\b(mix|combine|blend|add)\b.{0,20}\b(bleach|ammonia|chlorine|acid|hydrogen peroxide|vinegar)\b.{0,20}\b(and|with|plus|\+)\b.{0,20}\b(bleach|ammonia|chlorine|acid|hydrogen peroxide|vinegar)\b", re.IGNORECASE),
+         ("chemical", "high", "Mixing household chemicals can create toxic/lethal gases")),
+        (re.compile(r"\b(bleach|ammonia)\b.{0,40}\b(ammonia|bleach)\b", re.IGNORECASE),
+         ("chemical", "high", "Bleach and ammonia together create deadly chloramine gas")),
+        (re.compile(r"\b(drink|ingest|consume|swallow|eat)\b.{0,20}\b(bleach|ammonia|hydrogen peroxide|borax|turpentine|gasoline|kerosene|antifreeze|tide pod|detergent|cleaning)", re.IGNORECASE),
+         ("chemical", "high", "Ingesting household chemicals is potentially fatal")),
+
+        # Dangerous DIY / fire hazards
+        (re.compile(r"\b(make|build|diy|homemade)\b.{0,20}\b(bomb|explosive|grenade|gun|taser|flame ?thrower|weapon|napalm|thermite|firework|rocket fuel)\b", re.IGNORECASE),
+         ("diy", "high", "DIY weapons/explosives — extremely dangerous and potentially illegal")),
+        (re.compile(r"\b(microwave|oven|toaster)\b.{0,30}\b(metal|aluminum|foil|battery|aerosol|lighter|spray can|phone)\b", re.IGNORECASE),
+         ("diy", "high", "Microwaving metal/batteries/aerosol is an explosion/fire hazard")),
+        (re.compile(r"\b(penny|coin)\b.{0,15}\b(in|into)\b.{0,10}\b(outlet|socket|fuse|electrical)\b", re.IGNORECASE),
+         ("electrical", "high", "Inserting objects into outlets can cause electrocution/fire")),
+
+        # Dangerous fitness / body modification
+        (re.compile(r"\b(inject|injecting|injection)\b.{0,20}\b(synthol|oil|silicone|saline)\b.{0,20}\b(muscle|arm|bicep|chest|calf)\b", re.IGNORECASE),
+         ("fitness", "high", "Injecting substances into muscles is extremely dangerous — risk of embolism, infection, death")),
+        (re.compile(r"\b(dry|water)\b.{0,5}\bfast(ing)?\b.{0,20}\b(\d{2,}|week|month|30|40|21)\b", re.IGNORECASE),
+         ("medical", "high", "Extended fasting without supervision can cause organ failure and death")),
+
+        # Electrical dangers
+        (re.compile(r"\b(hack|bypass|jump|short|bridge|hot ?wire)\b.{0,20}\b(electric(al)?|power|meter|breaker|fuse|circuit|panel|wire|outlet|plug)\b", re.IGNORECASE),
+         ("electrical", "high", "Tampering with electrical systems without qualification risks electrocution/fire")),
+        
+        # Child safety / predatory content
+        (re.compile(r"\b(kids?|children|child|minor|teen|underage)\b.{0,30}\b(challenge|dare|prank|trick)\b.{0,30}\b(dangerous|deadly|extreme|painful|hurt|fire|bleach|tide)", re.IGNORECASE),
+         ("childcare", "high", "Dangerous 'challenge' targeting minors — potential harm to children")),
+
+        # Dangerous driving (handles both word orders: "racing on highway" AND "street racing")
+        (re.compile(r"\b(speed(ing)?|race|racing|drift(ing)?|stunt(s|ing)?)\b.{0,20}\b(public|highway|road|street|traffic|residential|school zone)\b", re.IGNORECASE),
+         ("driving_dmv", "medium", "Dangerous driving on public roads — risk to self and others")),
+        (re.compile(r"\b(street|highway|public|road|residential|school zone)\b.{0,20}\b(race|racing|drift(ing)?|stunt(ing)?|speed(ing)?)\b", re.IGNORECASE),
+         ("driving_dmv", "medium", "Dangerous driving on public roads — risk to self and others")),
+        (re.compile(r"\b(drunk|intoxicated|buzzed|high)\b.{0,15}\b(driv(e|ing)|behind the wheel)\b", re.IGNORECASE),
+         ("driving_dmv", "high", "Impaired driving — illegal and extremely dangerous")),
+        
+        # Cooking dangers
+        (re.compile(r"\b(raw|uncooked)\b.{0,15}\b(chicken|pork|meat|egg|fish|shellfish|shrimp)\b.{0,20}\b(safe|fine|ok|healthy|delicious|eat|sashimi)\b", re.IGNORECASE),
+         ("cooking", "medium", "Raw/undercooked meat can contain harmful bacteria — verify food safety")),
+        (re.compile(r"\b(deep fry|frying)\b.{0,20}\b(frozen|ice|water|wet)\b", re.IGNORECASE),
+         ("cooking", "high", "Adding water/ice to hot oil causes explosive splattering and severe burns")),
+        
+        # Financial scams
+        (re.compile(r"\b(guaranteed|100%|proven|risk.?free)\b.{0,20}\b(profit|returns?|income|money|rich|wealth|millionaire)\b", re.IGNORECASE),
+         ("financial", "medium", "Promises guaranteed financial returns — likely a scam or misleading")),
+        (re.compile(r"\b(send|give|transfer|deposit)\b.{0,20}\b(bitcoin|crypto|btc|eth|money)\b.{0,30}\b(double|triple|multiply|10x|100x|guaranteed)\b", re.IGNORECASE),
+         ("financial", "high", "Crypto multiplication scheme — this is a scam")),
+    ]
+
+    # Benign titles are the common case: one miss skips the ordered scan
+    _title_red_flag_any = re.compile(
+        "|".join(f"(?:{p.pattern})" for p, _ in _title_red_flag_patterns), re.IGNORECASE
+    )
+    
     def __init__(self, safety_db: SafetyDatabase, youtube_api_key: Optional[str] = None, ai_reviewer: Optional['AIContextReviewer'] = None):
         """Initialize with safety signature database, optional YouTube API key, and optional AI reviewer."""
         self.safety_db = safety_db
@@ -96,165 +544,139 @@ class SafetyAnalyzer:
         # AI context reviewer for verifying metadata signature matches
         self.ai_reviewer = ai_reviewer
         
-        # Suspicious channel name patterns (channels that typically post AI content)
-        self._suspicious_channel_patterns = [
-            re.compile(r"talk\s*(with|to|ing)?\s*(rico|pet|animal|bird|parrot|cat|dog)", re.IGNORECASE),
-            re.compile(r"(pet|animal|bird|parrot|cat|dog)\s*talk", re.IGNORECASE),
-            re.compile(r"(funny|cute)\s*(pet|animal|bird|parrot|cat|dog)\s*video", re.IGNORECASE),
-            re.compile(r"ai\s*(pet|animal|content|video|generated)", re.IGNORECASE),
-        ]
+        self._precompile_signatures()
 
-        # Hashtag patterns that suggest AI-generated animal content
-        self._ai_hashtag_patterns = [
-            re.compile(r"#talkingbird", re.IGNORECASE),
-            re.compile(r"#talkingparrot", re.IGNORECASE),
-            re.compile(r"#talkingcat", re.IGNORECASE),
-            re.compile(r"#talkingdog", re.IGNORECASE),
-            re.compile(r"#talkinganimal", re.IGNORECASE),
-            re.compile(r"#funnybirds", re.IGNORECASE),
-            re.compile(r"#funnypetvideos", re.IGNORECASE),
-            re.compile(r"#parrottalking", re.IGNORECASE),
-            re.compile(r"#birdtalking", re.IGNORECASE),
-            re.compile(r"#cattalking", re.IGNORECASE),
-            re.compile(r"#dogtalking", re.IGNORECASE),
-            re.compile(r"#aianimals", re.IGNORECASE),
-            re.compile(r"#aigenerated", re.IGNORECASE),
-            re.compile(r"#aiart", re.IGNORECASE),
-            re.compile(r"#aivideo", re.IGNORECASE),
-        ]
-        
-        # Heuristic patterns for impossible/AI content
-        # Animals that appear to talk, have conversations, or do impossible things
-        self._impossible_patterns = [
-            # TWO animals having a conversation (dead giveaway for AI)
-            (re.compile(r"\b(two|2|both|pair)\b.{0,20}\b(parrot|bird|cat|dog|animal)s?\b.{0,30}\b(talk|convers|chat|argue|discuss|debate)", re.IGNORECASE),
-             "Two animals having a conversation (AI content)"),
-            (re.compile(r"\b(parrot|bird|cat|dog)s?\b.{0,20}\b(talk|convers|chat|argue)\b.{0,20}\b(each other|together|to one another)", re.IGNORECASE),
-             "Animals conversing with each other (AI content)"),
-            # Parrot/bird specific conversations
-            (re.compile(r"\b(parrot|parakeet|cockatoo|budgie|macaw)s?\b.{0,30}\b(conversation|talking to|chatting with|argues with|debates)", re.IGNORECASE),
-             "Parrots having human-like conversation (likely AI)"),
-            (re.compile(r"\b(parrot|bird)s?\b.{0,15}\b(having a|in a|long|full|real|actual)\b.{0,10}\b(conversation|discussion|debate|argument)", re.IGNORECASE),
-             "Animals having extended conversation (AI content)"),
-            # Generic talking animals - conversation keywords
-            (re.compile(r"\b(parrot|bird|cat|dog|monkey|ape|gorilla|chimp|elephant|lion|tiger|bear|fox|raccoon|squirrel|rabbit|hamster|horse|cow|pig|chicken|duck|goose|owl|crow|raven|fish|shark|whale|dolphin|seal|penguin|frog|turtle|snake|lizard|gecko|iguana|crocodile|alligator)\b.{0,40}\b(talk|talking|speaks|speaking|says|said|conversation|chat|chatting|argue|arguing|debate|interview|podcast|call|phone|answer|respond|tells|told|ask|asking|wants|demanded|yells|screaming|complain|rant|confess|admit|explain|announce|declare|insist|refuse|agree|disagree)\b", re.IGNORECASE),
-             "Animal appearing to communicate like a human"),
-            (re.compile(r"\b(talk|talking|speaks|speaking|says|said|conversation|chat|chatting|argue|arguing|debate|interview|podcast|call|phone|answer|respond|tells|told|ask|asking|wants|demanded|yells|screaming|complain|rant|confess|admit|explain|announce|declare|insist|refuse|agree|disagree)\b.{0,40}\b(parrot|bird|cat|dog|monkey|ape|gorilla|chimp|elephant|lion|tiger|bear|fox|raccoon|squirrel|rabbit|hamster|horse|cow|pig|chicken|duck|goose|owl|crow|raven|fish|shark|whale|dolphin|seal|penguin|frog|turtle|snake|lizard|gecko|iguana|crocodile|alligator)\b", re.IGNORECASE),
-             "Animal appearing to communicate like a human"),
-            # Animals wanting/demanding things (AI trope)
-            (re.compile(r"\b(parrot|bird|cat|dog|monkey|gorilla|raccoon|fox|bear|elephant|lion|tiger)\b.{0,20}\b(wants|needs|demands|orders|requests|insists|refuses|complains)\b.{0,20}\b(fbi|police|911|lawyer|manager|refund|divorce|custody|money|revenge)\b", re.IGNORECASE),
-             "Animal demanding human services (common AI trope)"),
-            # Animals doing impossible human activities
-            (re.compile(r"\b(cat|dog|bird|parrot|monkey|bear|lion|tiger|elephant|gorilla|raccoon|fox|squirrel|rabbit|fish|penguin|owl)\b.{0,30}\b(drive|driving|drove|cook|cooking|cooked|play piano|playing piano|type|typing|typed|text|texting|texted|email|emailing|read|reading|write|writing|wrote|paint|painting|painted|sing|singing|sang|dance|dancing|danced|ballet|opera|graduate|graduating|married|wedding|divorce|court|sue|lawsuit)\b", re.IGNORECASE),
-             "Animal performing impossible human activity"),
-            # Animals with jobs/professions
-            (re.compile(r"\b(cat|dog|bird|parrot|raccoon|monkey|bear)\b.{0,20}\b(lawyer|doctor|chef|pilot|driver|ceo|manager|employee|boss|judge|cop|officer|agent|detective)\b", re.IGNORECASE),
-             "Animal with human profession (likely AI)"),
-            # Impossible animal interactions
-            (re.compile(r"\b(cat|dog|bird|mouse|rabbit|hamster|fish|parrot)\b.{0,30}\b(save|saves|saved|rescue|rescues|rescued|hero|call 911|calls 911|called 911|call police|calls police|ambulance|fire department)\b", re.IGNORECASE),
-             "Animal performing heroic human actions"),
-            # Viral AI tropes
-            (re.compile(r"\b(animal|cat|dog|bird|parrot).{0,20}(facetime|video call|zoom|teams call|skype)\b", re.IGNORECASE),
-             "Animal on video call (common AI trope)"),
-            (re.compile(r"\b(cat|dog|parrot|bird).{0,20}(order|ordering|ordered|uber|doordash|pizza|food delivery|amazon|online shopping)\b", re.IGNORECASE),
-             "Animal ordering services (common AI trope)"),
-            # Animals in legal/dramatic situations
-            (re.compile(r"\b(cat|dog|parrot|bird|raccoon|monkey).{0,30}(court|trial|testif|lawyer|sue|custody|arrested|jail|prison|fbi|cia|police|detective|investigate)\b", re.IGNORECASE),
-             "Animal in legal/dramatic situation (likely AI)"),
-            # Animals with human emotions/drama
-            (re.compile(r"\b(cat|dog|parrot|bird|raccoon).{0,20}(breakup|broke up|cheating|cheated|divorce|married|wedding|pregnant|baby daddy|custody battle)\b", re.IGNORECASE),
-             "Animal in human relationship drama (likely AI)"),
-        ]
-        
-        # SAFETY patterns - dangerous animals near children/babies
-        self._dangerous_animal_child_patterns = [
-            (re.compile(r"\b(parrot|cockatoo|macaw|cockatiel|conure|african grey|amazon parrot|eclectus|bird)\b.{0,50}\b(baby|infant|newborn|toddler|child|kid|sleeping|nap|crib|bed)\b", re.IGNORECASE),
-             "SAFETY: Large parrot/bird near baby/child - parrots have powerful beaks (300+ PSI) that can cause serious injury"),
-            (re.compile(r"\b(baby|infant|newborn|toddler|child|kid|sleeping)\b.{0,50}\b(parrot|cockatoo|macaw|cockatiel|conure|african grey|bird)\b", re.IGNORECASE),
-             "SAFETY: Baby/child near large bird - birds can bite unpredictably and cause serious injury"),
-            (re.compile(r"(?=.*\b(baby|infant|newborn|toddler)\b)(?=.*\b(parrot|cockatoo|macaw|bird)\b)", re.IGNORECASE),
-             "SAFETY: Video shows baby with parrot/bird - large birds have dangerous beaks and can injure infants"),
-            (re.compile(r"\b(pit ?bull|rottweiler|german shepherd|doberman|husky|malamute|akita|chow|mastiff|great dane|wolf ?dog)\b.{0,50}\b(baby|infant|newborn|toddler|sleep|alone|unsupervised)\b", re.IGNORECASE),
-             "SAFETY: Large/powerful dog near unsupervised baby - never leave children unattended with dogs"),
-            (re.compile(r"\b(baby|infant|newborn|toddler)\b.{0,50}\b(pit ?bull|rottweiler|husky|german shepherd|dog)\b.{0,30}\b(sleep|alone|unsupervised)\b", re.IGNORECASE),
-             "SAFETY: Baby sleeping near dog - dogs should never be left unsupervised with infants"),
-            (re.compile(r"(?=.*\b(baby|infant|newborn|toddler)\b)(?=.*\b(pit ?bull|rottweiler|husky|wolf|malamute)\b)", re.IGNORECASE),
-             "SAFETY: Video shows baby with large/powerful dog - dogs should never be left unsupervised with infants"),
-            (re.compile(r"\b(cat|kitten)\b.{0,40}\b(baby|infant|newborn)\b.{0,30}\b(sleep|sleeping|crib|face|breathing)\b", re.IGNORECASE),
-             "SAFETY: Cat near sleeping baby - cats can accidentally suffocate infants"),
-            (re.compile(r"\b(snake|python|boa|constrictor|reptile|monitor lizard|alligator|crocodile|wolf|coyote|fox|raccoon|monkey|chimp|chimpanzee|primate)\b.{0,50}\b(baby|infant|toddler|child|kid|play|hug|cuddle|sleep)\b", re.IGNORECASE),
-             "SAFETY: Wild/exotic animal near child - extremely dangerous, wild animals are unpredictable"),
-            (re.compile(r"\b(baby|infant|toddler|child|kid)\b.{0,50}\b(snake|python|boa|monitor|alligator|crocodile|wolf|coyote|monkey|chimp|primate)\b", re.IGNORECASE),
-             "SAFETY: Child near wild/exotic animal - these animals can cause severe injury or death"),
-            (re.compile(r"\b(baby|infant|newborn|toddler)\b.{0,40}\b(sleep|sleeping|nap)\b.{0,40}\b(with|next to|beside|near)\b.{0,30}\b(pet|animal|dog|cat|bird|parrot)\b", re.IGNORECASE),
-             "SAFETY: Baby sleeping with pet - animals should never be left unsupervised with sleeping infants"),
-        ]
+        # Memoized pure matchers: titles/descriptions repeat a lot within a
+        # channel. Cached values are tuples; callers get fresh copies.
+        self._title_red_flag_cache = _ScanCache(TITLE_RED_FLAG_CACHE_SIZE)
+        self._metadata_match_cache = _ScanCache(METADATA_MATCH_CACHE_SIZE)
+        self._signature_match_cache = _ScanCache(SIGNATURE_MATCH_CACHE_SIZE)
+        # Re-analyses of the same video skip the transcript download for an
+        # hour. Failures raise, so they are never stored and are retried.
+        self._transcript_cache = _ScanCache(TRANSCRIPT_CACHE_SIZE, ttl=TRANSCRIPT_CACHE_TTL_SECONDS)
 
-        # Title/description red flag patterns — catch dangerous content even without transcript
-        # These detect misinformation, dangerous advice, and harmful content from metadata alone
-        self._title_red_flag_patterns = [
-            # Medical misinformation
-            (re.compile(r"\b(cur(e|ed|es|ing)|heal(s|ed|ing)?|treat(s|ed|ing)?|fix(es|ed|ing)?|revers(e|ed|es|ing)|eliminat(e|ed|es|ing)|destroy(s|ed|ing)?)\b.{0,40}\b(cancer|tumor|diabetes|alzheimer|parkinson|autism|hiv|aids|herpes|lupus|ms|multiple sclerosis|depression|anxiety|adhd|ptsd|epilepsy|arthritis|asthma)\b", re.IGNORECASE),
-             ("medical", "high", "Claims to cure/treat serious medical conditions — may be dangerous misinformation")),
-            (re.compile(r"\b(doctors?|big pharma|hospital|they|government|fda|cdc)\b.{0,30}\b(don'?t want|hiding|won'?t tell|secret|lying|cover.?up|suppress|conceal|conspir)", re.IGNORECASE),
-             ("medical", "high", "Uses conspiracy framing against medical establishment — potential medical misinformation")),
-            (re.compile(r"\b(stop|quit|ditch|throw away|don'?t take|never take|avoid)\b.{0,20}\b(chemo|medication|medicine|pills?|insulin|vaccine|antibiotics|prescri)", re.IGNORECASE),
-             ("medical", "high", "Advises stopping medical treatment — dangerous medical misinformation")),
-            (re.compile(r"\b(miracle|secret|ancient|natural|home)\b.{0,20}\b(cure|remedy|treatment|healing|medicine|solution)\b", re.IGNORECASE),
-             ("medical", "medium", "Promotes unverified 'miracle' or 'secret' cure — verify with healthcare provider")),
-            (re.compile(r"\b(ivermectin|hydroxychloroquine|mms|turpentine|borax|colloidal silver|black salve|apricot seeds|laetrile)\b.{0,30}\b(cure|treat|heal|cancer|covid|virus)", re.IGNORECASE),
-             ("medical", "high", "Promotes debunked/dangerous substance as medical treatment")),
-
-            # Chemical dangers
-            (re.compile(r"\b(mix|combine|blend|add)\b.{0,20}\b(bleach|ammonia|chlorine|acid|hydrogen peroxide|vinegar)\b.{0,20}\b(and|with|plus|\+)\b.{0,20}\b(bleach|ammonia|chlorine|acid|hydrogen peroxide|vinegar)\b", re.IGNORECASE),
-             ("chemical", "high", "Mixing household chemicals can create toxic/lethal gases")),
-            (re.compile(r"\b(bleach|ammonia)\b.{0,40}\b(ammonia|bleach)\b", re.IGNORECASE),
-             ("chemical", "high", "Bleach and ammonia together create deadly chloramine gas")),
-            (re.compile(r"\b(drink|ingest|consume|swallow|eat)\b.{0,20}\b(bleach|ammonia|hydrogen peroxide|borax|turpentine|gasoline|kerosene|antifreeze|tide pod|detergent|cleaning)", re.IGNORECASE),
-             ("chemical", "high", "Ingesting household chemicals is potentially fatal")),
-
-            # Dangerous DIY / fire hazards
-            (re.compile(r"\b(make|build|diy|homemade)\b.{0,20}\b(bomb|explosive|grenade|gun|taser|flame ?thrower|weapon|napalm|thermite|firework|rocket fuel)\b", re.IGNORECASE),
-             ("diy", "high", "DIY weapons/explosives — extremely dangerous and potentially illegal")),
-            (re.compile(r"\b(microwave|oven|toaster)\b.{0,30}\b(metal|aluminum|foil|battery|aerosol|lighter|spray can|phone)\b", re.IGNORECASE),
-             ("diy", "high", "Microwaving metal/batteries/aerosol is an explosion/fire hazard")),
-            (re.compile(r"\b(penny|coin)\b.{0,15}\b(in|into)\b.{0,10}\b(outlet|socket|fuse|electrical)\b", re.IGNORECASE),
-             ("electrical", "high", "Inserting objects into outlets can cause electrocution/fire")),
-
-            # Dangerous fitness / body modification
-            (re.compile(r"\b(inject|injecting|injection)\b.{0,20}\b(synthol|oil|silicone|saline)\b.{0,20}\b(muscle|arm|bicep|chest|calf)\b", re.IGNORECASE),
-             ("fitness", "high", "Injecting substances into muscles is extremely dangerous — risk of embolism, infection, death")),
-            (re.compile(r"\b(dry|water)\b.{0,5}\bfast(ing)?\b.{0,20}\b(\d{2,}|week|month|30|40|21)\b", re.IGNORECASE),
-             ("medical", "high", "Extended fasting without supervision can cause organ failure and death")),
-
-            # Electrical dangers
-            (re.compile(r"\b(hack|bypass|jump|short|bridge|hot ?wire)\b.{0,20}\b(electric(al)?|power|meter|breaker|fuse|circuit|panel|wire|outlet|plug)\b", re.IGNORECASE),
-             ("electrical", "high", "Tampering with electrical systems without qualification risks electrocution/fire")),
-            
-            # Child safety / predatory content
-            (re.compile(r"\b(kids?|children|child|minor|teen|underage)\b.{0,30}\b(challenge|dare|prank|trick)\b.{0,30}\b(dangerous|deadly|extreme|painful|hurt|fire|bleach|tide)", re.IGNORECASE),
-             ("childcare", "high", "Dangerous 'challenge' targeting minors — potential harm to children")),
-
-            # Dangerous driving (handles both word orders: "racing on highway" AND "street racing")
-            (re.compile(r"\b(speed(ing)?|race|racing|drift(ing)?|stunt(s|ing)?)\b.{0,20}\b(public|highway|road|street|traffic|residential|school zone)\b", re.IGNORECASE),
-             ("driving_dmv", "medium", "Dangerous driving on public roads — risk to self and others")),
-            (re.compile(r"\b(street|highway|public|road|residential|school zone)\b.{0,20}\b(race|racing|drift(ing)?|stunt(ing)?|speed(ing)?)\b", re.IGNORECASE),
-             ("driving_dmv", "medium", "Dangerous driving on public roads — risk to self and others")),
-            (re.compile(r"\b(drunk|intoxicated|buzzed|high)\b.{0,15}\b(driv(e|ing)|behind the wheel)\b", re.IGNORECASE),
-             ("driving_dmv", "high", "Impaired driving — illegal and extremely dangerous")),
-            
-            # Cooking dangers
-            (re.compile(r"\b(raw|uncooked)\b.{0,15}\b(chicken|pork|meat|egg|fish|shellfish|shrimp)\b.{0,20}\b(safe|fine|ok|healthy|delicious|eat|sashimi)\b", re.IGNORECASE),
-             ("cooking", "medium", "Raw/undercooked meat can contain harmful bacteria — verify food safety")),
-            (re.compile(r"\b(deep fry|frying)\b.{0,20}\b(frozen|ice|water|wet)\b", re.IGNORECASE),
-             ("cooking", "high", "Adding water/ice to hot oil causes explosive splattering and severe burns")),
-            
-            # Financial scams
-            (re.compile(r"\b(guaranteed|100%|proven|risk.?free)\b.{0,20}\b(profit|returns?|income|money|rich|wealth|millionaire)\b", re.IGNORECASE),
-             ("financial", "medium", "Promises guaranteed financial returns — likely a scam or misleading")),
-            (re.compile(r"\b(send|give|transfer|deposit)\b.{0,20}\b(bitcoin|crypto|btc|eth|money)\b.{0,30}\b(double|triple|multiply|10x|100x|guaranteed)\b", re.IGNORECASE),
-             ("financial", "high", "Crypto multiplication scheme — this is a scam")),
-        ]
+    def _precompile_signatures(self) -> None:
+        """
+        Compile every signature's prefilter union up front so matching never
+        pays the compile cost per call. Individual patterns are compiled (and
+        cached) the first time their union matches, so startup compiles each
+        regex once rather than twice. Signatures added to the database later
+        are compiled the first time they are matched.
+        """
+        for signature in self.signatures:
+            if 'danger_signatures' in signature:
+                _compile_pattern_union(self._danger_patterns(signature), bound_gaps=True)
+            if signature.get('is_regex', False):
+                for trigger in signature.get('triggers', []):
+                    _compile_signature_pattern(trigger, bound_gaps=True)
+            _compile_pattern_union(tuple(signature.get('title_patterns', [])))
+            _compile_description_union(tuple(signature.get('description_patterns', [])))
+        self._build_signature_index()
+
+    def _build_signature_index(self) -> None:
+        """
+        Index every fixed phrase the matchers look for — trigger/exclusion
+        phrases of 'triggers'-format signatures, co-occurrence terms,
+        hashtags and non-Latin hints of metadata-format signatures — in one
+        Aho-Corasick automaton, so a single pass over the text finds all of them.
+        Without pyahocorasick plain substring checks are used instead.
+
+        Also maps each metadata signature's known-bad channel names by
+        canonical form, so channel checks are one dict lookup.
+        """
+        # Built into locals and published at the end, so scans running on
+        # other threads never see a half-built index
+        signatures = list(self.signatures)
+        cooccurrence_groups = {}
+        # Per metadata signature: every co-occurrence term, as a frozenset
+        # so a text with none of them skips the group scan entirely
+        cooccurrence_terms = {}
+        known_bad_channels = {}
+        non_latin_hints = {}
+
+        phrases = []
+        for signature in signatures:
+            if 'title_patterns' in signature or 'description_patterns' in signature:
+                # Term groups (genre_terms+harm_terms, wrapper_terms+payload_terms, etc.)
+                # as (term, lowercased term) pairs, prepared once
+                groups = tuple(
+                    (key, tuple((term, term.lower()) for term in value))
+                    for key, value in signature.get('co_occurrence_signals', {}).items()
+                    if isinstance(value, list) and key != 'evasion_tactics'
+                )
+                terms = frozenset(lower for _, pairs in groups for _, lower in pairs)
+                cooccurrence_groups[id(signature)] = groups
+                cooccurrence_terms[id(signature)] = terms
+                known_bad = {}
+                for bad_channel in signature.get('channel_signals', {}).get('known_bad_channels', []):
+                    known_bad.setdefault(_normalize_text(bad_channel), bad_channel)
+                known_bad_channels[id(signature)] = known_bad
+                # Non-Latin hints: static survivors plus distinctive (≥ 5 char)
+                # terms from every co-occurrence list of the signature
+                hints = frozenset(_NON_LATIN_STATIC_HINTS).union(
+                    t
+                    for value in signature.get('co_occurrence_signals', {}).values()
+                    if isinstance(value, list)
+                    for t in (term.lower().strip() for term in value)
+                    if len(t) >= 5 and t != 'note'
+                )
+                non_latin_hints[id(signature)] = hints
+                phrases.extend(terms)
+                phrases.extend(hints)
+                phrases.extend(signature.get('channel_signals', {}).get('known_bad_hashtags', []))
+                continue
+            if 'danger_signatures' in signature:
+                continue
+            phrases.extend(signature.get('exclusions', []))
+            if not signature.get('is_regex', False):
+                phrases.extend(signature.get('triggers', []))
+
+        phrase_automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for phrase in phrases:
+                phrase = phrase.lower()
+                if phrase:
+                    automaton.add_word(phrase, phrase)
+            if len(automaton):
+                automaton.make_automaton()
+                phrase_automaton = automaton
+
+        self._cooccurrence_groups = cooccurrence_groups
+        self._cooccurrence_terms = cooccurrence_terms
+        self._known_bad_channels = known_bad_channels
+        self._non_latin_hints = non_latin_hints
+        self._phrase_automaton = phrase_automaton
+        self._indexed_signature_count = len(signatures)
+
+    def _signature_automaton(self):
+        """The phrase automaton (None without pyahocorasick), rebuilt first
+        if signatures were added to the database since the last build."""
+        if self._indexed_signature_count != len(self.signatures):
+            self._build_signature_index()
+        return self._phrase_automaton
+
+    def _phrase_hits(self, text: str) -> list[tuple[int, str]] | None:
+        """(end index, phrase) for every indexed phrase occurrence in text,
+        or None if there is no automaton."""
+        automaton = self._signature_automaton()
+        if automaton is None:
+            return None
+        return list(automaton.iter(text))
+
+    def _phrases_in(self, text: str) -> set[str] | None:
+        """All indexed phrases occurring in text, or None if there is no automaton."""
+        hits = self._phrase_hits(text)
+        if hits is None:
+            return None
+        return {phrase for _, phrase in hits}
+
+    @staticmethod
+    def _danger_patterns(signature: dict) -> tuple[str, ...]:
+        """Non-empty regex patterns of a 'danger_signatures' style signature."""
+        return tuple(
+            ds['pattern'] for ds in signature.get('danger_signatures', []) if ds.get('pattern')
+        )
         
     def _detect_impossible_content(self, title: str, description: str = "", channel: str = "", tags: list[str] | None = None) -> str | None:
         """
@@ -274,35 +696,28 @@ class SafetyAnalyzer:
         channel_lower = channel.lower() if channel else ""
         
         # Check title patterns
-        for pattern, reason in self._impossible_patterns:
-            if pattern.search(full_text):
-                return reason
+        if self._impossible_any.search(full_text):
+            for pattern, reason in self._impossible_patterns:
+                if pattern.search(full_text):
+                    return reason
         
         # Check for suspicious hashtags (high confidence for AI content)
-        hashtag_count = 0
-        matched_hashtags = []
-        for hashtag_pattern in self._ai_hashtag_patterns:
-            if hashtag_pattern.search(full_text):
-                hashtag_count += 1
-                matched_hashtags.append(hashtag_pattern.pattern.replace("#", "").replace("\\", ""))
+        matched_hashtags = [h[1:] for h in self._AI_HASHTAGS if h in full_text]
+        hashtag_count = len(matched_hashtags)
         
         # 2+ AI-related hashtags = very likely AI
         if hashtag_count >= AI_HASHTAG_THRESHOLD:
             return f"Multiple AI-associated hashtags detected: {', '.join(matched_hashtags[:3])}"
 
         # Check channel name patterns
-        for pattern in self._suspicious_channel_patterns:
-            if pattern.search(channel_lower):
-                # Channel name alone isn't enough, but combined with 1 hashtag = flag
-                if hashtag_count >= AI_HASHTAG_WITH_CHANNEL:
-                    return f"Suspicious channel pattern + AI hashtags (channel: {channel})"
+        # Channel name alone isn't enough, but combined with 1 hashtag = flag
+        if hashtag_count >= AI_HASHTAG_WITH_CHANNEL and self._suspicious_channel_any.search(channel_lower):
+            return f"Suspicious channel pattern + AI hashtags (channel: {channel})"
         
         # Check tags from video metadata
-        suspicious_tags = ["talking parrot", "talking bird", "talking cat", "talking dog", 
-                          "ai generated", "ai video", "funny animals talking"]
         for tag in tags:
             tag_lower = tag.lower()
-            for sus_tag in suspicious_tags:
+            for sus_tag in self._SUSPICIOUS_TAGS:
                 if sus_tag in tag_lower:
                     return f"Suspicious video tag: '{tag}'"
         
@@ -321,6 +736,9 @@ class SafetyAnalyzer:
 
         full_text = f"{title} {description} {' '.join(tags)}"[:MAX_FULL_TEXT_LENGTH].lower()
         
+        if not self._dangerous_animal_child_any.search(full_text):
+            return None
+
         for pattern, warning in self._dangerous_animal_child_patterns:
             if pattern.search(full_text):
                 return warning
@@ -339,9 +757,21 @@ class SafetyAnalyzer:
         title = (title or "")[:MAX_TITLE_LENGTH]
         description = (description or "")[:MAX_DESCRIPTION_LENGTH]
         
-        full_text = f"{title} {description} {' '.join(tags)}"[:MAX_FULL_TEXT_LENGTH].lower()
+        # Canonicalized like metadata titles, so disguised keywords still hit
+        # and evasion variants share a cache entry
+        full_text = _canonicalize(f"{title} {description} {' '.join(tags)}"[:MAX_FULL_TEXT_LENGTH])
         
+        warnings = [dict(w) for w in self._title_red_flag_cache.call(self._scan_title_red_flags, full_text)]
+        # Logged here, not in the memoized scan, so cache hits are logged too
+        for warning in warnings:
+            logger.info(f"🚩 Title red flag: [{warning['category']}/{warning['severity']}] {warning['message']}")
+        return warnings
+
+    def _scan_title_red_flags(self, full_text: str) -> tuple[dict, ...]:
+        """Run the red flag patterns over normalized text (memoized per analyzer)."""
         warnings = []
+        if not self._title_red_flag_any.search(full_text):
+            return ()
         seen_categories = set()  # Avoid duplicate category warnings
         
         for pattern, (category, severity, message) in self._title_red_flag_patterns:
@@ -356,9 +786,8 @@ class SafetyAnalyzer:
                         "message": f"⚠️ {message}",
                         "timestamp": None
                     })
-                    logger.info(f"🚩 Title red flag: [{category}/{severity}] {message}")
         
-        return warnings
+        return tuple(warnings)
         
     async def analyze(self, video_id: str, scraped_title: str = None, scraped_description: str = None, scraped_channel: str = None) -> dict:
         """
@@ -494,12 +923,21 @@ class SafetyAnalyzer:
             concern_text = " ".join([c["concern"] for c in comment_analysis["top_concerns"]])
             all_text += " " + concern_text
         
-        # Run signature matching on BOTH transcript+comments AND metadata
-        signature_matches = self._match_signatures(all_text)
+        # Run signature matching on BOTH transcript+comments AND metadata, plus
+        # Step 3.5: metadata-format signatures (title/description/channel
+        # patterns — occult manipulation, spiritual extremism, pseudohistory,
+        # pop-culture subversion). All of it is CPU-bound, so
+        # it runs on the scan pool in one hop and other requests' network I/O
+        # keeps moving meanwhile.
+        loop = asyncio.get_running_loop()
+        signature_matches, metadata_sig_matches, metadata_matches = await loop.run_in_executor(
+            _SCAN_EXECUTOR,
+            self._scan_video_texts,
+            all_text, metadata_text, video_title, video_description, channel_name, transcript_text,
+        )
         
         # Also match signatures against title/description (catches issues even without transcript)
-        if metadata_text.strip():
-            metadata_sig_matches = self._match_signatures(metadata_text)
+        if metadata_sig_matches:
             # Avoid duplicates — only add matches not already found
             existing_ids = {m['signature'].get('id') for m in signature_matches}
             for m in metadata_sig_matches:
@@ -509,15 +947,6 @@ class SafetyAnalyzer:
                     existing_ids.add(m['signature'].get('id'))
                     logger.info(f"🔍 Signature matched from title/description: {m['signature'].get('id')} - {m['matched_trigger']}")
         
-        # Step 3.5: Match metadata-format signatures (title/description/channel patterns)
-        # These catch occult manipulation, spiritual extremism, pseudohistory, pop-culture subversion
-        metadata_matches = self._match_metadata_signatures(
-            title=video_title,
-            description=video_description,
-            channel=channel_name,
-            transcript=transcript_text
-        )
-        
         # Step 3.6: AI Context Review — verify metadata matches aren't false positives
         # When metadata signatures fire, the AI reviewer checks if the video is
         # PROMOTING the flagged content or DEBUNKING/educating about it.
@@ -702,8 +1131,9 @@ class SafetyAnalyzer:
                 if cat_id:
                     matched_metadata_category_ids.append(cat_id)
             # Pull debunk_searches from the original signature data
+            matched_category_set = set(matched_metadata_category_ids)
             for signature in self.signatures:
-                if signature.get('category') in matched_metadata_category_ids:
+                if signature.get('category') in matched_category_set:
                     debunk_searches.extend(signature.get('debunk_searches', []))
 
         return {
@@ -747,32 +1177,63 @@ class SafetyAnalyzer:
         try:
             # Run in thread pool since youtube_transcript_api is blocking
             loop = asyncio.get_event_loop()
-            
-            def fetch_transcript():
-                ytt_api = YouTubeTranscriptApi()
-                transcript = ytt_api.fetch(video_id)
-                return transcript
-            
-            transcript_list = await loop.run_in_executor(None, fetch_transcript)
-            
-            # Combine all transcript segments
-            full_text = " ".join([segment.text for segment in transcript_list])
-            return full_text.lower(), True
+            full_text = await loop.run_in_executor(
+                None, self._transcript_cache.call, self._fetch_transcript_text, video_id
+            )
+            return full_text, True
             
         except Exception as e:
             logger.warning(f"Transcript extraction failed: {e}")
             # Return empty string but continue analysis with metadata
             return "", False
+
+    @staticmethod
+    def _fetch_transcript_text(video_id: str) -> str:
+        """Fetch a transcript (blocking) and return its lowercased text."""
+        ytt_api = YouTubeTranscriptApi()
+        transcript_list = ytt_api.fetch(video_id)
+        # Combine all transcript segments
+        return " ".join([segment.text for segment in transcript_list]).lower()
     
+    def _scan_video_texts(self, all_text: str, metadata_text: str, title: str, description: str,
+                          channel: str, transcript: str) -> tuple[list[dict], list[dict], list[dict]]:
+        """
+        Run every signature scan for one video in a single call, so analyze()
+        hands the whole CPU-bound stage to the scan pool in one hop.
+
+        Returns (transcript/comment matches, title/description matches,
+        metadata-format matches).
+        """
+        return (
+            self._match_signatures(all_text),
+            self._match_signatures(metadata_text) if metadata_text.strip() else [],
+            self._match_metadata_signatures(
+                title=title,
+                description=description,
+                channel=channel,
+                transcript=transcript
+            ),
+        )
+
     def _match_signatures(self, text: str) -> list[dict]:
         """
         Match text against danger signatures.
         Similar to antivirus signature matching.
         """
-        matches = []
-
         # Truncate text to prevent ReDoS (bound regex backtracking)
         text = text[:MAX_SIGNATURE_TEXT_LENGTH]
+        # Memoized: the same transcript is rescanned whenever a video is re-analyzed.
+        # Match dicts are copied since analyze() annotates them.
+        cached = self._signature_match_cache.call(self._scan_signatures, text, len(self.signatures))
+        return [dict(m) for m in cached]
+
+    def _scan_signatures(self, text: str, signature_count: int) -> tuple[dict, ...]:
+        """Core of _match_signatures on truncated text (memoized per analyzer)."""
+        matches = []
+
+        # Find every trigger/exclusion phrase in one pass when possible
+        found_phrases = self._phrases_in(text)
+        has_phrase = found_phrases.__contains__ if found_phrases is not None else text.__contains__
         
         for signature in self.signatures:
             # Skip metadata-format signatures (handled by _match_metadata_signatures)
@@ -781,10 +1242,15 @@ class SafetyAnalyzer:
             
             # Handle new format: signature files with 'danger_signatures' array
             if 'danger_signatures' in signature:
+                # One pass over the text rejects the whole file's patterns
+                any_pattern = _compile_pattern_union(self._danger_patterns(signature), bound_gaps=True)
+                if any_pattern is not None and not any_pattern.search(text):
+                    continue
                 category = signature.get('category', 'Unknown')
                 for danger_sig in signature.get('danger_signatures', []):
                     pattern = danger_sig.get('pattern', '')
-                    if pattern and re.search(pattern, text, re.IGNORECASE):
+                    compiled = _compile_signature_pattern(pattern, bound_gaps=True) if pattern else None
+                    if compiled is not None and compiled.search(text):
                         matches.append({
                             'signature': {
                                 'id': danger_sig.get('id', 'unknown'),
@@ -801,7 +1267,8 @@ class SafetyAnalyzer:
                 for trigger in signature.get('triggers', []):
                     # Support regex patterns
                     if signature.get('is_regex', False):
-                        if re.search(trigger, text, re.IGNORECASE):
+                        compiled = _compile_signature_pattern(trigger, bound_gaps=True)
+                        if compiled is not None and compiled.search(text):
                             matches.append({
                                 'signature': signature,
                                 'matched_trigger': trigger,
@@ -809,7 +1276,7 @@ class SafetyAnalyzer:
                             })
                             break
                     else:
-                        if trigger.lower() in text:
+                        if has_phrase(trigger.lower()):
                             matches.append({
                                 'signature': signature,
                                 'matched_trigger': trigger,
@@ -825,11 +1292,11 @@ class SafetyAnalyzer:
                 )
                 if matched_this_sig:
                     for exclusion in signature.get('exclusions', []):
-                        if exclusion.lower() in text:
+                        if has_phrase(exclusion.lower()):
                             matches.pop()
                             break
         
-        return matches
+        return tuple(matches)
     
     def _match_metadata_signatures(self, title: str, description: str, channel: str, transcript: str = "") -> list[dict]:
         """
@@ -840,16 +1307,65 @@ class SafetyAnalyzer:
         These signatures detect content like occult manipulation, spiritual extremism,
         pseudohistorical extremism, and pop-culture subversion pipelines.
         """
+        # Signature count is part of the key so signatures added to the
+        # database later aren't hidden behind stale cache entries
+        cached = self._metadata_match_cache.call(
+            self._scan_metadata_signatures,
+            *self._metadata_inputs(title, description, channel, transcript), len(self.signatures)
+        )
+        # Logged here, not in the memoized scan, so cache hits are logged too
+        for m in cached:
+            logger.warning(f"🚨 Metadata signature match: {m['signature']['category']} "
+                           f"(weight={m['match_weight']}) - {'; '.join(m['all_reasons'][:2])}")
+        return self._copy_metadata_matches(cached)
+
+    @staticmethod
+    def _metadata_inputs(title: str, description: str, channel: str,
+                         transcript: str = "") -> tuple[str, str, str, str]:
+        """Truncated (ReDoS prevention) and lowercased metadata matcher inputs."""
+        return (
+            (title or "")[:MAX_TITLE_LENGTH].lower(),
+            (description or "")[:MAX_DESCRIPTION_LENGTH].lower(),
+            (channel or "")[:MAX_CHANNEL_LENGTH],
+            (transcript or "")[:MAX_SIGNATURE_TEXT_LENGTH].lower(),
+        )
+
+    @staticmethod
+    def _copy_metadata_matches(matches: tuple[dict, ...]) -> list[dict]:
+        """Fresh copies of shared metadata matches (callers may mutate them)."""
+        return [
+            {
+                **m,
+                'signature': {**m['signature'], 'evidence': [dict(e) for e in m['signature']['evidence']]},
+                'all_reasons': list(m['all_reasons']),
+            }
+            for m in matches
+        ]
+
+    def _scan_metadata_signatures(self, title: str, description: str, channel: str,
+                                  transcript: str, signature_count: int) -> tuple[dict, ...]:
+        """Core of _match_metadata_signatures on truncated, lowercased inputs (memoized per analyzer)."""
         matches = []
         
-        # Truncate inputs to prevent ReDoS
-        title = (title or "")[:MAX_TITLE_LENGTH].lower()
-        description = (description or "")[:MAX_DESCRIPTION_LENGTH].lower()
-        channel = (channel or "")[:MAX_CHANNEL_LENGTH]
-        transcript = (transcript or "")[:MAX_SIGNATURE_TEXT_LENGTH].lower()
-        
+        # Every field is prepared once here, not once per signature.
+        # Inputs are already lowercased by the caller.
+        combined = f"{title} {description}"
         # Combined text for co-occurrence checking
-        all_text = f"{title} {description} {transcript}".lower()
+        all_text = f"{combined} {transcript}"
+
+        # Pattern matching runs on canonical text so zero-width characters
+        # and lookalike letters can't split or disguise keywords
+        title_canon = _canonicalize(title)
+        description_canon = _canonicalize(description)
+        channel_canon = _normalize_text(channel) if channel else ""
+
+        # Co-occurrence terms, hashtags and non-Latin hints are fixed strings,
+        # all found in one automaton pass when it is available
+        phrase_hits = self._phrase_hits(all_text)
+        present = {phrase for _, phrase in phrase_hits} if phrase_hits is not None else None
+        has_term = present.__contains__ if present is not None else all_text.__contains__
+        head_phrases = None  # Phrases within title + description, built on first use
+        mostly_non_latin = None  # Computed on first use; same for every signature
         
         for signature in self.signatures:
             # Only process metadata-format signatures
@@ -865,43 +1381,63 @@ class SafetyAnalyzer:
             match_weight = 0  # Track how strong the match is
             
             # 1. Check title patterns (regex)
-            for pattern in signature.get('title_patterns', []):
-                try:
-                    if re.search(pattern, title, re.IGNORECASE):
-                        matched_reasons.append(f"Title matches pattern: {pattern}")
-                        match_weight += 3  # Title match = strong signal
-                        break  # One title match is enough
-                except re.error:
-                    logger.warning(f"Invalid regex in title_patterns: {pattern}")
+            title_patterns = signature.get('title_patterns', [])
+            title_any = _compile_pattern_union(tuple(title_patterns))
+            if title_any is not None and not title_any.search(title_canon):
+                title_patterns = []
+            for pattern in title_patterns:
+                literal = _literal_phrase(pattern)
+                if literal is not None:
+                    hit = literal in title_canon
+                else:
+                    compiled = _compile_signature_pattern(pattern)
+                    hit = compiled is not None and compiled.search(title_canon) is not None
+                if hit:
+                    matched_reasons.append(f"Title matches pattern: {pattern}")
+                    match_weight += 3  # Title match = strong signal
+                    break  # One title match is enough
             
             # 2. Check description patterns (substring/regex)
-            for pattern in signature.get('description_patterns', []):
-                try:
-                    if re.search(re.escape(pattern) if not any(c in pattern for c in r'.*+?[](){}|\\^$') else pattern, 
-                                 description, re.IGNORECASE):
+            description_patterns = signature.get('description_patterns', [])
+            description_any = _compile_description_union(tuple(description_patterns))
+            if description_any is not None and not description_any.search(description_canon):
+                description_patterns = []
+            for pattern in description_patterns:
+                # Most description patterns are plain phrases: a substring test
+                literal = _literal_phrase(pattern)
+                if literal is not None:
+                    if literal in description_canon:
+                        matched_reasons.append(f"Description matches: {pattern}")
+                        match_weight += 2
+                        break
+                    continue
+                compiled = _compile_description_pattern(pattern)
+                if compiled is not None:
+                    if compiled.search(description_canon):
                         matched_reasons.append(f"Description matches: {pattern}")
                         match_weight += 2
                         break  # One description match is enough
-                except re.error:
-                    # Fall back to substring match
-                    if pattern.lower() in description:
+                else:
+                    # Invalid regex: fall back to substring match
+                    if pattern.lower() in description_canon:
                         matched_reasons.append(f"Description contains: {pattern}")
                         match_weight += 2
                         break
             
             # 3. Check co-occurrence signals
             co_occurrence = signature.get('co_occurrence_signals', {})
-            if co_occurrence:
-                # Find all term groups (genre_terms+harm_terms, wrapper_terms+payload_terms, etc.)
-                term_groups = {}
-                for key, value in co_occurrence.items():
-                    if isinstance(value, list) and key != 'evasion_tactics':
-                        term_groups[key] = value
-                
+            # Fast reject: none of this signature's terms occur, so no group can hit
+            cooccurrence_terms = self._cooccurrence_terms.get(id(signature))
+            if present is not None and cooccurrence_terms is not None:
+                has_cooccurrence_hit = not cooccurrence_terms.isdisjoint(present)
+            else:
+                has_cooccurrence_hit = True
+            term_groups = self._cooccurrence_groups.get(id(signature), ())
+            if term_groups and has_cooccurrence_hit:
                 # Check if terms from at least 2 different groups co-occur
                 groups_with_hits = {}
-                for group_name, terms in term_groups.items():
-                    hits = [t for t in terms if t.lower() in all_text]
+                for group_name, terms in term_groups:
+                    hits = [t for t, t_lower in terms if has_term(t_lower)]
                     if hits:
                         groups_with_hits[group_name] = hits
                 
@@ -916,20 +1452,18 @@ class SafetyAnalyzer:
             
             # 4. Check channel signals (known bad channels)
             channel_signals = signature.get('channel_signals', {})
-            known_bad = channel_signals.get('known_bad_channels', [])
+            known_bad = self._known_bad_channels.get(id(signature))
             if channel and known_bad:
-                channel_lower = channel.lower().strip()
-                for bad_channel in known_bad:
-                    if bad_channel.lower().strip() == channel_lower:
-                        matched_reasons.append(f"Known problematic channel: {bad_channel}")
-                        match_weight += 5  # Known bad channel = strongest signal
-                        break
+                bad_channel = known_bad.get(channel_canon)
+                if bad_channel is not None:
+                    matched_reasons.append(f"Known problematic channel: {bad_channel}")
+                    match_weight += 5  # Known bad channel = strongest signal
             
             # 5. Check known bad hashtags
             known_bad_hashtags = channel_signals.get('known_bad_hashtags', [])
             if known_bad_hashtags:
                 for hashtag in known_bad_hashtags:
-                    if hashtag.lower() in all_text:
+                    if has_term(hashtag.lower()):
                         matched_reasons.append(f"Known problematic hashtag: {hashtag}")
                         match_weight += 3
                         break
@@ -940,44 +1474,30 @@ class SafetyAnalyzer:
             # unknown channels that would otherwise evade all English-only patterns.
             non_latin_flag = signature.get('non_latin_script_flag', {}) or signature.get('language_evasion_flag', {})
             if non_latin_flag.get('enabled', False) and match_weight < 2:
-                # Count non-Latin characters (Cyrillic, Arabic, CJK, etc.)
-                combined = f"{title} {description}"
-                non_latin_chars = sum(1 for c in combined if c.isalpha() and not c.isascii())
-                total_alpha = sum(1 for c in combined if c.isalpha())
-                if total_alpha > 0 and non_latin_chars / total_alpha > 0.5:
+                if mostly_non_latin is None:
+                    if combined.isascii():
+                        # The usual case: one C-level check, no per-character walk
+                        mostly_non_latin = False
+                    else:
+                        # Count non-Latin characters (Cyrillic, Arabic, CJK, etc.), once per call
+                        non_latin_chars = sum(1 for c in combined if c.isalpha() and not c.isascii())
+                        total_alpha = sum(1 for c in combined if c.isalpha())
+                        mostly_non_latin = total_alpha > 0 and non_latin_chars / total_alpha > 0.5
+                if mostly_non_latin:
                     # More than half the letters are non-Latin.
                     # Check for zodiac emoji (♈-♓) — strong signal for occult content
-                    zodiac_emojis = ['♈', '♉', '♊', '♋', '♌', '♍', '♎', '♏', '♐', '♑', '♒', '♓']
-                    has_zodiac_emoji = any(e in combined for e in zodiac_emojis)
-                    
-                    # Build transliterated hints from the signature's own co_occurrence terms
-                    # plus a static set of known cross-script survivors
-                    static_hints = [
-                        # Occult/astrology
-                        'tarot', 'taro', 'zodiac', 'horoscope', 'astro',
-                        'тар', 'зодиак', 'гороскоп', 'астро', 'таро',
-                        # Pseudohistory
-                        'tartaria', 'тартар', 'hyperborea', 'гиперборе',
-                        'mud flood', 'antiquitech',
-                        # Spiritual/wellness extremism
-                        'pineal', 'пинеал', 'third eye', 'fluoride', 'chemtrail',
-                        # Pop-culture subversion / RAC
-                        'rac ', 'conan', 'fashwave', 'codreanu',
-                        # General extremism
-                        'nwo', 'cabal', 'каббал', 'zionist', 'сионист',
-                    ]
-                    # Also dynamically extract short co-occurrence terms from the signature
-                    dynamic_hints = []
-                    for key, value in co_occurrence.items():
-                        if isinstance(value, list):
-                            for term in value:
-                                t = term.lower().strip()
-                                # Only use distinctive terms (≥ 5 chars to avoid noise)
-                                if len(t) >= 5 and t not in ('note',):
-                                    dynamic_hints.append(t)
+                    has_zodiac_emoji = not _ZODIAC_EMOJIS.isdisjoint(combined)
                     
-                    all_hints = static_hints + dynamic_hints
-                    has_transliterated = any(hint in combined for hint in all_hints)
+                    # Transliterated hints: static cross-script survivors plus the
+                    # signature's own co-occurrence terms (prepared in the signature index)
+                    all_hints = self._non_latin_hints.get(id(signature), _NON_LATIN_STATIC_HINTS)
+                    if phrase_hits is not None:
+                        # all_text starts with combined; keep hits that end inside it
+                        if head_phrases is None:
+                            head_phrases = {phrase for end, phrase in phrase_hits if end < len(combined)}
+                        has_transliterated = not head_phrases.isdisjoint(all_hints)
+                    else:
+                        has_transliterated = any(hint in combined for hint in all_hints)
                     
                     if has_zodiac_emoji or has_transliterated:
                         matched_reasons.append(f"Non-Latin content with category-relevant signals detected")
@@ -993,55 +1513,7 @@ class SafetyAnalyzer:
                 warning_msg = sig_description or f"Content flagged for {display_name}"
                 
                 # Build evidence items showing EXACTLY what was found
-                evidence_items = []
-                for reason in matched_reasons:
-                    if reason.startswith("Title matches pattern:"):
-                        evidence_items.append({
-                            'type': 'title',
-                            'label': 'Title keyword detected',
-                            'value': title[:80]
-                        })
-                    elif reason.startswith("Description matches:"):
-                        matched_term = reason.split("Description matches: ", 1)[-1]
-                        evidence_items.append({
-                            'type': 'description',
-                            'label': 'Description contains',
-                            'value': matched_term
-                        })
-                    elif reason.startswith("Description contains:"):
-                        matched_term = reason.split("Description contains: ", 1)[-1]
-                        evidence_items.append({
-                            'type': 'description',
-                            'label': 'Description contains',
-                            'value': matched_term
-                        })
-                    elif reason.startswith("Co-occurrence signals:"):
-                        raw = reason.split("Co-occurrence signals: ", 1)[-1]
-                        evidence_items.append({
-                            'type': 'co_occurrence',
-                            'label': 'Multiple harm signals co-occur',
-                            'value': raw
-                        })
-                    elif reason.startswith("Known problematic channel:"):
-                        ch_name = reason.split("Known problematic channel: ", 1)[-1]
-                        evidence_items.append({
-                            'type': 'channel',
-                            'label': 'Flagged channel',
-                            'value': ch_name
-                        })
-                    elif reason.startswith("Known problematic hashtag:"):
-                        ht = reason.split("Known problematic hashtag: ", 1)[-1]
-                        evidence_items.append({
-                            'type': 'hashtag',
-                            'label': 'Flagged hashtag',
-                            'value': ht
-                        })
-                    else:
-                        evidence_items.append({
-                            'type': 'other',
-                            'label': 'Signal',
-                            'value': reason
-                        })
+                evidence_items = [_evidence_item(reason, title) for reason in matched_reasons]
                 
                 matches.append({
                     'signature': {
@@ -1058,34 +1530,37 @@ class SafetyAnalyzer:
                     'match_weight': match_weight,
                     'all_reasons': matched_reasons
                 })
-                
-                logger.warning(f"🚨 Metadata signature match: {category} (weight={match_weight}) - {'; '.join(matched_reasons[:2])}")
         
-        return matches
+        return tuple(matches)
     
     def _analyze_categories(self, text: str, matches: list[dict]) -> dict:
         """Analyze text for each safety category"""
         categories = self.safety_db.get_categories()
         results = {}
+
+        # Total severity penalty per category, in one pass over the matches
+        # (rather than filtering every match list once per category)
+        category_penalties = {}
+        for m in matches:
+            sig = m['signature']
+            cat_id = sig.get('category')
+            category_penalties[cat_id] = (
+                category_penalties.get(cat_id, 0)
+                + CATEGORY_SEVERITY_WEIGHTS.get(sig.get('severity', 'low'), 5)
+            )
         
         for cat_id, category in categories.items():
-            # Count matches in this category
-            cat_matches = [m for m in matches if m['signature'].get('category') == cat_id]
-            
             # Calculate category score (100 = safe, 0 = dangerous)
-            if cat_matches:
+            flagged = cat_id in category_penalties
+            if flagged:
                 # More matches = lower score
-                total_penalty = sum(
-                    CATEGORY_SEVERITY_WEIGHTS.get(m['signature'].get('severity', 'low'), 5)
-                    for m in cat_matches
-                )
-                score = max(0, BASE_SCORE - total_penalty)
+                score = max(0, BASE_SCORE - category_penalties[cat_id])
             else:
                 score = 100
             
             results[category['name']] = {
                 'emoji': category['emoji'],
-                'flagged': len(cat_matches) > 0,
+                'flagged': flagged,
                 'score': score
             }
         
@@ -1095,14 +1570,14 @@ class SafetyAnalyzer:
         """Convert signature matches to user-friendly warnings"""
         warnings = []
         
-        # Sort by severity
+        # Order by severity: the ranks are fixed, so a stable partition into
+        # three buckets does it in one pass (unknown severities rank as low)
         severity_order = {'high': 0, 'medium': 1, 'low': 2}
-        sorted_matches = sorted(
-            matches,
-            key=lambda m: severity_order.get(m['signature'].get('severity', 'low'), 2)
-        )
+        buckets = ([], [], [])
+        for match in matches:
+            buckets[severity_order.get(match['signature'].get('severity', 'low'), 2)].append(match)
         
-        for match in sorted_matches:
+        for match in (*buckets[0], *buckets[1], *buckets[2]):
             sig = match['signature']
             warning_entry = {
                 'category': self.safety_db.get_category_name(sig.get('category', 'general')),
@@ -1127,15 +1602,14 @@ class SafetyAnalyzer:
         - Category scores
         """
         if not matches:
+            # Clean video: nothing to weigh, categories included
             return DEFAULT_SAFE_SCORE
 
-        # Base score
-        base_score = BASE_SCORE
-
-        # Penalty for each match based on severity
-        for match in matches:
-            severity = match['signature'].get('severity', 'low')
-            base_score -= OVERALL_SEVERITY_PENALTIES.get(severity, 5)
+        # Base score, less a penalty for each match based on severity
+        base_score = BASE_SCORE - sum(
+            OVERALL_SEVERITY_PENALTIES.get(match['signature'].get('severity', 'low'), 5)
+            for match in matches
+        )
 
         # Average with category scores
         if categories:
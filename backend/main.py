@@ -24,9 +24,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 import re
+import json
 import time
 import asyncio
+import hashlib
 import secrets
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, Response
@@ -34,18 +37,25 @@ from pydantic import BaseModel, field_validator, Field
 from typing import Optional
 import uvicorn
 
+try:
+    import orjson  # Optional: faster encoding of the precomputed JSON payloads
+except ImportError:
+    orjson = None
+
 # Security: Video ID validation pattern (11 chars, alphanumeric + hyphen/underscore)
-VIDEO_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+# Used with fullmatch: '$' would also accept a trailing newline
+VIDEO_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]{11}')
 
 def validate_video_id(video_id: str) -> str:
     """Validate YouTube video ID format to prevent injection attacks"""
-    if not video_id or not VIDEO_ID_PATTERN.match(video_id):
+    if not video_id or not VIDEO_ID_PATTERN.fullmatch(video_id):
         raise HTTPException(status_code=400, detail="Invalid video ID format")
     return video_id
 
 from analyzer import SafetyAnalyzer
 from safety_db import SafetyDatabase
 from alternatives_finder import SafeAlternativesFinder, get_alternatives_finder
+from report_html import generate_report_html
 
 # Vision analyzer is optional (requires yt-dlp and ffmpeg)
 try:
@@ -56,10 +66,19 @@ except ImportError as e:
     VISION_AVAILABLE = False
     VisionAnalyzer = None
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Shutdown: release pooled HTTP connections
+    if vision_analyzer is not None:
+        await vision_analyzer.aclose()
+
+
 app = FastAPI(
     title="YouTube Safety Inspector API",
     description="Analyzes YouTube videos for potentially dangerous or misleading content",
-    version="3.0.1"
+    version="3.0.1",
+    lifespan=lifespan,
 )
 
 # Security headers middleware
@@ -112,6 +131,17 @@ RATE_LIMITS = {
     "/real-alternatives": 15,
 }
 DEFAULT_RATE_LIMIT = 30  # For unlisted endpoints
+RATE_LIMIT_CLEANUP_THRESHOLD = 200  # Prune stale keys once the store grows past this
+
+
+def _cleanup_rate_limit_store(cutoff: float) -> None:
+    """Drop rate-limit entries with no request since cutoff (active ones are kept)."""
+    stale_keys = [
+        k for k, v in _rate_limit_store.items()
+        if not v or v[-1] < cutoff
+    ]
+    for k in stale_keys:
+        del _rate_limit_store[k]
 
 @app.middleware("http")
 async def rate_limit_middleware(request: Request, call_next):
@@ -137,14 +167,8 @@ async def rate_limit_middleware(request: Request, call_next):
     _rate_limit_store[key] = timestamps
 
     # Periodic cleanup of old entries (every ~200 requests)
-    if len(_rate_limit_store) > 200:
-        cutoff = now - RATE_LIMIT_WINDOW
-        stale_keys = [
-            k for k, v in _rate_limit_store.items()
-            if not v or v[-1] < cutoff
-        ]
-        for k in stale_keys:
-            del _rate_limit_store[k]
+    if len(_rate_limit_store) > RATE_LIMIT_CLEANUP_THRESHOLD:
+        _cleanup_rate_limit_store(now - RATE_LIMIT_WINDOW)
 
     return await call_next(request)
 
@@ -266,7 +290,7 @@ class AnalyzeRequest(BaseModel):
     @field_validator('video_id')
     @classmethod
     def validate_video_id_format(cls, v):
-        if not v or not VIDEO_ID_PATTERN.match(v):
+        if not v or not VIDEO_ID_PATTERN.fullmatch(v):
             raise ValueError('Invalid video ID format (must be 11 characters, alphanumeric with hyphens/underscores)')
         return v
     
@@ -560,10 +584,10 @@ async def get_real_alternatives(request: AIContentRequest):
         
         # Get animal-specific videos if we detected an animal
         if subject and subject in alternatives_finder.fallback_real_animals:
-            real_videos = alternatives_finder.fallback_real_animals[subject][:max_results]
+            real_videos = list(alternatives_finder.fallback_real_animals[subject][:max_results])
             animal_name = subject.title()
         else:
-            real_videos = alternatives_finder.fallback_real_animals["default"][:max_results]
+            real_videos = list(alternatives_finder.fallback_real_animals["default"][:max_results])
             animal_name = "Wildlife"
         
         return {
@@ -591,9 +615,36 @@ async def get_full_report(video_id: str):
         raise HTTPException(status_code=500, detail="Failed to generate report")
 
 
-@app.get("/signatures")
-async def get_signatures():
-    """Get safety signature metadata (trigger patterns stripped to prevent evasion)"""
+# Serialized /signatures and /categories payloads: name -> (version, body, etag)
+_static_json_cache: dict[str, tuple[int, bytes, str]] = {}
+
+
+def _dump_json(payload) -> bytes:
+    """Encode a payload as compact JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _static_json_response(request: Request, name: str, version: int, build) -> Response:
+    """
+    Serve a rarely-changing JSON payload from bytes encoded once per version
+    (re-encoded only when e.g. a signature is added), with an ETag so
+    clients can revalidate with If-None-Match instead of re-downloading.
+    """
+    cached = _static_json_cache.get(name)
+    if cached is None or cached[0] != version:
+        body = _dump_json(build())
+        cached = (version, body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+        _static_json_cache[name] = cached
+    _, body, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def _public_signatures() -> list[dict]:
+    """Signature metadata with trigger patterns stripped to prevent evasion."""
     safe_sigs = []
     for sig in safety_db.get_all_signatures():
         safe_sigs.append({
@@ -606,212 +657,16 @@ async def get_signatures():
     return safe_sigs
 
 
-@app.get("/categories")
-async def get_categories():
-    """Get all safety categories"""
-    return safety_db.get_categories()
-
+@app.get("/signatures")
+async def get_signatures(request: Request):
+    """Get safety signature metadata (trigger patterns stripped to prevent evasion)"""
+    return _static_json_response(request, "signatures", len(safety_db.signatures), _public_signatures)
 
 
-def generate_report_html(results: dict) -> str:
-    """Generate a detailed HTML report"""
-    import html
-    
-    score = results.get('safety_score', 0)
-    if score < 40:
-        score_class = 'danger'
-        score_label = 'DANGEROUS'
-    elif score < 70:
-        score_class = 'warning'
-        score_label = 'USE CAUTION'
-    else:
-        score_class = 'safe'
-        score_label = 'SAFE'
-    
-    warnings_html = ""
-    for w in results.get('warnings', []):
-        severity = html.escape(str(w.get('severity', 'low')))
-        category = html.escape(str(w.get('category', 'Unknown')))
-        message = html.escape(str(w.get('message', '')))
-        
-        warnings_html += f"""
-        <div class="warning-item {severity}">
-            <div class="warning-header">
-                <span class="severity-badge">{severity.upper()}</span>
-                <span class="category">{category}</span>
-            </div>
-            <p>{message}</p>
-        </div>
-        """
-    
-    if not warnings_html:
-        warnings_html = '<p class="no-warnings">✅ No safety concerns detected</p>'
-    
-    categories_html = ""
-    for name, data in results.get('categories', {}).items():
-        status = 'flagged' if data.get('flagged') else 'safe'
-        safe_name = html.escape(str(name))
-        emoji = html.escape(str(data.get('emoji', '')))
-        score_val = data.get('score', 0)
-        
-        categories_html += f"""
-        <div class="category-card {status}">
-            <span class="emoji">{emoji}</span>
-            <span class="name">{safe_name}</span>
-            <span class="score">{score_val}/100</span>
-        </div>
-        """
-    
-    video_id_safe = html.escape(str(results.get('video_id', '')))
-    summary_safe = html.escape(str(results.get('summary', 'Analysis complete.')))
-    
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Safety Report - {video_id_safe}</title>
-        <style>
-            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-                color: #eee;
-                min-height: 100vh;
-                padding: 40px;
-            }}
-            .container {{ max-width: 800px; margin: 0 auto; }}
-            header {{
-                text-align: center;
-                margin-bottom: 40px;
-            }}
-            h1 {{
-                font-size: 32px;
-                margin-bottom: 10px;
-            }}
-            .video-id {{
-                color: #888;
-                font-size: 14px;
-            }}
-            .score-section {{
-                text-align: center;
-                margin-bottom: 40px;
-            }}
-            .score-circle {{
-                width: 150px;
-                height: 150px;
-                border-radius: 50%;
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                justify-content: center;
-                margin: 0 auto 15px;
-                font-size: 48px;
-                font-weight: 700;
-            }}
-            .score-circle.danger {{ background: rgba(255,68,68,0.2); border: 4px solid #ff4444; color: #ff4444; }}
-            .score-circle.warning {{ background: rgba(255,170,0,0.2); border: 4px solid #ffaa00; color: #ffaa00; }}
-            .score-circle.safe {{ background: rgba(0,255,136,0.2); border: 4px solid #00ff88; color: #00ff88; }}
-            .score-label {{
-                font-size: 14px;
-                letter-spacing: 2px;
-            }}
-            .section {{
-                background: rgba(255,255,255,0.05);
-                border-radius: 15px;
-                padding: 25px;
-                margin-bottom: 25px;
-            }}
-            .section h2 {{
-                font-size: 20px;
-                margin-bottom: 20px;
-                padding-bottom: 10px;
-                border-bottom: 1px solid rgba(255,255,255,0.1);
-            }}
-            .warning-item {{
-                padding: 15px;
-                margin-bottom: 15px;
-                border-radius: 10px;
-                border-left: 4px solid;
-            }}
-            .warning-item.high {{ background: rgba(255,68,68,0.1); border-color: #ff4444; }}
-            .warning-item.medium {{ background: rgba(255,170,0,0.1); border-color: #ffaa00; }}
-            .warning-item.low {{ background: rgba(0,212,255,0.1); border-color: #00d4ff; }}
-            .warning-header {{
-                display: flex;
-                gap: 10px;
-                margin-bottom: 8px;
-            }}
-            .severity-badge {{
-                padding: 3px 8px;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 600;
-            }}
-            .warning-item.high .severity-badge {{ background: #ff4444; }}
-            .warning-item.medium .severity-badge {{ background: #ffaa00; color: #1a1a2e; }}
-            .warning-item.low .severity-badge {{ background: #00d4ff; color: #1a1a2e; }}
-            .category {{ color: #888; font-size: 13px; }}
-            .no-warnings {{
-                color: #00ff88;
-                text-align: center;
-                padding: 20px;
-            }}
-            .categories-grid {{
-                display: grid;
-                grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-                gap: 15px;
-            }}
-            .category-card {{
-                background: rgba(255,255,255,0.05);
-                border-radius: 10px;
-                padding: 20px;
-                text-align: center;
-            }}
-            .category-card.flagged {{ background: rgba(255,68,68,0.1); border: 1px solid rgba(255,68,68,0.3); }}
-            .category-card.safe {{ background: rgba(0,255,136,0.05); border: 1px solid rgba(0,255,136,0.2); }}
-            .category-card .emoji {{ font-size: 30px; display: block; margin-bottom: 8px; }}
-            .category-card .name {{ font-size: 13px; display: block; margin-bottom: 5px; }}
-            .category-card .score {{ font-size: 11px; color: #888; }}
-            .summary {{
-                line-height: 1.6;
-                color: #ccc;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <header>
-                <h1>🛡️ Safety Analysis Report</h1>
-                <p class="video-id">Video ID: {video_id_safe}</p>
-            </header>
-            
-            <div class="score-section">
-                <div class="score-circle {score_class}">
-                    {score}
-                    <span class="score-label">{score_label}</span>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>⚠️ Warnings</h2>
-                {warnings_html}
-            </div>
-            
-            <div class="section">
-                <h2>📋 Categories Analyzed</h2>
-                <div class="categories-grid">
-                    {categories_html}
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>📝 Summary</h2>
-                <p class="summary">{summary_safe}</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+@app.get("/categories")
+async def get_categories(request: Request):
+    """Get all safety categories"""
+    return _static_json_response(request, "categories", len(safety_db.categories), safety_db.get_categories)
 
 
 if __name__ == "__main__":
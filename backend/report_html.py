@@ -0,0 +1,205 @@
+"""
+Report HTML - Renders analysis results as a standalone HTML page
+Served by the /report endpoint; every dynamic value is HTML-escaped
+"""
+
+import html
+
+
+def generate_report_html(results: dict) -> str:
+    """Generate a detailed HTML report"""
+    score = results.get('safety_score', 0)
+    if score < 40:
+        score_class = 'danger'
+        score_label = 'DANGEROUS'
+    elif score < 70:
+        score_class = 'warning'
+        score_label = 'USE CAUTION'
+    else:
+        score_class = 'safe'
+        score_label = 'SAFE'
+    
+    warnings_html = ""
+    for w in results.get('warnings', []):
+        severity = html.escape(str(w.get('severity', 'low')))
+        category = html.escape(str(w.get('category', 'Unknown')))
+        message = html.escape(str(w.get('message', '')))
+        
+        warnings_html += f"""
+        <div class="warning-item {severity}">
+            <div class="warning-header">
+                <span class="severity-badge">{severity.upper()}</span>
+                <span class="category">{category}</span>
+            </div>
+            <p>{message}</p>
+        </div>
+        """
+    
+    if not warnings_html:
+        warnings_html = '<p class="no-warnings">✅ No safety concerns detected</p>'
+    
+    categories_html = ""
+    for name, data in results.get('categories', {}).items():
+        status = 'flagged' if data.get('flagged') else 'safe'
+        safe_name = html.escape(str(name))
+        emoji = html.escape(str(data.get('emoji', '')))
+        score_val = data.get('score', 0)
+        
+        categories_html += f"""
+        <div class="category-card {status}">
+            <span class="emoji">{emoji}</span>
+            <span class="name">{safe_name}</span>
+            <span class="score">{score_val}/100</span>
+        </div>
+        """
+    
+    video_id_safe = html.escape(str(results.get('video_id', '')))
+    summary_safe = html.escape(str(results.get('summary', 'Analysis complete.')))
+    
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Safety Report - {video_id_safe}</title>
+        <style>
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            body {{
+                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
+                color: #eee;
+                min-height: 100vh;
+                padding: 40px;
+            }}
+            .container {{ max-width: 800px; margin: 0 auto; }}
+            header {{
+                text-align: center;
+                margin-bottom: 40px;
+            }}
+            h1 {{
+                font-size: 32px;
+                margin-bottom: 10px;
+            }}
+            .video-id {{
+                color: #888;
+                font-size: 14px;
+            }}
+            .score-section {{
+                text-align: center;
+                margin-bottom: 40px;
+            }}
+            .score-circle {{
+                width: 150px;
+                height: 150px;
+                border-radius: 50%;
+                display: flex;
+                flex-direction: column;
+                align-items: center;
+                justify-content: center;
+                margin: 0 auto 15px;
+                font-size: 48px;
+                font-weight: 700;
+            }}
+            .score-circle.danger {{ background: rgba(255,68,68,0.2); border: 4px solid #ff4444; color: #ff4444; }}
+            .score-circle.warning {{ background: rgba(255,170,0,0.2); border: 4px solid #ffaa00; color: #ffaa00; }}
+            .score-circle.safe {{ background: rgba(0,255,136,0.2); border: 4px solid #00ff88; color: #00ff88; }}
+            .score-label {{
+                font-size: 14px;
+                letter-spacing: 2px;
+            }}
+            .section {{
+                background: rgba(255,255,255,0.05);
+                border-radius: 15px;
+                padding: 25px;
+                margin-bottom: 25px;
+            }}
+            .section h2 {{
+                font-size: 20px;
+                margin-bottom: 20px;
+                padding-bottom: 10px;
+                border-bottom: 1px solid rgba(255,255,255,0.1);
+            }}
+            .warning-item {{
+                padding: 15px;
+                margin-bottom: 15px;
+                border-radius: 10px;
+                border-left: 4px solid;
+            }}
+            .warning-item.high {{ background: rgba(255,68,68,0.1); border-color: #ff4444; }}
+            .warning-item.medium {{ background: rgba(255,170,0,0.1); border-color: #ffaa00; }}
+            .warning-item.low {{ background: rgba(0,212,255,0.1); border-color: #00d4ff; }}
+            .warning-header {{
+                display: flex;
+                gap: 10px;
+                margin-bottom: 8px;
+            }}
+            .severity-badge {{
+                padding: 3px 8px;
+                border-radius: 4px;
+                font-size: 11px;
+                font-weight: 600;
+            }}
+            .warning-item.high .severity-badge {{ background: #ff4444; }}
+            .warning-item.medium .severity-badge {{ background: #ffaa00; color: #1a1a2e; }}
+            .warning-item.low .severity-badge {{ background: #00d4ff; color: #1a1a2e; }}
+            .category {{ color: #888; font-size: 13px; }}
+            .no-warnings {{
+                color: #00ff88;
+                text-align: center;
+                padding: 20px;
+            }}
+            .categories-grid {{
+                display: grid;
+                grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
+                gap: 15px;
+            }}
+            .category-card {{
+                background: rgba(255,255,255,0.05);
+                border-radius: 10px;
+                padding: 20px;
+                text-align: center;
+            }}
+            .category-card.flagged {{ background: rgba(255,68,68,0.1); border: 1px solid rgba(255,68,68,0.3); }}
+            .category-card.safe {{ background: rgba(0,255,136,0.05); border: 1px solid rgba(0,255,136,0.2); }}
+            .category-card .emoji {{ font-size: 30px; display: block; margin-bottom: 8px; }}
+            .category-card .name {{ font-size: 13px; display: block; margin-bottom: 5px; }}
+            .category-card .score {{ font-size: 11px; color: #888; }}
+            .summary {{
+                line-height: 1.6;
+                color: #ccc;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <header>
+                <h1>🛡️ Safety Analysis Report</h1>
+                <p class="video-id">Video ID: {video_id_safe}</p>
+            </header>
+            
+            <div class="score-section">
+                <div class="score-circle {score_class}">
+                    {score}
+                    <span class="score-label">{score_label}</span>
+                </div>
+            </div>
+            
+            <div class="section">
+                <h2>⚠️ Warnings</h2>
+                {warnings_html}
+            </div>
+            
+            <div class="section">
+                <h2>📋 Categories Analyzed</h2>
+                <div class="categories-grid">
+                    {categories_html}
+                </div>
+            </div>
+            
+            <div class="section">
+                <h2>📝 Summary</h2>
+                <p class="summary">{summary_safe}</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
@@ -5,11 +5,27 @@ Think of this like an antivirus definition database, but for dangerous content
 
 import json
 import os
+import sys
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Signature fields whose values are short, repeated keys (compared and used
+# in sets/dicts a lot during analysis); interned when loaded from JSON.
+_INTERNED_FIELDS = ('id', 'category', 'severity')
+
+
+def _intern_fields(signature: dict) -> dict:
+    """Intern the key-like string fields of a signature (and its danger_signatures)."""
+    for entry in (signature, *signature.get('danger_signatures', [])):
+        for field in _INTERNED_FIELDS:
+            value = entry.get(field)
+            if isinstance(value, str):
+                entry[field] = sys.intern(value)
+    return signature
+
+
 class SafetyDatabase:
     """
     Manages the safety signature database.
@@ -60,9 +76,9 @@ class SafetyDatabase:
                     with open(sig_file, 'r', encoding='utf-8') as f:
                         sigs = json.load(f)
                         if isinstance(sigs, list):
-                            self.signatures.extend(sigs)
+                            self.signatures.extend(_intern_fields(sig) for sig in sigs)
                         else:
-                            self.signatures.append(sigs)
+                            self.signatures.append(_intern_fields(sigs))
                 except Exception as e:
                     logger.error(f"Error loading {sig_file}: {e}")
         
@@ -7,6 +7,62 @@ from pathlib import Path
 backend_path = Path(__file__).parent.parent
 sys.path.append(str(backend_path))
 
+
+def pytest_sessionstart(session):
+    """Warm up the expensive singletons once, before the first test runs.
+
+    Loading the signature JSON files and compiling the analyzer's pattern
+    tables is the slowest part of most tests. Read-only fixtures hand out
+    these shared instances via ``request.session``; tests that mutate the
+    database must still build their own.
+    """
+    from safety_db import SafetyDatabase
+    from analyzer import SafetyAnalyzer
+    from alternatives_finder import get_alternatives_finder
+
+    session._safety_db = SafetyDatabase()
+    session._analyzer = SafetyAnalyzer(session._safety_db)
+    get_alternatives_finder()
+
+
+@pytest.fixture(scope="session")
+def safety_db(request):
+    """The database preloaded in ``pytest_sessionstart`` (read-only, shared)."""
+    return request.session._safety_db
+
+
+@pytest.fixture(scope="session")
+def real_analyzer(request):
+    """Analyzer backed by the full production signature set (read-only, shared)."""
+    return request.session._analyzer
+
+
+# Session-scoped: the app keeps no per-client state, and the event loop is
+# session-scoped too (asyncio_default_fixture_loop_scope in pyproject.toml)
+@pytest.fixture(scope="session")
+async def _asgi_client():
+    """One ASGI client for the FastAPI app per test session (per xdist worker)."""
+    from httpx import AsyncClient, ASGITransport
+    from main import app
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+def client(_asgi_client):
+    """The shared ASGI client, with rate-limit counters reset.
+
+    Every request comes from the same test client IP, so without the reset
+    the per-minute /analyze limit would trip partway through a run.
+    """
+    from main import _rate_limit_store
+
+    _rate_limit_store.clear()
+    return _asgi_client
+
+
 @pytest.fixture
 def mock_video_id():
     return "dQw4w9WgXcQ"
@@ -0,0 +1,55 @@
+"""Test doubles shared by several test modules."""
+
+from contextlib import contextmanager
+
+
+@contextmanager
+def swap_attr(obj, name, value):
+    """Temporarily replace ``obj.name`` with ``value``.
+
+    A lighter stand-in for ``patch.object`` when the replacement is a plain
+    function and no mock bookkeeping is needed.
+    """
+    # Only restore an instance attribute if there was one; otherwise drop the
+    # override so class-level lookup (e.g. a method) applies again.
+    had_own = name in getattr(obj, "__dict__", {})
+    original = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield value
+    finally:
+        if had_own:
+            setattr(obj, name, original)
+        else:
+            delattr(obj, name)
+
+
+class StubFetcher:
+    """Hand-rolled stand-in for ``YouTubeDataFetcher``.
+
+    Patched in place of the class: calling it (``YouTubeDataFetcher(api_key=...)``)
+    returns the stub itself, which works with ``async with`` and serves
+    ``metadata``/``comments``. Set ``metadata`` to an exception to make the
+    metadata fetch fail. Much cheaper than an AsyncMock/MagicMock chain.
+    """
+
+    def __init__(self, metadata=None, comments=()):
+        self.metadata = metadata
+        self.comments = list(comments)
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get_video_metadata(self, *args, **kwargs):
+        if isinstance(self.metadata, BaseException):
+            raise self.metadata
+        return self.metadata
+
+    async def get_comments(self, *args, **kwargs):
+        return list(self.comments)
@@ -11,13 +11,15 @@ import asyncio
 import sys
 import os
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
 
 # Add backend directory to path
 backend_path = Path(__file__).parent.parent
 sys.path.append(str(backend_path))
 
 from ai_reviewer import AIContextReviewer
+from helpers import StubFetcher
 
 
 # ================================================================
@@ -335,14 +337,12 @@ class TestAnalyzerAIIntegration:
     """Test that SafetyAnalyzer correctly uses AIContextReviewer to suppress false positives."""
     
     @pytest.mark.asyncio
-    async def test_debunking_video_not_flagged(self):
+    async def test_debunking_video_not_flagged(self, safety_db):
         """A debunking video whose metadata triggers signature patterns should be suppressed."""
-        from safety_db import SafetyDatabase
         from analyzer import SafetyAnalyzer
         
         reviewer = AIContextReviewer()  # Heuristic
-        db = SafetyDatabase()
-        analyzer = SafetyAnalyzer(db, ai_reviewer=reviewer)
+        analyzer = SafetyAnalyzer(safety_db, ai_reviewer=reviewer)
         
         # Craft content that WILL trigger pseudohistorical_extremism signatures:
         # - title matches "tartaria.*truth" pattern 
@@ -357,18 +357,12 @@ class TestAnalyzerAIIntegration:
             with patch.object(analyzer, '_analyze_comments', new_callable=AsyncMock, return_value={
                 "total_comments": 0, "warning_comments": 0, "warnings": [], "warning_score": 100
             }):
-                with patch('analyzer.YouTubeDataFetcher') as mock_fetcher_cls:
-                    mock_fetcher = AsyncMock()
-                    mock_fetcher.__aenter__ = AsyncMock(return_value=mock_fetcher)
-                    mock_fetcher.__aexit__ = AsyncMock(return_value=None)
-                    mock_fetcher.get_video_metadata = AsyncMock(return_value=MagicMock(
-                        title=debunking_title,
-                        description=debunking_desc,
-                        channel="HistoryMatters",
-                        tags=["tartaria", "debunked", "history"],
-                    ))
-                    mock_fetcher_cls.return_value = mock_fetcher
-                    
+                with patch('analyzer.YouTubeDataFetcher', StubFetcher(SimpleNamespace(
+                    title=debunking_title,
+                    description=debunking_desc,
+                    channel="HistoryMatters",
+                    tags=["tartaria", "debunked", "history"],
+                ))):
                     results = await analyzer.analyze(
                         "LQRHpB49X6o",
                         scraped_title=debunking_title,
@@ -388,31 +382,23 @@ class TestAnalyzerAIIntegration:
         assert len(metadata_warnings) == 0, f"Debunking video should not be flagged: {metadata_warnings}"
     
     @pytest.mark.asyncio
-    async def test_promoting_video_still_flagged(self):
+    async def test_promoting_video_still_flagged(self, safety_db):
         """A video actually promoting conspiracy theories should still be flagged."""
-        from safety_db import SafetyDatabase
         from analyzer import SafetyAnalyzer
         
         reviewer = AIContextReviewer()  # Heuristic
-        db = SafetyDatabase()
-        analyzer = SafetyAnalyzer(db, ai_reviewer=reviewer)
+        analyzer = SafetyAnalyzer(safety_db, ai_reviewer=reviewer)
         
         with patch.object(analyzer, '_get_transcript', new_callable=AsyncMock, return_value=("", False)):
             with patch.object(analyzer, '_analyze_comments', new_callable=AsyncMock, return_value={
                 "total_comments": 0, "warning_comments": 0, "warnings": [], "warning_score": 100
             }):
-                with patch('analyzer.YouTubeDataFetcher') as mock_fetcher_cls:
-                    mock_fetcher = AsyncMock()
-                    mock_fetcher.__aenter__ = AsyncMock(return_value=mock_fetcher)
-                    mock_fetcher.__aexit__ = AsyncMock(return_value=None)
-                    mock_fetcher.get_video_metadata = AsyncMock(return_value=MagicMock(
-                        title="The Hidden Truth About Tartaria: The Empire They Erased",
-                        description="Ancient Tartaria was a massive empire deliberately erased from history books.",
-                        channel="TruthRevealedTV",
-                        tags=["tartaria", "hidden history", "truth"],
-                    ))
-                    mock_fetcher_cls.return_value = mock_fetcher
-                    
+                with patch('analyzer.YouTubeDataFetcher', StubFetcher(SimpleNamespace(
+                    title="The Hidden Truth About Tartaria: The Empire They Erased",
+                    description="Ancient Tartaria was a massive empire deliberately erased from history books.",
+                    channel="TruthRevealedTV",
+                    tags=["tartaria", "hidden history", "truth"],
+                ))):
                     results = await analyzer.analyze(
                         "FAKEID12345",
                         scraped_title="The Hidden Truth About Tartaria: The Empire They Erased",
@@ -424,30 +410,22 @@ class TestAnalyzerAIIntegration:
         assert results.get("is_debunking") is False
     
     @pytest.mark.asyncio 
-    async def test_analyzer_works_without_reviewer(self):
+    async def test_analyzer_works_without_reviewer(self, safety_db):
         """SafetyAnalyzer should still work when no AI reviewer is provided."""
-        from safety_db import SafetyDatabase
         from analyzer import SafetyAnalyzer
         
-        db = SafetyDatabase()
-        analyzer = SafetyAnalyzer(db)  # No AI reviewer
+        analyzer = SafetyAnalyzer(safety_db)  # No AI reviewer
         
         with patch.object(analyzer, '_get_transcript', new_callable=AsyncMock, return_value=("", False)):
             with patch.object(analyzer, '_analyze_comments', new_callable=AsyncMock, return_value={
                 "total_comments": 0, "warning_comments": 0, "warnings": [], "warning_score": 100
             }):
-                with patch('analyzer.YouTubeDataFetcher') as mock_fetcher_cls:
-                    mock_fetcher = AsyncMock()
-                    mock_fetcher.__aenter__ = AsyncMock(return_value=mock_fetcher)
-                    mock_fetcher.__aexit__ = AsyncMock(return_value=None)
-                    mock_fetcher.get_video_metadata = AsyncMock(return_value=MagicMock(
-                        title="Safe Video",
-                        description="Nothing dangerous here",
-                        channel="SafeChannel",
-                        tags=[],
-                    ))
-                    mock_fetcher_cls.return_value = mock_fetcher
-                    
+                with patch('analyzer.YouTubeDataFetcher', StubFetcher(SimpleNamespace(
+                    title="Safe Video",
+                    description="Nothing dangerous here",
+                    channel="SafeChannel",
+                    tags=[],
+                ))):
                     results = await analyzer.analyze(
                         "dQw4w9WgXcQ",
                         scraped_title="Safe Video",
@@ -14,8 +14,8 @@ Covers:
 """
 
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
 from alternatives_finder import SafeAlternativesFinder, get_alternatives_finder
+from helpers import swap_attr
 
 
 # ---------------------------------------------------------------------------
@@ -51,13 +51,13 @@ class TestInit:
         assert isinstance(finder.animal_keywords, dict)
         assert isinstance(finder.safe_search_mappings, dict)
         assert isinstance(finder.trusted_channels, list)
-        assert isinstance(finder.fallback_tutorials, list)
-        assert isinstance(finder.fallback_entertainment, list)
+        assert isinstance(finder.fallback_tutorials, (list, tuple))
+        assert isinstance(finder.fallback_entertainment, (list, tuple))
         assert isinstance(finder.fallback_real_animals, dict)
 
     def test_fallback_real_videos_populated(self, finder):
         """fallback_real_videos is the 'default' list from fallback_real_animals."""
-        assert isinstance(finder.fallback_real_videos, list)
+        assert isinstance(finder.fallback_real_videos, (list, tuple))
 
 
 # ---------------------------------------------------------------------------
@@ -85,20 +85,33 @@ class TestDetectAnimal:
         assert finder._detect_animal(None) is None
 
 
+ANIMAL_TITLES = [
+    "Cute puppy videos", "Lion documentary", "Zoo animals",
+    "Wildlife safari", "Pet care tips", "Shark attack footage",
+]
+NON_ANIMAL_TITLES = [
+    "JavaScript tutorial", "Cooking pasta recipe",
+    "How to fix plumbing", "Stock market analysis",
+]
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize title-based tests by argument name, with readable ids."""
+    for argname, titles in (("animal_title", ANIMAL_TITLES),
+                            ("non_animal_title", NON_ANIMAL_TITLES)):
+        if argname in metafunc.fixturenames:
+            metafunc.parametrize(
+                argname, titles,
+                ids=[t.lower().replace(" ", "-") for t in titles],
+            )
+
+
 class TestIsAnimalRelated:
-    @pytest.mark.parametrize("title", [
-        "Cute puppy videos", "Lion documentary", "Zoo animals",
-        "Wildlife safari", "Pet care tips", "Shark attack footage",
-    ])
-    def test_animal_titles_detected(self, finder, title):
-        assert finder._is_animal_related(title) is True
+    def test_animal_titles_detected(self, finder, animal_title):
+        assert finder._is_animal_related(animal_title) is True
 
-    @pytest.mark.parametrize("title", [
-        "JavaScript tutorial", "Cooking pasta recipe",
-        "How to fix plumbing", "Stock market analysis",
-    ])
-    def test_non_animal_titles_not_detected(self, finder, title):
-        assert finder._is_animal_related(title) is False
+    def test_non_animal_titles_not_detected(self, finder, non_animal_title):
+        assert finder._is_animal_related(non_animal_title) is False
 
 
 # ---------------------------------------------------------------------------
@@ -188,25 +201,37 @@ class TestDisabledPaths:
 # Enabled paths with mocked YouTube API
 # ---------------------------------------------------------------------------
 
+_DEFAULT_VIDEOS = [{
+    "id": "abc12345678",
+    "title": "Safe Test Video",
+    "channel": "Test Channel",
+    "thumbnail": "https://img.youtube.com/vi/abc12345678/mqdefault.jpg",
+    "description": "A safe video",
+    "url": "https://www.youtube.com/watch?v=abc12345678",
+    "is_trusted": False,
+    "badge": "📚 Educational",
+}]
+
+
 class TestEnabledPaths:
-    def _mock_search(self, videos=None):
-        """Create an async mock for _search_youtube."""
-        if videos is None:
-            videos = [{
-                "id": "abc12345678",
-                "title": "Safe Test Video",
-                "channel": "Test Channel",
-                "thumbnail": "https://img.youtube.com/vi/abc12345678/mqdefault.jpg",
-                "description": "A safe video",
-                "url": "https://www.youtube.com/watch?v=abc12345678",
-                "is_trusted": False,
-                "badge": "📚 Educational",
-            }]
-        return AsyncMock(return_value=videos)
+    @staticmethod
+    def _mock_search(videos=_DEFAULT_VIDEOS):
+        """Create a stand-in coroutine function for _search_youtube.
+
+        A plain closure instead of AsyncMock: call history and spec are
+        never inspected here, so there is no need to build the mock graph.
+        """
+        async def fake_search(*args, **kwargs):
+            return videos
+        return fake_search
+
+    @staticmethod
+    async def _failing_search(*args, **kwargs):
+        raise Exception("API down")
 
     @pytest.mark.asyncio
     async def test_find_safe_alternatives_ai_content(self, finder_enabled):
-        with patch.object(finder_enabled, "_search_youtube", self._mock_search()):
+        with swap_attr(finder_enabled, "_search_youtube", self._mock_search()):
             result = await finder_enabled.find_safe_alternatives(
                 danger_categories=[],
                 original_title="Talking Parrot Amazing Video",
@@ -217,7 +242,7 @@ class TestEnabledPaths:
 
     @pytest.mark.asyncio
     async def test_find_safe_alternatives_danger_categories(self, finder_enabled):
-        with patch.object(finder_enabled, "_search_youtube", self._mock_search()):
+        with swap_attr(finder_enabled, "_search_youtube", self._mock_search()):
             result = await finder_enabled.find_safe_alternatives(
                 danger_categories=["medical", "cooking"],
                 original_title="Cure Cancer with Bleach",
@@ -247,7 +272,7 @@ class TestEnabledPaths:
             "is_trusted": False,
             "badge": "📚 Educational",
         }]
-        with patch.object(finder_enabled, "_search_youtube", AsyncMock(return_value=same_video)):
+        with swap_attr(finder_enabled, "_search_youtube", self._mock_search(same_video)):
             result = await finder_enabled.find_safe_alternatives(
                 danger_categories=["medical"],
                 original_title="Miracle Cure",
@@ -258,7 +283,7 @@ class TestEnabledPaths:
     @pytest.mark.asyncio
     async def test_search_error_fallback(self, finder_enabled):
         """Search errors should be caught — not crash."""
-        with patch.object(finder_enabled, "_search_youtube", AsyncMock(side_effect=Exception("API down"))):
+        with swap_attr(finder_enabled, "_search_youtube", self._failing_search):
             result = await finder_enabled.find_safe_alternatives(
                 danger_categories=["medical"],
                 original_title="Test",
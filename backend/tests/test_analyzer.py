@@ -1,40 +1,48 @@
+import copy
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import patch
 from types import SimpleNamespace
-from analyzer import SafetyAnalyzer
-from safety_db import SafetyDatabase
+from helpers import StubFetcher
 
 
-@pytest.fixture
+# Empty stand-in database, built once; fixtures hand out shallow copies.
+_PROTO_DB = SimpleNamespace(
+    signatures=[],
+    get_all_signatures=lambda: [],
+    categories={},
+    get_categories=lambda: {},
+    get_category_name=lambda cid: cid.replace("_", " ").title(),
+)
+
+
+@pytest.fixture(scope="module")
 def mock_safety_db():
-    db = MagicMock(spec=SafetyDatabase)
-    db.signatures = []
-    db.get_all_signatures.return_value = []
-    db.categories = {}
-    return db
+    return copy.copy(_PROTO_DB)
 
 
-@pytest.fixture
+# Module-scoped: SafetyAnalyzer keeps no per-call state between analyses
+@pytest.fixture(scope="module")
 def analyzer(mock_safety_db):
+    # Imported here, not at module top, so collection doesn't pull in the backend
+    from analyzer import SafetyAnalyzer
     return SafetyAnalyzer(mock_safety_db)
 
 
-def _make_fetcher_mock(title="Safe Video", description="", channel="TestChannel", tags=None):
-    """Create a properly mocked YouTubeDataFetcher that supports async with."""
-    mock_instance = AsyncMock()
-    mock_instance.get_video_metadata.return_value = SimpleNamespace(
+def _set_metadata(fetcher, title="Safe Video", description="", channel="TestChannel", tags=None):
+    """Point a (possibly already patched) stub fetcher at new video metadata."""
+    fetcher.metadata = SimpleNamespace(
         title=title,
         description=description,
         channel=channel,
         tags=tags or [],
     )
-    mock_instance.get_comments.return_value = []
 
-    # Support `async with YouTubeDataFetcher(...) as fetcher:`
-    mock_class = MagicMock()
-    mock_class.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-    mock_class.return_value.__aexit__ = AsyncMock(return_value=False)
-    return mock_class, mock_instance
+
+def _make_fetcher_mock(title="Safe Video", description="", channel="TestChannel", tags=None):
+    """Create a stub YouTubeDataFetcher; patched in as the class, it supports async with."""
+    fetcher = StubFetcher()
+    _set_metadata(fetcher, title, description, channel, tags)
+    return fetcher
 
 
 class TestSafetyAnalyzerPatterns:
@@ -72,90 +80,136 @@ class TestSafetyAnalyzerPatterns:
         assert self.analyzer._detect_dangerous_animal_child("Kid feeding ducks at park") is None
 
 
+@pytest.fixture(scope="class")
+def patched_fetcher(request):
+    """Patch the fetcher and transcript API once for a whole test class.
+
+    Exposes the fetcher instance as ``cls._mock_fetcher`` and the transcript
+    API instance as ``cls._mock_transcript``; tests only swap return values.
+    """
+    fetcher = _make_fetcher_mock()
+    with patch("analyzer.YouTubeDataFetcher", fetcher), \
+         patch("analyzer.YouTubeTranscriptApi") as mock_transcript_api:
+        request.cls._mock_fetcher = fetcher
+        request.cls._mock_transcript = mock_transcript_api.return_value
+        yield
+
+
+@pytest.mark.usefixtures("patched_fetcher")
 class TestSafetyAnalyzerFlow:
     @pytest.fixture(autouse=True)
-    def setup(self):
-        mock_db = MagicMock(spec=SafetyDatabase)
-        mock_db.get_all_signatures.return_value = []
-        mock_db.categories = {}
-        self.analyzer = SafetyAnalyzer(mock_db)
+    def setup(self, analyzer):
+        self.analyzer = analyzer
+        # Default: no transcript. Tests that need one override fetch.
+        self._mock_transcript.fetch.side_effect = Exception("No transcript")
 
     @pytest.mark.asyncio
     async def test_analyze_flow_safe(self):
-        mock_class, _ = _make_fetcher_mock(
+        _set_metadata(
+            self._mock_fetcher,
             title="Safe Video",
             description="Just a safe video",
             channel="SafeChannel",
             tags=["safe", "video"],
         )
+        mock_segment = SimpleNamespace(text="This is a safe video transcript content.")
+        self._mock_transcript.fetch.side_effect = None
+        self._mock_transcript.fetch.return_value = [mock_segment]
 
-        with patch("analyzer.YouTubeDataFetcher", mock_class):
-            with patch("analyzer.YouTubeTranscriptApi") as MockTranscriptApi:
-                mock_api_instance = MockTranscriptApi.return_value
-                mock_segment = MagicMock()
-                mock_segment.text = "This is a safe video transcript content."
-                mock_api_instance.fetch.return_value = [mock_segment]
-
-                result = await self.analyzer.analyze("safe_id_123")
+        result = await self.analyzer.analyze("safe_id_123")
 
-                assert result["safety_score"] >= 90
-                assert len(result["warnings"]) == 0
+        assert result["safety_score"] >= 90
+        assert len(result["warnings"]) == 0
 
     @pytest.mark.asyncio
     async def test_analyze_flow_dangerous(self):
-        mock_class, _ = _make_fetcher_mock(
+        _set_metadata(
+            self._mock_fetcher,
             title="Baby playing with cobra",
             description="So cute",
             channel="WildChannel",
             tags=["snake", "baby"],
         )
 
-        with patch("analyzer.YouTubeDataFetcher", mock_class):
-            with patch("analyzer.YouTubeTranscriptApi") as MockTranscriptApi:
-                mock_api_instance = MockTranscriptApi.return_value
-                mock_api_instance.fetch.side_effect = Exception("No transcript")
-
-                result = await self.analyzer.analyze("danger_id_123")
+        result = await self.analyzer.analyze("danger_id_123")
 
-                # Should have low score due to dangerous pattern
-                assert result["safety_score"] < 90
+        # Should have low score due to dangerous pattern
+        assert result["safety_score"] < 90
 
     @pytest.mark.asyncio
     async def test_trusted_channel_skips_ai_warnings(self):
         """Trusted channels should not trigger AI content warnings."""
-        mock_class, _ = _make_fetcher_mock(
+        _set_metadata(
+            self._mock_fetcher,
             title="Cat driving a car",
             description="Funny video",
             channel="National Geographic",
             tags=[],
         )
 
-        with patch("analyzer.YouTubeDataFetcher", mock_class):
-            with patch("analyzer.YouTubeTranscriptApi") as MockTranscriptApi:
-                mock_api_instance = MockTranscriptApi.return_value
-                mock_api_instance.fetch.side_effect = Exception("No transcript")
+        result = await self.analyzer.analyze("trusted_id_123")
 
-                result = await self.analyzer.analyze("trusted_id_123")
-
-                # Trusted channels should not flag AI content
-                ai_warnings = [w for w in result["warnings"] if w.get("category") == "AI Content"]
-                assert len(ai_warnings) == 0
+        # Trusted channels should not flag AI content
+        ai_warnings = [w for w in result["warnings"] if w.get("category") == "AI Content"]
+        assert len(ai_warnings) == 0
 
     @pytest.mark.asyncio
     async def test_no_api_key_uses_scraped_data(self):
         """When no API key, analyzer should use scraped metadata."""
-        mock_class, _ = _make_fetcher_mock()
+        _set_metadata(self._mock_fetcher)
+
+        result = await self.analyzer.analyze(
+            "test_id",
+            scraped_title="My test video",
+            scraped_channel="TestChannel",
+        )
+
+        assert "safety_score" in result
+        assert "warnings" in result
+
+    @pytest.mark.asyncio
+    async def test_transcript_cached_per_video(self):
+        """A video's transcript is downloaded once; failures are retried."""
+        assert await self.analyzer._get_transcript("cache_id_01") == ("", False)
 
-        with patch("analyzer.YouTubeDataFetcher", mock_class):
-            with patch("analyzer.YouTubeTranscriptApi") as MockTranscriptApi:
-                mock_api_instance = MockTranscriptApi.return_value
-                mock_api_instance.fetch.side_effect = Exception("No transcript")
+        segment = SimpleNamespace(text="Cached Transcript")
+        self._mock_transcript.fetch.side_effect = None
+        self._mock_transcript.fetch.return_value = [segment]
+        self._mock_transcript.fetch.reset_mock()
 
-                result = await self.analyzer.analyze(
-                    "test_id",
-                    scraped_title="My test video",
-                    scraped_channel="TestChannel",
-                )
+        first = await self.analyzer._get_transcript("cache_id_01")
+        second = await self.analyzer._get_transcript("cache_id_01")
 
-                assert "safety_score" in result
-                assert "warnings" in result
+        assert first == second == ("cached transcript", True)
+        assert self._mock_transcript.fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_transcript_expires(self):
+        """Captions added after the first fetch are picked up once the entry expires."""
+        self._mock_transcript.fetch.side_effect = None
+        self._mock_transcript.fetch.return_value = [SimpleNamespace(text="Expiring")]
+        self._mock_transcript.fetch.reset_mock()
+
+        with patch.object(self.analyzer._transcript_cache, "ttl", -1):
+            await self.analyzer._get_transcript("cache_id_02")
+            await self.analyzer._get_transcript("cache_id_02")
+
+        assert self._mock_transcript.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_signature_scans_run_off_event_loop(self):
+        """CPU-bound signature scans run on the scan pool, not the loop thread."""
+        import threading
+        _set_metadata(self._mock_fetcher, title="Some title", description="Some description")
+        scan_threads = []
+        original = self.analyzer._match_signatures
+
+        def recording_match(text):
+            scan_threads.append(threading.current_thread().name)
+            return original(text)
+
+        with patch.object(self.analyzer, "_match_signatures", recording_match):
+            await self.analyzer.analyze("thread_id_01")
+
+        assert scan_threads
+        assert all(name.startswith("signature-scan") for name in scan_threads)
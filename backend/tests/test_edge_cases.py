@@ -22,60 +22,99 @@ Coverage map (items NOT covered by existing tests):
  10. Dangerous-animal-child boundary — safe scenarios vs dangerous
 """
 
+import copy
 import pytest
 import re
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import patch
 from types import SimpleNamespace
-
-from analyzer import SafetyAnalyzer, BASE_SCORE, DEFAULT_SAFE_SCORE
-from safety_db import SafetyDatabase
+from helpers import StubFetcher
 
 
 # ---------------------------------------------------------------------------
 #  Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def real_safety_db():
-    """Load the REAL safety database (signatures + categories) from disk."""
-    return SafetyDatabase()   # uses default path
+@pytest.fixture(scope="module")
+def substring_analyzer(real_analyzer):
+    """Copy of the shared analyzer on the substring fallback (no phrase automaton).
+
+    The shared instance itself is never modified. Use the uncached _scan_*
+    cores with it: the memo caches still belong to the shared instance.
+    """
+    analyzer = copy.copy(real_analyzer)
+    analyzer._phrase_automaton = None
+    return analyzer
 
 
-@pytest.fixture
-def real_analyzer(real_safety_db):
-    """Analyzer backed by the full production signature set."""
-    return SafetyAnalyzer(real_safety_db)
+# Minimal stand-in DB — no signatures loaded. A plain namespace rather than
+# MagicMock(spec=SafetyDatabase): the analyzer only touches these five
+# attributes. Built once at import; fixtures return shallow copies.
+_PROTO_DB = SimpleNamespace(
+    signatures=[],
+    get_all_signatures=lambda: [],
+    categories={},
+    get_categories=lambda: {},
+    get_category_name=lambda cid: cid.replace("_", " ").title(),
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_safety_db():
-    """Minimal mock DB — no signatures loaded."""
-    db = MagicMock(spec=SafetyDatabase)
-    db.signatures = []
-    db.get_all_signatures.return_value = []
-    db.categories = {}
-    db.get_categories.return_value = {}
-    db.get_category_name.side_effect = lambda cid: cid.replace("_", " ").title()
-    return db
+    """Minimal stand-in DB — no signatures loaded."""
+    return copy.copy(_PROTO_DB)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bare_analyzer(mock_safety_db):
-    """Analyzer with no signatures — tests built-in heuristic patterns."""
+    """Analyzer with no signatures — tests built-in heuristic patterns.
+
+    Module-scoped: the analyzer holds no per-call state, so one instance
+    serves every test here.
+    """
+    # Backend modules are imported lazily so `-k` runs that skip the analyzer
+    # tests don't pay for them at collection time.
+    from analyzer import SafetyAnalyzer
     return SafetyAnalyzer(mock_safety_db)
 
 
-def _make_fetcher_mock(title="Safe Video", description="", channel="TestChannel", tags=None):
-    """Build a mock YouTubeDataFetcher that works with `async with`."""
-    mock_instance = AsyncMock()
-    mock_instance.get_video_metadata.return_value = SimpleNamespace(
+class _NoTranscriptApi:
+    """Stand-in for YouTubeTranscriptApi whose fetch() always fails.
+
+    Patched in as the class itself, so the analyzer's
+    ``YouTubeTranscriptApi().fetch(...)`` call hits this directly with no
+    MagicMock attribute proxies in between.
+    """
+
+    def fetch(self, *args, **kwargs):
+        raise Exception("no transcript")
+
+
+def _set_metadata(fetcher, title="Safe Video", description="", channel="TestChannel", tags=None):
+    """Point a (possibly already patched) stub fetcher at new video metadata."""
+    fetcher.metadata = SimpleNamespace(
         title=title, description=description, channel=channel, tags=tags or [],
     )
-    mock_instance.get_comments.return_value = []
-    mock_class = MagicMock()
-    mock_class.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-    mock_class.return_value.__aexit__ = AsyncMock(return_value=False)
-    return mock_class, mock_instance
+
+
+def _make_fetcher_mock(title="Safe Video", description="", channel="TestChannel", tags=None):
+    """Build a stub YouTubeDataFetcher (patch it in as the class) with no comments."""
+    fetcher = StubFetcher()
+    _set_metadata(fetcher, title, description, channel, tags)
+    return fetcher
+
+
+@pytest.fixture(scope="class")
+def patched_fetcher(request):
+    """Patch the fetcher once for a whole test class, with no transcript.
+
+    Exposes the fetcher instance as ``cls._mock_fetcher``; tests only swap
+    the metadata via _set_metadata().
+    """
+    fetcher = _make_fetcher_mock()
+    with patch("analyzer.YouTubeDataFetcher", fetcher), \
+         patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
+        request.cls._mock_fetcher = fetcher
+        yield
 
 
 # ===================================================================
@@ -165,6 +204,21 @@ class TestMetadataSignatureMatching:
                     f"(got weight={m.get('match_weight', '?')})"
                 )
 
+    def test_co_occurrence_fast_path_agrees_with_substring_checks(self, real_analyzer, substring_analyzer):
+        """Term lookups via the phrase automaton + frozenset prefilter give
+        the same reasons as scanning each term with a substring check."""
+        pytest.importorskip("ahocorasick")
+        descriptions = [
+            "astrology predictions for mercury retrograde revenge on your enemy destroy toxic people",
+            "zodiac tarot astrology horoscope virgo scorpio gemini",
+            "a relaxing cooking stream with no astrology at all",
+        ]
+        scan = lambda a, d: [m['all_reasons'] for m in a._scan_metadata_signatures(
+            "video", d, "somechannel", "", len(a.signatures))]
+        fast = [scan(real_analyzer, d) for d in descriptions]
+        slow = [scan(substring_analyzer, d) for d in descriptions]
+        assert fast == slow
+
     # ---- Channel signals ----
 
     def test_known_bad_channel_strong_signal(self, real_analyzer):
@@ -208,36 +262,33 @@ class TestMetadataSignatureMatching:
 #  2. SCORE CAPPING — metadata matches enforce score ceiling
 # ===================================================================
 
+@pytest.mark.usefixtures("patched_fetcher")
 class TestScoreCapping:
     """Verify that metadata signature matches cap the safety score."""
 
     @pytest.mark.asyncio
     async def test_high_severity_metadata_caps_score(self, real_analyzer):
         """High severity metadata match should cap score ≤ 45."""
-        mock_class, _ = _make_fetcher_mock(
+        _set_metadata(
+            self._mock_fetcher,
             title="Zodiac revenge guide — destroy your enemy",
             description="astrology tarot zodiac revenge punishment",
             channel="Sacred Taro UA",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
-            result = await real_analyzer.analyze("cap_test_1")
+        result = await real_analyzer.analyze("cap_test_1")
         assert result["safety_score"] <= 45, \
             f"High-severity metadata should cap score ≤45, got {result['safety_score']}"
 
     @pytest.mark.asyncio
     async def test_metadata_match_beats_default_safe(self, real_analyzer):
         """Even with no transcript/comments, metadata match should NOT default to 95."""
-        mock_class, _ = _make_fetcher_mock(
+        _set_metadata(
+            self._mock_fetcher,
             title="Tartaria truth hidden history",
             description="global elites cabal new world order",
             channel="TruthSeeker",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
-            result = await real_analyzer.analyze("cap_test_2")
+        result = await real_analyzer.analyze("cap_test_2")
         assert result["safety_score"] < 70, \
             f"Metadata match should suppress default-safe; got {result['safety_score']}"
 
@@ -260,6 +311,48 @@ class TestEvidenceGeneration:
         types = [e['type'] for e in evidence]
         assert 'channel' in types, f"Evidence should include channel type; got {types}"
 
+    def test_repeat_calls_return_independent_copies(self, real_analyzer):
+        """Results are memoized; mutating one result must not leak into the next."""
+        kwargs = dict(title="All zodiac signs", description="zodiac tarot", channel="Sacred Taro UA")
+        first = real_analyzer._match_metadata_signatures(**kwargs)
+        first[0]['signature']['evidence'].clear()
+        first[0]['all_reasons'].append("mutated")
+        second = real_analyzer._match_metadata_signatures(**kwargs)
+        assert second[0]['signature']['evidence']
+        assert "mutated" not in second[0]['all_reasons']
+
+    def test_repeat_calls_hit_the_memo_cache(self, real_analyzer):
+        """Identical (title, description, channel) inputs are scanned once."""
+        kwargs = dict(title="Memo check: zodiac revenge", description="zodiac tarot", channel="Memo UA")
+        real_analyzer._match_metadata_signatures(**kwargs)
+        hits = real_analyzer._metadata_match_cache.hits
+        real_analyzer._match_metadata_signatures(**kwargs)
+        assert real_analyzer._metadata_match_cache.hits == hits + 1
+
+    def test_cache_hits_still_log_matches(self, real_analyzer, caplog):
+        kwargs = dict(title="Log check: zodiac revenge", description="zodiac tarot", channel="Log UA")
+        for _ in range(2):
+            caplog.clear()
+            with caplog.at_level("INFO", logger="analyzer"):
+                real_analyzer._match_metadata_signatures(**kwargs)
+                real_analyzer._detect_title_red_flags("Log check: cure cancer naturally with herbs")
+            assert "Metadata signature match" in caplog.text
+            assert "Title red flag" in caplog.text
+
+    def test_memo_caches_do_not_keep_the_analyzer_alive(self, safety_db):
+        import gc
+        import weakref
+        from analyzer import SafetyAnalyzer
+        analyzer = SafetyAnalyzer(safety_db)
+        analyzer._match_metadata_signatures("zodiac revenge", "zodiac tarot", "UA")
+        ref = weakref.ref(analyzer)
+        gc.disable()
+        try:
+            del analyzer
+            assert ref() is None  # Freed by refcounting, no cycle collection needed
+        finally:
+            gc.enable()
+
     def test_evidence_includes_title(self, real_analyzer):
         # NOTE: "How Scorpio takes revenge" does NOT match any title_patterns
         # because patterns use "zodiac.*revenge" not "scorpio.*revenge".
@@ -322,14 +415,13 @@ class TestDebunkingFlow:
 
     @pytest.mark.asyncio
     async def test_debunk_searches_returned_for_occult(self, real_analyzer):
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="How your zodiac sign takes revenge",
             description="zodiac tarot spiritual astrology revenge destroy manipulation",
             channel="Sacred Taro UA",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze("debunk_test_1")
 
         assert result.get("debunk_searches"), \
@@ -340,14 +432,13 @@ class TestDebunkingFlow:
 
     @pytest.mark.asyncio
     async def test_matched_metadata_categories_populated(self, real_analyzer):
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="Tartaria — the hidden empire",
             description="cabal new world order global elites",
             channel="TruthRevealed",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze("debunk_test_2")
 
         cats = result.get("matched_metadata_categories", [])
@@ -356,14 +447,14 @@ class TestDebunkingFlow:
 
     @pytest.mark.asyncio
     async def test_safe_video_has_no_debunk_searches(self, real_analyzer):
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="How to bake chocolate chip cookies",
             description="Easy recipe for beginners",
             channel="BakingWithJen",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
              patch("analyzer.YouTubeTranscriptApi") as MockT:
-            mock_seg = MagicMock(); mock_seg.text = "mix flour sugar eggs butter"
+            mock_seg = SimpleNamespace(text="mix flour sugar eggs butter")
             MockT.return_value.fetch.return_value = [mock_seg]
             result = await real_analyzer.analyze("debunk_test_3")
 
@@ -407,6 +498,21 @@ class TestEvasionTechniques:
         cats = [m['signature']['category'] for m in matches]
         assert 'occult_manipulation' in cats
 
+    @pytest.mark.parametrize("title", [
+        "zodiac r\u200be\u200bv\u200be\u200bn\u200bg\u200be guide",
+        "zodiac r\u0435v\u0435ng\u0435 guide",
+        "\uff5a\uff4f\uff44\uff49\uff41\uff43 revenge",
+    ], ids=["zero-width", "homoglyph", "fullwidth"])
+    def test_obfuscated_title_alone_still_matches(self, real_analyzer, title):
+        """Title patterns run on canonicalized text, so evasion in the title
+        alone (no helpful description) no longer hides the keyword."""
+        matches = real_analyzer._match_metadata_signatures(
+            title=title, description="", channel="X",
+        )
+        occult = [m for m in matches if m['signature']['category'] == 'occult_manipulation']
+        assert occult, "Obfuscated title should be canonicalized before matching"
+        assert any(r.startswith("Title matches pattern") for r in occult[0]['all_reasons'])
+
     # --- Emoji substitution ---
 
     def test_emoji_only_title_evasion(self, real_analyzer):
@@ -527,6 +633,20 @@ class TestEvasionTechniques:
         assert 'occult_manipulation' in cats, \
             "Channel matching should be case-insensitive"
 
+    @pytest.mark.parametrize("channel", [
+        "  Sacred Taro UA ",
+        "Sacred T\u0430ro UA",
+        "Sacred\u200b Taro UA",
+    ], ids=["padded", "homoglyph", "zero-width"])
+    def test_disguised_known_bad_channel(self, real_analyzer, channel):
+        """Known-bad channels are compared in canonical form, so lookalike
+        letters and invisible characters don't dodge the channel signal."""
+        matches = real_analyzer._match_metadata_signatures(
+            title="Daily horoscope", description="", channel=channel,
+        )
+        evidence = [ev for m in matches for ev in m['signature']['evidence']]
+        assert {'type': 'channel', 'label': 'Flagged channel', 'value': 'Sacred Taro UA'} in evidence
+
 
 # ===================================================================
 #  6. FALSE POSITIVE GUARD-RAILS
@@ -599,14 +719,14 @@ class TestFalsePositiveGuardRails:
     @pytest.mark.asyncio
     async def test_safe_video_high_score(self, real_analyzer):
         """End-to-end: completely safe video should score ≥ 85."""
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="How to tie a tie — 4 Easy Knots",
             description="Step by step tie tutorial for beginners",
             channel="Style Tips",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
              patch("analyzer.YouTubeTranscriptApi") as MockT:
-            seg = MagicMock(); seg.text = "start with the wide end on the right"
+            seg = SimpleNamespace(text="start with the wide end on the right")
             MockT.return_value.fetch.return_value = [seg]
             result = await real_analyzer.analyze("safe_video_1")
         assert result["safety_score"] >= 85, \
@@ -694,6 +814,16 @@ class TestTitleRedFlags:
         assert any("financial" in f.get("category", "").lower() for f in flags), \
             f"Crypto scam should trigger financial red flag; got {flags}"
 
+    @pytest.mark.parametrize("title", [
+        "How to cur\u200be cancer naturally",
+        "How to cur\u0435 canc\u0435r naturally",
+        "How to \uff43\uff55\uff52\uff45 cancer naturally",
+    ], ids=["zero-width", "homoglyph", "fullwidth"])
+    def test_obfuscated_title_still_flagged(self, real_analyzer, title):
+        flags = real_analyzer._detect_title_red_flags(title=title)
+        assert any("medical" in f.get("category", "").lower() for f in flags), \
+            f"Obfuscated 'cure cancer' should still trigger medical red flag; got {flags}"
+
     def test_deep_fry_ice_detected(self, real_analyzer):
         flags = real_analyzer._detect_title_red_flags(
             title="Deep frying a frozen turkey",
@@ -744,6 +874,109 @@ class TestSignatureMatching:
         assert not overlap, \
             f"_match_signatures should skip metadata signatures; got overlap: {overlap}"
 
+    def test_phrase_automaton_agrees_with_substring_checks(self, real_analyzer, substring_analyzer):
+        """The Aho-Corasick fast path must pick the same trigger and apply the
+        same exclusions as the plain substring fallback."""
+        pytest.importorskip("ahocorasick")
+        texts = [
+            "so what you want to do is mix bleach and ammonia together",
+            "never mix bleach with vinegar because it creates toxic gas. don't mix these chemicals.",
+            "today we are making a simple pasta dinner",
+        ]
+        scan = lambda a, t: a._scan_signatures(t, len(a.signatures))
+        fast = [scan(real_analyzer, t) for t in texts]
+        slow = [scan(substring_analyzer, t) for t in texts]
+        key = lambda ms: [(m['signature'].get('id'), m['matched_trigger']) for m in ms]
+        assert [key(m) for m in fast] == [key(m) for m in slow]
+        assert key(fast[0]), "bleach+ammonia should match on the fast path"
+
+    def test_danger_pattern_wildcards_are_bounded(self):
+        """Unbounded .* / .+ in danger patterns are capped so chained wildcards
+        can't backtrack across a whole transcript."""
+        from analyzer import MAX_PATTERN_GAP, _compile_signature_pattern
+        compiled = _compile_signature_pattern(r"kid.*(without|no).+(seatbelt|restraint)", bound_gaps=True)
+        assert compiled.pattern == (
+            f"kid.{{0,{MAX_PATTERN_GAP}}}(without|no).{{1,{MAX_PATTERN_GAP}}}(seatbelt|restraint)"
+        )
+        assert compiled.search("kid with no seatbelt")
+        assert not compiled.search("kid " + "x" * (MAX_PATTERN_GAP + 1) + " no seatbelt")
+        # Escaped dots and dots inside character classes are literal and left alone
+        for pattern in (r"v1\.*x", r"[.*]x", r"[^].*]x", r"[\].*]x"):
+            assert _compile_signature_pattern(pattern, bound_gaps=True).pattern == pattern
+        assert _compile_signature_pattern(r"[]]x.*y", bound_gaps=True).pattern == (
+            f"[]]x.{{0,{MAX_PATTERN_GAP}}}y"
+        )
+
+    def test_title_pattern_wildcards_are_not_bounded(self, real_analyzer):
+        """Title patterns run on short text and keep their full reach."""
+        from analyzer import MAX_PATTERN_GAP, _compile_signature_pattern
+        assert _compile_signature_pattern(r"zodiac.*revenge").pattern == r"zodiac.*revenge"
+        title = "zodiac " + "x" * (MAX_PATTERN_GAP + 20) + " revenge"
+        matches = real_analyzer._match_metadata_signatures(title=title, description="", channel="")
+        reasons = [r for m in matches for r in m['all_reasons']]
+        assert any(r.startswith("Title matches pattern: ") for r in reasons)
+
+    def test_plain_phrase_patterns_use_substring_path(self):
+        """Plain ASCII phrases skip re; anything with regex syntax does not."""
+        from analyzer import _literal_phrase
+        assert _literal_phrase("New World Order") == "new world order"
+        assert _literal_phrase(r"zodiac.*revenge") is None
+        assert _literal_phrase("таро") is None
+
+    def test_invalid_signature_regex_is_skipped(self, mock_safety_db):
+        """A malformed pattern in the DB must not break matching of the others."""
+        from analyzer import SafetyAnalyzer
+        sigs = [
+            {"category": "diy", "danger_signatures": [
+                {"id": "broken", "pattern": "(unclosed"},
+                {"id": "ok", "pattern": r"angle\s+grinder"},
+            ]},
+            {"category": "occult_manipulation",
+             "title_patterns": ["[bad", "tarot.{0,20}revenge"],
+             "description_patterns": ["(bad"]},
+        ]
+        db = copy.copy(mock_safety_db)
+        db.get_all_signatures = lambda: sigs
+        analyzer = SafetyAnalyzer(db)
+
+        ids = [m['signature']['id'] for m in analyzer._match_signatures("angle grinder hack")]
+        assert ids == ["ok"]
+
+        matches = analyzer._match_metadata_signatures(
+            title="Tarot spell for revenge", description="(bad luck", channel="x"
+        )
+        assert len(matches) == 1
+        assert matches[0]['match_weight'] == 5  # title (3) + description fallback (2)
+
+    def test_patterns_that_cannot_be_joined_are_matched_one_by_one(self, mock_safety_db):
+        """Patterns valid on their own but not in one union (inline flags,
+        repeated group names, backreferences) must not break matching."""
+        from analyzer import SafetyAnalyzer, _compile_pattern_union
+        assert _compile_pattern_union(("foo", "(?i)bleach")) is None
+        assert _compile_pattern_union((r"(?P<x>tarot)", r"(?P<x>zodiac)")) is None
+        assert _compile_pattern_union((r"(\w+) \1 drill",)) is None
+        sigs = [
+            {"category": "chemical", "danger_signatures": [
+                {"id": "foo", "pattern": "foo"},
+                {"id": "flagged", "pattern": "(?i)bleach"},
+            ]},
+            {"category": "occult_manipulation",
+             "title_patterns": [r"(?P<x>tarot).{0,20}revenge", r"(?P<x>zodiac).{0,20}revenge"],
+             "description_patterns": [r"(hex) \1"]},
+        ]
+        db = copy.copy(mock_safety_db)
+        db.get_all_signatures = lambda: sigs
+        analyzer = SafetyAnalyzer(db)
+
+        ids = [m['signature']['id'] for m in analyzer._match_signatures("drink bleach")]
+        assert ids == ["flagged"]
+
+        matches = analyzer._match_metadata_signatures(
+            title="Zodiac spell for revenge", description="hex hex your ex", channel="x"
+        )
+        assert len(matches) == 1
+        assert matches[0]['match_weight'] == 5  # title (3) + description (2)
+
 
 # ===================================================================
 #  9. IMPOSSIBLE CONTENT DETECTION — edge cases
@@ -874,14 +1107,13 @@ class TestFullPipelineEdgeCases:
     @pytest.mark.asyncio
     async def test_ai_content_with_trusted_channel(self, real_analyzer):
         """Trusted channel with AI-like title should NOT get AI warnings."""
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="Parrot talks to owner — amazing vocabulary!",
             description="Watch this parrot's incredible vocabulary",
             channel="National Geographic",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze("trusted_1")
 
         ai_warnings = [w for w in result["warnings"] if w.get("category") == "AI Content"]
@@ -891,14 +1123,13 @@ class TestFullPipelineEdgeCases:
     @pytest.mark.asyncio
     async def test_multiple_danger_categories(self, real_analyzer):
         """Video that hits MULTIPLE danger categories at once."""
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="Mix bleach and ammonia to cure cancer — doctors hate this!",
             description="secret cure medical establishment hiding",
             channel="TruthHealth",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze("multi_danger_1")
 
         assert result["safety_score"] < 50, \
@@ -909,14 +1140,13 @@ class TestFullPipelineEdgeCases:
     @pytest.mark.asyncio
     async def test_uncertainty_cap_no_data(self, real_analyzer):
         """No transcript + no comments + no title flags → uncertainty cap at 72."""
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="Some random video",
             description="Nothing special here",
             channel="RandomChannel",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             # Mock comments to return nothing
             result = await real_analyzer.analyze("uncertain_1")
 
@@ -926,17 +1156,11 @@ class TestFullPipelineEdgeCases:
     @pytest.mark.asyncio
     async def test_scraped_data_fallback(self, real_analyzer):
         """When API fetch fails, scraped data should still work."""
-        # Make the fetcher mock raise an exception on metadata fetch
-        mock_instance = AsyncMock()
-        mock_instance.get_video_metadata.side_effect = Exception("API error")
-        mock_instance.get_comments.return_value = []
-        mock_class = MagicMock()
-        mock_class.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-        mock_class.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        # Make the fetcher raise an exception on metadata fetch
+        fetcher = StubFetcher(metadata=Exception("API error"))
+
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze(
                 "fallback_1",
                 scraped_title="Mix bleach and ammonia challenge",
@@ -949,16 +1173,10 @@ class TestFullPipelineEdgeCases:
     @pytest.mark.asyncio
     async def test_empty_everything(self, real_analyzer):
         """Full pipeline with absolutely no data available."""
-        mock_instance = AsyncMock()
-        mock_instance.get_video_metadata.return_value = None
-        mock_instance.get_comments.return_value = []
-        mock_class = MagicMock()
-        mock_class.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-        mock_class.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        fetcher = StubFetcher(metadata=None)
+
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze("empty_1")
 
         assert "safety_score" in result
@@ -973,10 +1191,15 @@ class TestScoringEdgeCases:
     """Test the scoring math in isolation."""
 
     def test_no_matches_gives_default(self, bare_analyzer):
+        from analyzer import DEFAULT_SAFE_SCORE
         score = bare_analyzer._calculate_safety_score([], {})
         assert score == DEFAULT_SAFE_SCORE
+        # Category scores only matter once something matched
+        categories = {'DIY Safety': {'score': 10, 'flagged': False, 'emoji': '🔧'}}
+        assert bare_analyzer._calculate_safety_score([], categories) == DEFAULT_SAFE_SCORE
 
     def test_single_high_severity_penalty(self, bare_analyzer):
+        from analyzer import BASE_SCORE, DEFAULT_SAFE_SCORE
         matches = [{'signature': {'severity': 'high'}}]
         score = bare_analyzer._calculate_safety_score(matches, {})
         assert score < DEFAULT_SAFE_SCORE
@@ -1049,14 +1272,13 @@ class TestVRPRegression:
         CPAxvU-rMik — "Как мстит Дева ♍" by Sacred Taro UA.
         This was the original bug: scored 98/100 (safe) when it should be ~30.
         """
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="Как мстит Дева ♍",
             description="zodiac signs revenge horoscope tarot",
             channel="Sacred Taro UA",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze("CPAxvU-rMik")
 
         assert result["safety_score"] <= 45, \
@@ -1155,6 +1377,22 @@ class TestNonLatinScriptDetection:
         assert 'spiritual_wellness_extremism' in cats, \
             f"Cyrillic spiritual content should be caught; got {cats}"
 
+    def test_hint_fast_path_agrees_with_substring_checks(self, real_analyzer, substring_analyzer):
+        """Hints found via the phrase automaton count only inside the title
+        and description, exactly like the substring fallback."""
+        pytest.importorskip("ahocorasick")
+        videos = [
+            ("Тартария — скрытая империя", "скрытая история тартария", ""),
+            ("Рецепт борща", "как приготовить вкусный суп", "tartaria"),
+            ("Рецепт борща", "как приготовить суп tarot", ""),
+        ]
+        scan = lambda a, v: [m['all_reasons'] for m in a._scan_metadata_signatures(
+            v[0].lower(), v[1].lower(), "x", v[2], len(a.signatures))]
+        fast = [scan(real_analyzer, v) for v in videos]
+        slow = [scan(substring_analyzer, v) for v in videos]
+        assert fast == slow
+        assert fast[0] and not fast[1]
+
     def test_non_latin_without_category_hints_no_match(self, real_analyzer):
         """Non-Latin content that has zero category hints should NOT be flagged.
         We don't want to flag ALL non-English content — only content with signals."""
@@ -1282,14 +1520,13 @@ class TestRealWorldEvasion:
     @pytest.mark.asyncio
     async def test_multi_category_extremism(self, real_analyzer):
         """Content that spans multiple extremism categories."""
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="Tartaria truth: hidden by the cabal — astrology reveals the timeline",
             description="zodiac astrology tartaria new world order cabal revenge hidden history",
             channel="ConspiracyHub",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
-             patch("analyzer.YouTubeTranscriptApi") as MockT:
-            MockT.return_value.fetch.side_effect = Exception("no transcript")
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
+             patch("analyzer.YouTubeTranscriptApi", _NoTranscriptApi):
             result = await real_analyzer.analyze("multi_extremism_1")
 
         cats = result.get("matched_metadata_categories", [])
@@ -1300,14 +1537,14 @@ class TestRealWorldEvasion:
     @pytest.mark.asyncio
     async def test_benign_zodiac_horoscope_high_score(self, real_analyzer):
         """A normal daily horoscope with no harm language should score high."""
-        mock_class, _ = _make_fetcher_mock(
+        fetcher = _make_fetcher_mock(
             title="Daily Horoscope — What the Stars Say for February 23",
             description="Check your zodiac sign's daily prediction. Love, career, and wellness.",
             channel="Daily Horoscope",
         )
-        with patch("analyzer.YouTubeDataFetcher", mock_class), \
+        with patch("analyzer.YouTubeDataFetcher", fetcher), \
              patch("analyzer.YouTubeTranscriptApi") as MockT:
-            seg = MagicMock(); seg.text = "today aries will find new opportunities in love"
+            seg = SimpleNamespace(text="today aries will find new opportunities in love")
             MockT.return_value.fetch.return_value = [seg]
             result = await real_analyzer.analyze("benign_zodiac_1")
 
@@ -1,20 +1,7 @@
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import patch
 from types import SimpleNamespace
-from httpx import AsyncClient, ASGITransport
-from main import app
-
-
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.fixture
-async def client():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+from helpers import StubFetcher
 
 
 class TestHealthEndpoint:
@@ -36,22 +23,15 @@ class TestHealthEndpoint:
 
 class TestAnalyzeEndpoint:
     def _make_fetcher_mock(self, title="Test", description="", channel="Ch", tags=None):
-        mock_instance = AsyncMock()
-        mock_instance.get_video_metadata.return_value = SimpleNamespace(
+        return StubFetcher(SimpleNamespace(
             title=title, description=description,
             channel=channel, tags=tags or [], category="22",
-        )
-        mock_instance.get_comments.return_value = []
-        mock_class = MagicMock()
-        mock_class.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-        mock_class.return_value.__aexit__ = AsyncMock(return_value=False)
-        return mock_class
+        ))
 
     @pytest.mark.asyncio
     async def test_analyze_valid_video(self, client):
         mock_class = self._make_fetcher_mock(title="Safe Video")
-        mock_segment = MagicMock()
-        mock_segment.text = "This is a safe transcript."
+        mock_segment = SimpleNamespace(text="This is a safe transcript.")
 
         with patch("analyzer.YouTubeDataFetcher", mock_class):
             with patch("analyzer.YouTubeTranscriptApi") as MockTranscript:
@@ -122,6 +102,16 @@ class TestSignaturesEndpoint:
         data = response.json()
         assert isinstance(data, dict)
 
+    @pytest.mark.asyncio
+    async def test_static_payloads_revalidate_with_etag(self, client):
+        for path in ("/signatures", "/categories"):
+            first = await client.get(path)
+            etag = first.headers["etag"]
+            assert first.headers["content-type"] == "application/json"
+            second = await client.get(path, headers={"If-None-Match": etag})
+            assert second.status_code == 304
+            assert second.headers["etag"] == etag
+
 
 class TestInputValidation:
     @pytest.mark.asyncio
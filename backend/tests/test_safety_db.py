@@ -2,70 +2,76 @@ import pytest
 from safety_db import SafetyDatabase
 
 
+# Built-in default signatures, built once at collection for parametrization
+_DEFAULTS = SafetyDatabase.__new__(SafetyDatabase)._get_default_signatures()
+_VALID_SEVERITIES = {"low", "medium", "high", "critical"}
+
+per_default_signature = pytest.mark.parametrize("sig", _DEFAULTS, ids=lambda s: s.get("id", "?"))
+
+
 @pytest.fixture
-def db():
+def fresh_db():
+    """A freshly loaded database, for tests that add signatures."""
     return SafetyDatabase()
 
 
-def test_safety_db_initialization(db):
-    assert db.signatures is not None
-    assert db.categories is not None
-    assert len(db.categories) > 0
-    assert isinstance(db.signatures, list)
+def test_safety_db_initialization(safety_db):
+    assert safety_db.signatures is not None
+    assert safety_db.categories is not None
+    assert len(safety_db.categories) > 0
+    assert isinstance(safety_db.signatures, list)
 
 
-def test_get_categories(db):
-    categories = db.get_categories()
+def test_get_categories(safety_db):
+    categories = safety_db.get_categories()
     assert isinstance(categories, dict)
     assert len(categories) > 0
 
 
-def test_get_all_signatures(db):
-    signatures = db.get_all_signatures()
+def test_get_all_signatures(safety_db):
+    signatures = safety_db.get_all_signatures()
     assert isinstance(signatures, list)
 
 
-def test_default_signatures_have_required_fields():
+@per_default_signature
+def test_default_signature_required_fields(sig):
     """Default signatures must have the minimum required fields."""
-    db = SafetyDatabase.__new__(SafetyDatabase)
-    defaults = db._get_default_signatures()
     required = ["id", "category", "severity", "triggers", "warning_message"]
-    for sig in defaults:
-        for field in required:
-            assert field in sig, f"Signature {sig.get('id', '?')} missing field '{field}'"
+    missing = [field for field in required if field not in sig]
+    assert not missing, f"Signature {sig.get('id', '?')} missing fields {missing}"
 
 
-def test_get_signatures_by_category(db):
+def test_get_signatures_by_category(safety_db):
     """Filtering by category should only return matching signatures."""
     # Get a category we know exists from defaults
-    if not db.signatures:
+    if not safety_db.signatures:
         pytest.skip("No signatures loaded")
-    first_category = db.signatures[0]["category"]
-    filtered = db.get_signatures_by_category(first_category)
+    first_category = safety_db.signatures[0]["category"]
+    filtered = safety_db.get_signatures_by_category(first_category)
     assert len(filtered) >= 1
     for sig in filtered:
         assert sig["category"] == first_category
 
 
-def test_get_signatures_by_nonexistent_category(db):
-    result = db.get_signatures_by_category("nonexistent_category_xyz")
+def test_get_signatures_by_nonexistent_category(safety_db):
+    result = safety_db.get_signatures_by_category("nonexistent_category_xyz")
     assert result == []
 
 
-def test_get_category_name(db):
+def test_get_category_name(safety_db):
     """Should return display name for known categories."""
     # Default categories include 'fitness'
-    name = db.get_category_name("fitness")
+    name = safety_db.get_category_name("fitness")
     assert name == "Fitness"
 
 
-def test_get_category_name_unknown(db):
+def test_get_category_name_unknown(safety_db):
     """Unknown categories should return title-cased ID."""
-    name = db.get_category_name("unknown_thing")
+    name = safety_db.get_category_name("unknown_thing")
     assert name == "Unknown_Thing"
 
 
-def test_add_signature_valid(db):
+def test_add_signature_valid(fresh_db):
     new_sig = {
         "id": "test-001",
         "category": "test",
@@ -73,44 +79,50 @@ def test_add_signature_valid(db):
         "severity": "low",
         "warning_message": "Test warning",
     }
-    count_before = len(db.signatures)
-    result = db.add_signature(new_sig)
+    count_before = len(fresh_db.signatures)
+    result = fresh_db.add_signature(new_sig)
     assert result is True
-    assert len(db.signatures) == count_before + 1
+    assert len(fresh_db.signatures) == count_before + 1
 
 
-def test_add_signature_missing_fields(db):
+def test_add_signature_missing_fields(fresh_db):
     incomplete = {"id": "test-002", "category": "test"}
-    count_before = len(db.signatures)
-    result = db.add_signature(incomplete)
+    count_before = len(fresh_db.signatures)
+    result = fresh_db.add_signature(incomplete)
     assert result is False
-    assert len(db.signatures) == count_before
+    assert len(fresh_db.signatures) == count_before
 
 
-def test_default_categories_structure(db):
+def test_default_categories_structure(safety_db):
     """Each category should have name, emoji, and description."""
-    for cat_id, cat_data in db.categories.items():
+    for cat_id, cat_data in safety_db.categories.items():
         assert "name" in cat_data, f"Category '{cat_id}' missing 'name'"
         assert "description" in cat_data, f"Category '{cat_id}' missing 'description'"
 
 
-def test_default_severity_levels_valid():
+@per_default_signature
+def test_default_signature_severity(sig):
     """Default signatures should use valid severity levels."""
-    db = SafetyDatabase.__new__(SafetyDatabase)
-    defaults = db._get_default_signatures()
-    valid_severities = {"low", "medium", "high", "critical"}
-    for sig in defaults:
-        assert sig["severity"] in valid_severities, (
-            f"Signature {sig['id']} has invalid severity '{sig['severity']}'"
-        )
+    assert sig["severity"] in _VALID_SEVERITIES, (
+        f"Signature {sig['id']} has invalid severity '{sig['severity']}'"
+    )
 
 
-def test_default_triggers_are_nonempty_lists():
+@per_default_signature
+def test_default_signature_triggers(sig):
     """Default signatures' triggers should be non-empty lists of strings."""
-    db = SafetyDatabase.__new__(SafetyDatabase)
-    defaults = db._get_default_signatures()
-    for sig in defaults:
-        assert isinstance(sig["triggers"], list), f"Signature {sig['id']} triggers not a list"
-        assert len(sig["triggers"]) > 0, f"Signature {sig['id']} has empty triggers"
-        for trigger in sig["triggers"]:
-            assert isinstance(trigger, str), f"Signature {sig['id']} has non-string trigger"
+    assert isinstance(sig["triggers"], list), f"Signature {sig['id']} triggers not a list"
+    assert len(sig["triggers"]) > 0, f"Signature {sig['id']} has empty triggers"
+    assert all(isinstance(trigger, str) for trigger in sig["triggers"]), (
+        f"Signature {sig['id']} has non-string trigger"
+    )
+
+
+def test_loaded_key_fields_are_interned(safety_db):
+    """category/severity strings from JSON are interned on load."""
+    import sys
+    for sig in safety_db.signatures:
+        assert sig["category"] is sys.intern(sig["category"])
+        for danger_sig in sig.get("danger_signatures", []):
+            if "severity" in danger_sig:
+                assert danger_sig["severity"] is sys.intern(danger_sig["severity"])
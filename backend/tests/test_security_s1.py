@@ -10,189 +10,167 @@ Covers:
 
 import pytest
 import time
-from unittest.mock import patch, AsyncMock, MagicMock
-from types import SimpleNamespace
-from httpx import AsyncClient, ASGITransport
-from main import app, _rate_limit_store, generate_report_html
+from urllib.parse import quote
 
-
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
+# main (FastAPI app, analyzer, signature DB) is imported inside the tests
+# that use it, so collecting or selecting a subset of this module stays cheap.
 
 
 @pytest.fixture
-async def client():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def asgi_get():
+    """Status code of a GET sent straight to the ASGI app.
+
+    For status-only checks: skips httpx's request building and response
+    handling, but still runs the app's full middleware stack.
+    """
+    from main import app, _rate_limit_store
+
+    _rate_limit_store.clear()
+
+    async def get(path: str) -> int:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": quote(path).encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"test")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("test", 80),
+        }
+        statuses = []
 
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
 
-class TestReportEndpointValidation:
-    """V2-1.2: /report/{video_id} must validate video_id format."""
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
 
-    @pytest.mark.asyncio
-    async def test_report_rejects_invalid_video_id(self, client):
-        """Invalid video IDs should return 400, not reach analyzer."""
-        response = await client.get("/report/invalid!")
-        assert response.status_code == 400
+        await app(scope, receive, send)
+        return statuses[0]
 
-    @pytest.mark.asyncio
-    async def test_report_rejects_xss_video_id(self, client):
-        """XSS payloads in video_id should be rejected (400 or 404, never 200)."""
-        response = await client.get("/report/<script>alert(1)</script>")
-        # May get 400 (our validator) or 404 (FastAPI path routing rejects '/')
-        # Both are safe — the key is it's NOT 200
-        assert response.status_code in (400, 404)
+    return get
 
-    @pytest.mark.asyncio
-    async def test_report_rejects_sql_injection_video_id(self, client):
-        """SQL injection payloads should return 400."""
-        response = await client.get("/report/'; DROP TABLE--")
-        assert response.status_code == 400
 
-    @pytest.mark.asyncio
-    async def test_report_rejects_empty_video_id(self, client):
-        """Empty string video_id should return 400 or 404."""
-        response = await client.get("/report/")
-        # FastAPI returns 404 for missing path parameter
-        assert response.status_code in (400, 404)
+class TestReportEndpointValidation:
+    """V2-1.2: /report/{video_id} must validate video_id format."""
 
+    # 404 is as safe as 400: FastAPI's path routing rejects a '/' in the
+    # payload and a missing path parameter before our validator runs.
+    # Either way the request never reaches the analyzer (never 200).
     @pytest.mark.asyncio
-    async def test_report_rejects_too_long_video_id(self, client):
-        """Video IDs longer than 11 chars should return 400."""
-        response = await client.get("/report/aaaaaaaaaaaa")  # 12 chars
-        assert response.status_code == 400
+    @pytest.mark.parametrize("payload, allowed", [
+        ("invalid!", {400}),
+        ("<script>alert(1)</script>", {400, 404}),
+        ("'; DROP TABLE--", {400}),
+        ("", {400, 404}),
+        ("aaaaaaaaaaaa", {400}),  # 12 chars: one too many
+        ("aaaaaaaaaaa\n", {400}),  # Valid ID plus a trailing newline
+    ], ids=["invalid-chars", "xss", "sql-injection", "empty", "too-long", "trailing-newline"])
+    async def test_report_rejects_bad_video_id(self, asgi_get, payload, allowed):
+        """Malformed video IDs are rejected before analysis."""
+        assert await asgi_get(f"/report/{payload}") in allowed
+
+
+# Analysis results with a distinct HTML payload in every user-controlled
+# field, so one render covers all of them and each escape check only
+# matches its own field's payload
+_XSS_RESULTS = {
+    'video_id': '<script>alert("vid")</script>',
+    'safety_score': 20,
+    'warnings': [{
+        'category': '<b>Fake</b>',
+        'severity': 'high',
+        'message': '<script>steal(cookies)</script>',
+    }],
+    'categories': {'<script>cat()</script>': {'emoji': '⚠️', 'flagged': True, 'score': 80}},
+    'summary': '<img src=x onerror=alert(1)>',
+}
+
+
+@pytest.fixture(scope="module")
+def rendered_html():
+    """The report for _XSS_RESULTS, rendered once."""
+    from report_html import generate_report_html
+
+    return generate_report_html(_XSS_RESULTS)
 
 
 class TestReportXSSPrevention:
     """V2-1.1: HTML report must escape all dynamic values."""
 
-    def test_video_id_escaped_in_report(self):
-        """Video ID with HTML chars must be escaped in output."""
-        results = {
-            'video_id': '<script>alert("xss")</script>',
-            'safety_score': 85,
-            'warnings': [],
-            'categories': {},
-            'summary': 'Test summary',
-        }
-        html = generate_report_html(results)
-        # The raw XSS payload must NOT appear in output
-        assert '<script>alert("xss")</script>' not in html
-        # The escaped version must appear
-        assert '&lt;script&gt;' in html
-
-    def test_summary_escaped_in_report(self):
-        """Summary text with HTML must be escaped in output."""
-        results = {
-            'video_id': 'dQw4w9WgXcQ',
-            'safety_score': 50,
-            'warnings': [],
-            'categories': {},
-            'summary': '<img src=x onerror=alert(1)>',
-        }
-        html = generate_report_html(results)
-        assert '<img src=x onerror=alert(1)>' not in html
-        assert '&lt;img' in html
-
-    def test_warning_messages_escaped_in_report(self):
-        """Warning messages with HTML must be escaped."""
-        results = {
-            'video_id': 'dQw4w9WgXcQ',
-            'safety_score': 20,
-            'warnings': [{
-                'category': '<b>Fake</b>',
-                'severity': 'high',
-                'message': '<script>steal(cookies)</script>',
-            }],
-            'categories': {},
-            'summary': 'Dangerous video',
-        }
-        html = generate_report_html(results)
-        assert '<script>steal(cookies)</script>' not in html
-        assert '&lt;script&gt;' in html
-        assert '<b>Fake</b>' not in html
-
-    def test_category_names_escaped_in_report(self):
-        """Category names with HTML must be escaped."""
-        results = {
-            'video_id': 'dQw4w9WgXcQ',
-            'safety_score': 70,
-            'warnings': [],
-            'categories': {
-                '<script>x</script>': {
-                    'emoji': '⚠️',
-                    'flagged': True,
-                    'score': 80,
-                },
-            },
-            'summary': 'Test',
-        }
-        html = generate_report_html(results)
-        assert '<script>x</script>' not in html
+    @pytest.mark.parametrize("raw, escaped", [
+        ('<script>alert("vid")</script>', '&lt;script&gt;alert(&quot;vid&quot;)'),
+        ('<img src=x onerror=alert(1)>', '&lt;img src=x onerror=alert(1)&gt;'),
+        ('<script>steal(cookies)</script>', '&lt;script&gt;steal(cookies)'),
+        ('<b>Fake</b>', '&lt;b&gt;Fake&lt;/b&gt;'),
+        ('<script>cat()</script>', '&lt;script&gt;cat()'),
+    ], ids=["video-id", "summary", "warning-message", "warning-category", "category-name"])
+    def test_dynamic_values_escaped_in_report(self, rendered_html, raw, escaped):
+        """HTML in any dynamic value must come out escaped, never raw."""
+        assert raw not in rendered_html
+        assert escaped in rendered_html
 
 
 class TestRateLimiterCleanup:
     """V2-1.3: Rate limiter cleanup must prune stale entries, not nuke all."""
 
-    def test_cleanup_preserves_active_entries(self):
-        """Active (non-expired) entries must survive cleanup."""
-        # Clear store first
+    @pytest.fixture
+    def store(self):
+        """The app's rate-limit store, emptied before and after the test."""
+        from main import _rate_limit_store
+
+        _rate_limit_store.clear()
+        yield _rate_limit_store
         _rate_limit_store.clear()
 
+    def test_cleanup_preserves_active_entries(self, store):
+        """Active (non-expired) entries must survive cleanup."""
+        from main import _cleanup_rate_limit_store
+
         now = time.time()
-        # Add active entries (within the 60-second window)
-        _rate_limit_store["active_ip:path1"] = [now - 10]
-        _rate_limit_store["active_ip:path2"] = [now - 5]
-
-        # Add enough stale entries to trigger cleanup (>1000)
-        for i in range(1001):
-            _rate_limit_store[f"stale_{i}:path"] = [now - 120]  # 2 minutes old
-
-        # Verify we have > 1000 entries
-        assert len(_rate_limit_store) > 1000
-
-        # Simulate what the middleware does during cleanup
-        cutoff = now - 60  # 60-second window
-        stale_keys = [
-            k for k, v in _rate_limit_store.items()
-            if not v or v[-1] < cutoff
-        ]
-        for k in stale_keys:
-            del _rate_limit_store[k]
-
-        # Active entries MUST survive
-        assert "active_ip:path1" in _rate_limit_store
-        assert "active_ip:path2" in _rate_limit_store
-
-        # Stale entries must be gone
-        assert "stale_0:path" not in _rate_limit_store
-
-        # Clean up after test
-        _rate_limit_store.clear()
+        # Active entries (within the 60-second window)
+        store["active_ip:path1"] = [now - 10]
+        store["active_ip:path2"] = [now - 5]
+        # Stale entries (2 minutes old)
+        store["stale_0:path"] = [now - 120]
+        store["stale_1:path"] = [now - 120]
 
-    def test_cleanup_removes_empty_timestamp_lists(self):
+        _cleanup_rate_limit_store(now - 60)
+
+        # Active entries MUST survive; stale entries must be gone
+        assert set(store) == {"active_ip:path1", "active_ip:path2"}
+
+    def test_cleanup_removes_empty_timestamp_lists(self, store):
         """Entries with empty timestamp lists should be removed."""
-        _rate_limit_store.clear()
+        from main import _cleanup_rate_limit_store
 
         now = time.time()
-        _rate_limit_store["empty:path"] = []
-        _rate_limit_store["active:path"] = [now]
+        store["empty:path"] = []
+        store["active:path"] = [now]
 
-        # Add filler to trigger threshold
-        for i in range(1001):
-            _rate_limit_store[f"filler_{i}:p"] = [now - 120]
+        _cleanup_rate_limit_store(now - 60)
 
-        cutoff = now - 60
-        stale_keys = [
-            k for k, v in _rate_limit_store.items()
-            if not v or v[-1] < cutoff
-        ]
-        for k in stale_keys:
-            del _rate_limit_store[k]
+        assert "empty:path" not in store
+        assert "active:path" in store
 
-        assert "empty:path" not in _rate_limit_store
-        assert "active:path" in _rate_limit_store
+    @pytest.mark.asyncio
+    async def test_middleware_cleans_up_past_threshold(self, store, client):
+        """A request arriving with the store over the threshold prunes it."""
+        from main import RATE_LIMIT_CLEANUP_THRESHOLD
 
-        _rate_limit_store.clear()
+        # One shared timestamp list: cleanup only reads it, then drops the key
+        store.update(dict.fromkeys(
+            (f"stale_{i}:path" for i in range(RATE_LIMIT_CLEANUP_THRESHOLD + 1)),
+            [time.time() - 120],
+        ))
+
+        response = await client.get("/health")
+
+        assert response.status_code == 200
+        assert not any(k.startswith("stale_") for k in store)
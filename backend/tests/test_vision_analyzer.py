@@ -0,0 +1,204 @@
+import subprocess
+import time
+import httpx
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+pytest.importorskip("yt_dlp")  # vision_analyzer imports it at module level
+
+from vision_analyzer import (
+    VisionAnalyzer, VisionResultCache, AsyncRateLimiter, _split_jpegs,
+    MAX_RETRY_AFTER_SECONDS, VISION_MAX_RETRIES,
+)
+
+
+def _jpeg(body: bytes) -> bytes:
+    """A stand-in JPEG: SOI marker, payload, EOI marker."""
+    return b"\xff\xd8" + body + b"\xff\xd9"
+
+
+def _frames(count):
+    return [{"timestamp": 10 * (i + 1), "data": "anBlZw==", "index": i + 1} for i in range(count)]
+
+
+def _frame_result(frame_num, **extra):
+    return {"frame_num": frame_num, "is_ai_generated": False, "safety_issues": False,
+            "concerns": [], **extra}
+
+
+@pytest.fixture
+async def vision(tmp_path):
+    analyzer = VisionAnalyzer(api_key="test-key", cache_path=str(tmp_path / "vision.sqlite3"))
+    yield analyzer
+    await analyzer.aclose()
+
+
+class TestVisionResultCache:
+    def test_hit_after_set(self, tmp_path):
+        cache = VisionResultCache(str(tmp_path / "cache.sqlite3"))
+        key = VisionResultCache.key("dQw4w9WgXcQ", 5)
+        assert cache.get(key) is None
+        cache.set(key, {"frames_analyzed": 5, "concerns": ["x"]})
+        assert cache.get(key) == {"frames_analyzed": 5, "concerns": ["x"]}
+        cache.close()
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = VisionResultCache(str(tmp_path / "cache.sqlite3"), ttl=-1)
+        cache.set("k", {"frames_analyzed": 5})
+        assert cache.get("k") is None
+        cache.close()
+
+    def test_storage_errors_are_misses(self, tmp_path):
+        cache = VisionResultCache(str(tmp_path / "cache.sqlite3"))
+        cache.close()
+        cache.set("k", {"frames_analyzed": 5})  # Logged, not raised
+        assert cache.get("k") is None
+
+
+class TestAnalyzeVideoFramesCache:
+    @pytest.mark.asyncio
+    async def test_complete_analysis_is_cached(self, vision):
+        extract = AsyncMock(return_value=_frames(2))
+        analyze = AsyncMock(side_effect=[_frame_result(1), _frame_result(2)])
+        with patch.object(vision, "_extract_frames", extract), patch.object(vision, "_analyze_frame", analyze):
+            first = await vision.analyze_video_frames("dQw4w9WgXcQ", num_frames=2)
+            second = await vision.analyze_video_frames("dQw4w9WgXcQ", num_frames=2)
+        assert first == second and first["frames_analyzed"] == 2
+        assert extract.await_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("frames, results", [
+        (_frames(1), [_frame_result(1)]),
+        (_frames(2), [_frame_result(1), _frame_result(2, raw_response="not json")]),
+        (_frames(2), [_frame_result(1), _frame_result(2, error="API error: 500")]),
+    ], ids=["missing-frames", "unparsed-reply", "failed-request"])
+    async def test_partial_analysis_is_not_cached(self, vision, frames, results):
+        extract = AsyncMock(return_value=frames)
+        with patch.object(vision, "_extract_frames", extract), \
+                patch.object(vision, "_analyze_frame", AsyncMock(side_effect=results * 2)):
+            await vision.analyze_video_frames("dQw4w9WgXcQ", num_frames=2)
+            await vision.analyze_video_frames("dQw4w9WgXcQ", num_frames=2)
+        assert extract.await_count == 2
+
+
+class TestSplitJpegs:
+    def test_splits_back_to_back_images(self):
+        images = [_jpeg(b"one"), _jpeg(b"tw\xff\x00o"), _jpeg(b"three")]
+        assert _split_jpegs(b"".join(images)) == images
+
+    def test_single_and_empty_streams(self):
+        assert _split_jpegs(_jpeg(b"only")) == [_jpeg(b"only")]
+        assert _split_jpegs(b"") == []
+
+
+class TestFrameExtraction:
+    def test_single_pass_maps_frames_back_to_timestamp_order(self):
+        stdout = _jpeg(b"t10") + _jpeg(b"t20") + _jpeg(b"t30")  # ffmpeg emits in time order
+        run = lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, stdout, b"")
+        with patch("vision_analyzer.subprocess.run", side_effect=run) as mock_run:
+            jpegs = VisionAnalyzer._extract_frames_single_pass("video.mp4", [30, 10, 20])
+        assert jpegs == [_jpeg(b"t30"), _jpeg(b"t10"), _jpeg(b"t20")]
+        select = mock_run.call_args.args[0][4]
+        assert select.startswith("select='gte(t,10)*not(gte(prev_t,10))+gte(t,20)")
+
+    @pytest.mark.parametrize("timestamps, stdout, returncode", [
+        ([10, 20, 30], _jpeg(b"t10") + _jpeg(b"t20"), 0),
+        ([10, 20], _jpeg(b"t10") + _jpeg(b"t20"), 1),
+        ([10, 10], _jpeg(b"t10") + _jpeg(b"t10"), 0),
+    ], ids=["missing-frame", "ffmpeg-error", "duplicate-timestamps"])
+    def test_single_pass_gives_up_on_incomplete_output(self, timestamps, stdout, returncode):
+        run = lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, returncode, stdout, b"")
+        with patch("vision_analyzer.subprocess.run", side_effect=run):
+            assert VisionAnalyzer._extract_frames_single_pass("video.mp4", timestamps) is None
+
+    @pytest.mark.asyncio
+    async def test_grab_frames_keeps_timestamp_order(self, vision):
+        def run(cmd, **kwargs):
+            ts = cmd[cmd.index("-ss") + 1]
+            if ts == "20":
+                raise subprocess.TimeoutExpired(cmd, 30)
+            return subprocess.CompletedProcess(cmd, 0, _jpeg(ts.encode()), b"")
+
+        with patch("vision_analyzer.subprocess.run", side_effect=run):
+            jpegs = await vision._grab_frames("https://example.com/v.mp4", [30, 20, 10])
+        assert jpegs == [_jpeg(b"30"), None, _jpeg(b"10")]
+
+
+class TestPostWithRetry:
+    def _serve(self, vision, *responses):
+        """Point the analyzer's client at canned responses; returns the request log."""
+        requests = []
+        replies = iter(responses)
+
+        def handler(request):
+            requests.append(request)
+            return next(replies)
+
+        vision.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return requests
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("retry_after, expected_wait", [
+        ("2", 2.0),
+        ("120", MAX_RETRY_AFTER_SECONDS),
+        ("Wed, 21 Oct 2026 07:28:00 GMT", 1.0),  # HTTP-date form: exponential backoff
+    ], ids=["seconds", "capped", "http-date"])
+    async def test_429_waits_for_retry_after(self, vision, retry_after, expected_wait):
+        requests = self._serve(
+            vision,
+            httpx.Response(429, headers={"Retry-After": retry_after}),
+            httpx.Response(200, json={"ok": True}),
+        )
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            response = await vision._post_with_retry({"model": "m"})
+        assert response.status_code == 200
+        assert len(requests) == 2 and requests[0].content == requests[1].content
+        sleep.assert_awaited_once_with(expected_wait)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, vision):
+        requests = self._serve(vision, *[httpx.Response(429)] * VISION_MAX_RETRIES)
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            response = await vision._post_with_retry({"model": "m"})
+        assert response.status_code == 429
+        assert len(requests) == VISION_MAX_RETRIES
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0][:VISION_MAX_RETRIES - 1]
+
+
+class TestAsyncRateLimiter:
+    @pytest.fixture
+    def clock(self):
+        """Fake monotonic clock that asyncio.sleep advances; yields the sleeps."""
+        now = [0.0]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        fake_time = SimpleNamespace(monotonic=lambda: now[0], time=time.time)
+        with patch("vision_analyzer.time", fake_time), patch("asyncio.sleep", fake_sleep):
+            yield now, sleeps
+
+    @pytest.mark.asyncio
+    async def test_paces_requests_beyond_the_burst(self, clock):
+        now, sleeps = clock
+        limiter = AsyncRateLimiter(2, time_period=1.0)
+        for _ in range(4):
+            async with limiter:
+                pass
+        # Two tokens of burst, then one every half second
+        assert sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+        assert now[0] == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_refill_is_capped_at_the_burst(self, clock):
+        now, sleeps = clock
+        limiter = AsyncRateLimiter(2, time_period=1.0)
+        await limiter.acquire()
+        await limiter.acquire()
+        now[0] += 10.0  # Long idle: refills two tokens, not twenty
+        for _ in range(3):
+            await limiter.acquire()
+        assert sleeps == [pytest.approx(0.5)]
@@ -1,12 +1,71 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 import httpx
 from youtube_data import (
     YouTubeDataFetcher, VideoMetadata, Comment,
-    analyze_comments, MAX_SAFETY_WARNINGS, MAX_AI_WARNINGS,
+    analyze_comments, MAX_SAFETY_WARNINGS, MAX_AI_WARNINGS, _etag_cache,
 )
 
 
+# Canned API responses, built once: the fetcher only reads them
+_META_OK = httpx.Response(200, json={
+    "items": [{
+        "snippet": {
+            "title": "Test Video",
+            "description": "A description",
+            "channelTitle": "TestChannel",
+            "tags": ["tag1", "tag2"],
+            "categoryId": "22",
+        }
+    }]
+})
+_META_EMPTY = httpx.Response(200, json={"items": []})
+_META_403 = httpx.Response(403)
+_COMMENTS_OK = httpx.Response(200, json={
+    "items": [
+        {
+            "snippet": {
+                "topLevelComment": {
+                    "snippet": {
+                        "textDisplay": "Great video!",
+                        "likeCount": 5,
+                        "authorDisplayName": "User1",
+                    }
+                }
+            }
+        },
+        {
+            "snippet": {
+                "topLevelComment": {
+                    "snippet": {
+                        "textDisplay": "Very informative",
+                        "likeCount": 0,
+                        "authorDisplayName": "User2",
+                    }
+                }
+            }
+        },
+    ]
+})
+
+
+@pytest.fixture(scope="module")
+async def fetcher():
+    """One keyed fetcher for tests that patch out its HTTP requests.
+
+    Lifecycle tests (context manager, close) still build their own.
+    """
+    async with YouTubeDataFetcher(api_key="fake-key") as f:
+        yield f
+
+
+@pytest.fixture(scope="module")
+async def keyless_fetcher():
+    """One fetcher without an API key (every lookup short-circuits)."""
+    async with YouTubeDataFetcher(api_key=None) as f:
+        yield f
+
+
 class TestYouTubeDataFetcherContextManager:
     @pytest.mark.asyncio
     async def test_async_context_manager(self):
@@ -24,106 +83,76 @@ class TestYouTubeDataFetcherContextManager:
 
 class TestGetVideoMetadata:
     @pytest.mark.asyncio
-    async def test_no_api_key_returns_none(self):
-        async with YouTubeDataFetcher(api_key=None) as fetcher:
-            result = await fetcher.get_video_metadata("test123")
-            assert result is None
+    async def test_no_api_key_returns_none(self, keyless_fetcher):
+        assert await keyless_fetcher.get_video_metadata("test123") is None
 
     @pytest.mark.asyncio
-    async def test_parses_api_response(self):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [{
-                "snippet": {
-                    "title": "Test Video",
-                    "description": "A description",
-                    "channelTitle": "TestChannel",
-                    "tags": ["tag1", "tag2"],
-                    "categoryId": "22",
-                }
-            }]
-        }
-
-        async with YouTubeDataFetcher(api_key="fake-key") as fetcher:
-            with patch.object(fetcher, "_make_request_with_retry", new_callable=AsyncMock, return_value=mock_response):
-                result = await fetcher.get_video_metadata("test123")
+    @pytest.mark.parametrize("response, expected", [
+        (_META_OK, VideoMetadata(
+            title="Test Video",
+            description="A description",
+            channel="TestChannel",
+            tags=["tag1", "tag2"],
+            category="22",
+        )),
+        (_META_EMPTY, None),
+        (_META_403, None),
+    ], ids=["parses-api-response", "empty-items", "api-error"])
+    async def test_get_video_metadata(self, fetcher, response, expected):
+        with patch.object(fetcher, "_make_request_with_retry", new_callable=AsyncMock, return_value=response):
+            assert await fetcher.get_video_metadata("test123") == expected
 
-                assert isinstance(result, VideoMetadata)
-                assert result.title == "Test Video"
-                assert result.description == "A description"
-                assert result.channel == "TestChannel"
-                assert result.tags == ["tag1", "tag2"]
-                assert result.category == "22"
 
     @pytest.mark.asyncio
-    async def test_empty_items_returns_none(self):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"items": []}
+    async def test_revalidates_with_etag(self, fetcher):
+        fresh = httpx.Response(200, json=_META_OK.json(), headers={"ETag": '"v1"'})
+        request = AsyncMock(side_effect=[fresh, httpx.Response(304)])
+        with patch.object(fetcher, "_make_request_with_retry", request):
+            first = await fetcher.get_video_metadata("etagVideo01")
+            second = await fetcher.get_video_metadata("etagVideo01")
 
-        async with YouTubeDataFetcher(api_key="fake-key") as fetcher:
-            with patch.object(fetcher, "_make_request_with_retry", new_callable=AsyncMock, return_value=mock_response):
-                result = await fetcher.get_video_metadata("nonexistent")
-                assert result is None
+        assert first == second and first.title == "Test Video"
+        assert request.call_args_list[0].kwargs["headers"] is None
+        assert request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
 
     @pytest.mark.asyncio
-    async def test_api_error_returns_none(self):
-        mock_response = MagicMock()
-        mock_response.status_code = 403
+    async def test_etag_cache_evicts_least_recently_used(self, fetcher):
+        def fresh(*args, **kwargs):
+            return httpx.Response(200, json=_META_OK.json(), headers={"ETag": '"v1"'})
 
-        async with YouTubeDataFetcher(api_key="fake-key") as fetcher:
-            with patch.object(fetcher, "_make_request_with_retry", new_callable=AsyncMock, return_value=mock_response):
-                result = await fetcher.get_video_metadata("test123")
-                assert result is None
+        request = AsyncMock(side_effect=fresh)
+        with patch.dict(_etag_cache, clear=True), patch("youtube_data.ETAG_CACHE_SIZE", 2), \
+                patch.object(fetcher, "_make_request_with_retry", request):
+            for video_id in ("evictVid001", "evictVid002", "evictVid003", "evictVid001"):
+                await fetcher.get_video_metadata(video_id)
+            assert len(_etag_cache) == 2
 
+        # The oldest entry was dropped, so the repeat fetch is unconditional
+        assert request.call_args_list[3].kwargs["headers"] is None
 
-class TestGetComments:
     @pytest.mark.asyncio
-    async def test_parses_comment_threads(self):
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "items": [
-                {
-                    "snippet": {
-                        "topLevelComment": {
-                            "snippet": {
-                                "textDisplay": "Great video!",
-                                "likeCount": 5,
-                                "authorDisplayName": "User1",
-                            }
-                        }
-                    }
-                },
-                {
-                    "snippet": {
-                        "topLevelComment": {
-                            "snippet": {
-                                "textDisplay": "Very informative",
-                                "likeCount": 0,
-                                "authorDisplayName": "User2",
-                            }
-                        }
-                    }
-                },
-            ]
-        }
-
-        async with YouTubeDataFetcher(api_key="fake-key") as fetcher:
-            with patch.object(fetcher, "_make_request_with_retry", new_callable=AsyncMock, return_value=mock_response):
-                comments = await fetcher.get_comments("test123")
+    async def test_comment_pages_are_not_cached(self, fetcher):
+        page = httpx.Response(200, json=_COMMENTS_OK.json(), headers={"ETag": '"c1"'})
+        with patch.dict(_etag_cache, clear=True), \
+                patch.object(fetcher, "_make_request_with_retry", AsyncMock(return_value=page)):
+            await fetcher.get_comments("noCacheVid1")
+            assert not _etag_cache
 
-                assert len(comments) == 2
-                assert comments[0].text == "Great video!"
-                assert comments[0].likes == 5
-                assert comments[0].author == "User1"
 
+class TestGetComments:
     @pytest.mark.asyncio
-    async def test_no_api_key_returns_empty(self):
-        async with YouTubeDataFetcher(api_key=None) as fetcher:
+    async def test_parses_comment_threads(self, fetcher):
+        with patch.object(fetcher, "_make_request_with_retry", new_callable=AsyncMock, return_value=_COMMENTS_OK):
             comments = await fetcher.get_comments("test123")
-            assert comments == []
+
+            assert len(comments) == 2
+            assert comments[0].text == "Great video!"
+            assert comments[0].likes == 5
+            assert comments[0].author == "User1"
+
+    @pytest.mark.asyncio
+    async def test_no_api_key_returns_empty(self, keyless_fetcher):
+        assert await keyless_fetcher.get_comments("test123") == []
 
 
 class TestAnalyzeComments:
@@ -170,15 +199,43 @@ class TestAnalyzeComments:
         assert result["has_ai_content"] is False
 
     def test_max_warnings_respected(self):
-        # Create many warning comments that should trigger
-        comments = [
-            Comment(text=f"This is dangerous attempt {i}", likes=1, author=f"User{i}")
-            for i in range(20)
-        ]
+        # Many warning comments; duplicates still count separately
+        comments = [Comment(text="This is dangerous", likes=1, author="U")] * 20
         result = analyze_comments(comments)
+        assert result["warning_comments"] == 20
         safety_warnings = [w for w in result["warnings"] if w["category"] == "Community Warning"]
         assert len(safety_warnings) <= MAX_SAFETY_WARNINGS
 
+    def test_duplicate_comments_classified_once(self):
+        from youtube_data import _classify_comment
+        comments = [Comment(text="Made with AI, clearly ai generated", likes=0, author="Bot")] * 5
+        misses_before = _classify_comment.cache_info().misses
+        result = analyze_comments(comments)
+        assert result["ai_comments"] == 5
+        assert len(result["warnings"]) == 5
+        assert _classify_comment.cache_info().misses - misses_before <= 1
+
+    @pytest.mark.parametrize("text", [
+        "call a plumber, this is dangerous",   # later pattern matches further left
+        "so fake, honestly a deepfake",
+        "great video, thanks",
+        "fake",
+        "my cousin ended up in the er after trying this",
+        "made with dall-e, not real",
+        "thanks ai",
+        "ai\n",                                 # $ matches before a trailing newline
+        "éai slop",                             # \b is Unicode-aware
+    ])
+    def test_combined_patterns_keep_list_priority(self, text):
+        from youtube_data import _classify_comment, COMMENT_WARNING_PATTERNS, AI_CONTENT_PATTERNS
+        expected = next(
+            ((is_ai, severity, description)
+             for is_ai, patterns in ((False, COMMENT_WARNING_PATTERNS), (True, AI_CONTENT_PATTERNS))
+             for pattern, severity, description in patterns if pattern.search(text)),
+            None,
+        )
+        assert _classify_comment.__wrapped__(text) == expected
+
     def test_top_concerns_sorted_by_weight(self):
         comments = [
             Comment(text="This is dangerous!", likes=100, author="User1"),
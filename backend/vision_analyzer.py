@@ -5,8 +5,12 @@ Uses OpenAI GPT-4 Vision to analyze video frames for safety concerns
 
 import os
 import re
-import base64
+import json
+import time
 import asyncio
+import hashlib
+import sqlite3
+import threading
 import httpx
 from pathlib import Path
 from typing import Optional
@@ -16,27 +20,234 @@ import subprocess
 import shutil
 import logging
 
+try:
+    import pybase64 as base64  # Optional: SIMD base64 encoder, same API
+except ImportError:
+    import base64
+
+try:
+    import orjson  # Optional: faster encoding/decoding of the vision API JSON
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # Optional: HTTP/2 for the OpenAI connection (httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-# Security: Video ID validation pattern
-VIDEO_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+# Security: Video ID validation pattern (used with fullmatch: '$' would
+# also accept a trailing newline)
+VIDEO_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]{11}')
 
 def validate_video_id(video_id: str) -> bool:
     """Validate YouTube video ID format to prevent command injection"""
-    return bool(video_id and VIDEO_ID_PATTERN.match(video_id))
+    return bool(video_id and VIDEO_ID_PATTERN.fullmatch(video_id))
+
+# Frames go to the model at "detail": "low" (one 512px tile), so extract them
+# at that size and a moderate JPEG quality rather than full-resolution q:v 2
+FRAME_SCALE_FILTER = "scale=512:-2"
+FRAME_JPEG_QUALITY = "6"
+
+# Max concurrent GPT-4 Vision requests (keeps frame fan-out clear of 429s)
+MAX_CONCURRENT_FRAME_REQUESTS = 5
+
+VISION_MODEL = "gpt-4o"  # Vision-capable model
+OPENAI_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+_JSON_HEADERS = {"Content-Type": "application/json"}  # Per request; auth is set on the client
+
+# Client-side pacing below OpenAI's per-minute request cap, so concurrent
+# analyses don't burst into 429s; any 429 that still occurs is retried
+VISION_REQUESTS_PER_MINUTE = 50
+VISION_MAX_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+VISION_PROMPT = """Analyze this video frame for safety concerns. Look for:
+
+1. **AI/Fake Content Detection**: 
+   - Is this image AI-generated? Look for: unnatural lighting, distorted hands/faces, weird textures, impossible physics, artifacts
+   - Signs of deepfake or manipulated content
+   
+2. **Physical Safety Hazards**:
+   - Dangerous activities without proper safety equipment
+   - Risky stunts, unsafe practices
+   - Electrical hazards, fire risks, chemical dangers
+   
+3. **Misleading Content**:
+   - Medical misinformation being demonstrated
+   - Dangerous DIY techniques
+   - Stunts presented as safe when they're not
+
+Respond in this JSON format:
+{
+    "is_ai_generated": true/false,
+    "ai_confidence": 0-100,
+    "ai_indicators": ["list of AI tells if any"],
+    "safety_issues": true/false,
+    "concerns": ["list of specific safety concerns"],
+    "description": "brief description of what's in the frame"
+}
+
+Be conservative - only flag clear issues. If unsure, don't flag."""
+
+# Persistent result cache (opt-in: set VISION_CACHE_PATH to a SQLite file
+# outside the source tree): repeat analyses of a video skip the download,
+# frame extraction and (paid) vision calls. Keys include the model and a
+# prompt hash, so changing either invalidates old entries.
+VISION_CACHE_PATH = os.environ.get("VISION_CACHE_PATH")
+VISION_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_PROMPT_HASH = hashlib.sha256(f"{VISION_MODEL}\n{VISION_PROMPT}".encode()).hexdigest()[:16]
+
+
+class VisionResultCache:
+    """Vision results persisted in SQLite, with a per-entry expiry.
+
+    Storage errors are logged and treated as misses: the cache only ever
+    saves work, it never fails an analysis. Calls block; async code runs
+    them in a worker thread (the connection is shared under a lock).
+    """
+
+    def __init__(self, path: str, ttl: float = VISION_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vision_results "
+            "(key TEXT PRIMARY KEY, result TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(video_id: str, num_frames: int) -> str:
+        return f"{video_id}:{num_frames}:{_PROMPT_HASH}"
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT result FROM vision_results WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Vision cache read failed: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, result: dict) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO vision_results VALUES (?, ?, ?)",
+                    (key, json.dumps(result), time.time() + self.ttl),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Vision cache write failed: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+class AsyncRateLimiter:
+    """Token bucket allowing ``max_rate`` acquisitions per ``time_period``
+    seconds (bursts up to ``max_rate``). Use as ``async with limiter:``."""
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens + (now - self._updated) * self.max_rate / self.time_period,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+
+def _dump_json(payload) -> bytes:
+    """Encode a payload as compact JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _load_json(data):
+    """Decode JSON text or bytes (orjson when installed). Both raise a
+    json.JSONDecodeError subclass on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_JPEG_BOUNDARY = b'\xff\xd9\xff\xd8'  # EOI of one JPEG, SOI of the next
+
+
+def _split_jpegs(stream: bytes) -> list:
+    """Split ffmpeg's image2pipe output (back-to-back JPEGs) into images.
+
+    Entropy-coded data byte-stuffs 0xFF, so an EOI+SOI pair only occurs
+    between images.
+    """
+    if not stream:
+        return []
+    parts = stream.split(_JPEG_BOUNDARY)
+    return [
+        (b'' if i == 0 else b'\xff\xd8') + part + (b'' if i == len(parts) - 1 else b'\xff\xd9')
+        for i, part in enumerate(parts)
+    ]
+
 
 class VisionAnalyzer:
     """Analyzes video screenshots using AI vision models"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_path: Optional[str] = VISION_CACHE_PATH):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.enabled = bool(self.api_key)
+        self.cache = None
+        if cache_path:
+            try:
+                self.cache = VisionResultCache(cache_path)
+            except sqlite3.Error as e:
+                logger.warning(f"Vision result cache disabled: {e}")
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FRAME_REQUESTS)
+        self._rate_limiter = AsyncRateLimiter(VISION_REQUESTS_PER_MINUTE)
+        # One pooled client for every frame request: keep-alive connections
+        # skip a TCP connect + TLS handshake per frame
+        self.client = httpx.AsyncClient(
+            timeout=60.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else None,
+        )
         
         if self.enabled:
             logger.info("✅ OpenAI API key found - Vision analysis enabled")
         else:
             logger.warning("⚠️ No OPENAI_API_KEY - Vision analysis disabled")
     
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and the result cache."""
+        await self.client.aclose()
+        if self.cache is not None:
+            self.cache.close()
+    
     async def analyze_video_frames(self, video_id: str, num_frames: int = 5) -> dict:
         """
         Extract and analyze frames from a YouTube video
@@ -65,6 +276,12 @@ class VisionAnalyzer:
                 "frames_analyzed": 0
             }
         
+        cache_key = VisionResultCache.key(video_id, num_frames)
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             # Extract frames from video
             frames = await self._extract_frames(video_id, num_frames)
@@ -77,18 +294,30 @@ class VisionAnalyzer:
                     "frames_analyzed": 0
                 }
             
-            # Analyze each frame with AI vision
-            all_concerns = []
+            # Analyze all frames concurrently: the requests are independent
+            gathered = await asyncio.gather(
+                *(self._analyze_frame(frame_data, i + 1) for i, frame_data in enumerate(frames)),
+                return_exceptions=True,
+            )
             frame_results = []
-            
-            for i, frame_data in enumerate(frames):
-                result = await self._analyze_frame(frame_data, i + 1)
+            all_concerns = []
+            for i, result in enumerate(gathered):
+                if isinstance(result, Exception):
+                    logger.error(f"Frame analysis error: {result}")
+                    result = {
+                        "frame_num": i + 1,
+                        "timestamp": frames[i]['timestamp'],
+                        "error": str(result),
+                        "is_ai_generated": False,
+                        "safety_issues": False,
+                        "concerns": []
+                    }
                 frame_results.append(result)
                 
                 if result.get("concerns"):
                     all_concerns.extend(result["concerns"])
             
-            return {
+            results = {
                 "enabled": True,
                 "message": f"Analyzed {len(frames)} frames",
                 "concerns": all_concerns,
@@ -97,6 +326,14 @@ class VisionAnalyzer:
                 "is_ai_generated": any(r.get("is_ai_generated") for r in frame_results),
                 "safety_issues": any(r.get("safety_issues") for r in frame_results)
             }
+            # Only complete analyses are cached: missing frames, failed
+            # requests and unparseable replies are retried next time
+            complete = len(frames) == num_frames and not any(
+                "error" in r or "raw_response" in r for r in frame_results
+            )
+            if self.cache is not None and complete:
+                await asyncio.to_thread(self.cache.set, cache_key, results)
+            return results
             
         except Exception as e:
             logger.error(f"Vision analysis error: {e}")
@@ -111,11 +348,93 @@ class VisionAnalyzer:
         """Extract frames from YouTube video using yt-dlp and ffmpeg"""
         
         frames = []
-        temp_dir = tempfile.mkdtemp()
         
         try:
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             
+            # Resolve the direct media URL first: ffmpeg seeks into the HTTP
+            # stream with range requests, so only the bytes around each
+            # timestamp are fetched instead of the whole video
+            stream_opts = {
+                'format': 'worst[ext=mp4][protocol^=http]',  # Progressive mp4 over HTTP(S)
+                'quiet': True,
+                'no_warnings': True,
+            }
+            info = await asyncio.to_thread(self._extract_info, video_url, stream_opts, False)
+            timestamps = self._frame_timestamps(info.get('duration', 60), num_frames)
+            
+            jpegs = None
+            stream_url = info.get('url')
+            # Security: only hand ffmpeg http(s) URLs (no file: or other protocols)
+            if stream_url and stream_url.startswith(('https://', 'http://')):
+                jpegs = await self._grab_frames(stream_url, timestamps)
+                if not any(jpegs):
+                    logger.warning("Streamed frame extraction failed, downloading video")
+                    jpegs = None
+            
+            if jpegs is None:
+                jpegs = await self._extract_frames_from_download(video_url, timestamps)
+            
+            for i, (ts, jpeg) in enumerate(zip(timestamps, jpegs)):
+                if jpeg:
+                    frames.append({
+                        "timestamp": ts,
+                        "data": base64.b64encode(jpeg).decode('ascii'),
+                        "index": i + 1
+                    })
+            
+            return frames
+            
+        except Exception as e:
+            logger.error(f"Frame extraction error: {e}")
+            return []
+    
+    @staticmethod
+    def _extract_info(video_url: str, ydl_opts: dict, download: bool) -> dict:
+        with YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(video_url, download=download)
+    
+    @staticmethod
+    def _frame_timestamps(duration: float, num_frames: int) -> list:
+        """Frame timestamps, evenly distributed over the video"""
+        if duration > 0:
+            interval = duration / (num_frames + 1)
+            return [int(interval * i) for i in range(1, num_frames + 1)]
+        return [5, 15, 30, 45, 55][:num_frames]
+    
+    async def _grab_frames(self, source: str, timestamps: list) -> list:
+        """Grab one JPEG per timestamp, seeking each ffmpeg input to it.
+        
+        The grabs run concurrently; on a streamed URL each one only fetches
+        the byte ranges around its timestamp. JPEGs are read from ffmpeg's
+        stdout, never written to disk. Returns them in timestamp order
+        (None where a grab failed).
+        """
+        async def grab(ts):
+            cmd = [
+                'ffmpeg', '-ss', str(ts), '-i', source,
+                '-vframes', '1', '-vf', FRAME_SCALE_FILTER,
+                '-q:v', FRAME_JPEG_QUALITY,
+                '-f', 'image2pipe', '-vcodec', 'mjpeg', '-'
+            ]
+            try:
+                # Security: shell=False (list args), explicit timeout
+                result = await asyncio.to_thread(
+                    subprocess.run, cmd, capture_output=True, timeout=30, shell=False
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Frame grab at {ts}s failed: {e}")
+                return None
+            return result.stdout if result.returncode == 0 and result.stdout else None
+        
+        return list(await asyncio.gather(*(grab(ts) for ts in timestamps)))
+    
+    async def _extract_frames_from_download(self, video_url: str, timestamps: list) -> list:
+        """Fallback: download the video, then extract frames from the local file"""
+        
+        temp_dir = tempfile.mkdtemp()
+        
+        try:
             # Download video to temp file
             ydl_opts = {
                 'format': 'worst[ext=mp4]',  # Smallest video for speed
@@ -123,10 +442,7 @@ class VisionAnalyzer:
                 'quiet': True,
                 'no_warnings': True,
             }
-            
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(video_url, download=True)
-                duration = info.get('duration', 60)
+            await asyncio.to_thread(self._extract_info, video_url, ydl_opts, True)
             
             video_path = os.path.join(temp_dir, 'video.mp4')
 
@@ -144,42 +460,12 @@ class VisionAnalyzer:
                 logger.error("Could not find downloaded video")
                 return []
             
-            # Calculate frame timestamps (evenly distributed)
-            timestamps = []
-            if duration > 0:
-                interval = duration / (num_frames + 1)
-                for i in range(1, num_frames + 1):
-                    timestamps.append(int(interval * i))
-            else:
-                timestamps = [5, 15, 30, 45, 55][:num_frames]
-            
-            # Extract frames using ffmpeg
-            for i, ts in enumerate(timestamps):
-                frame_path = os.path.join(temp_dir, f'frame_{i}.jpg')
-                
-                cmd = [
-                    'ffmpeg', '-ss', str(ts), '-i', video_path,
-                    '-vframes', '1', '-q:v', '2',
-                    '-y', frame_path
-                ]
-                
-                # Security: shell=False (list args), explicit timeout
-                result = subprocess.run(cmd, capture_output=True, timeout=30, shell=False)
-                
-                if os.path.exists(frame_path):
-                    with open(frame_path, 'rb') as f:
-                        frame_data = base64.b64encode(f.read()).decode('utf-8')
-                        frames.append({
-                            "timestamp": ts,
-                            "data": frame_data,
-                            "index": i + 1
-                        })
-            
-            return frames
-            
-        except Exception as e:
-            logger.error(f"Frame extraction error: {e}")
-            return []
+            # Extract all frames in one ffmpeg pass; fall back to one
+            # seek-and-grab per timestamp if that fails
+            jpegs = await asyncio.to_thread(self._extract_frames_single_pass, video_path, timestamps)
+            if jpegs is None:
+                jpegs = await self._grab_frames(video_path, timestamps)
+            return jpegs
         finally:
             # Cleanup temp directory
             try:
@@ -187,52 +473,80 @@ class VisionAnalyzer:
             except OSError as cleanup_err:
                 logger.warning(f"Failed to clean up temp dir {temp_dir}: {cleanup_err}")
     
+    @staticmethod
+    def _extract_frames_single_pass(video_path: str, timestamps: list) -> Optional[list]:
+        """Grab the frame at every timestamp with a single ffmpeg invocation.
+
+        Demuxes and decodes the video once instead of once per timestamp.
+        Returns the JPEGs in timestamp order, or None if ffmpeg failed or
+        did not produce exactly one frame per timestamp.
+        """
+        if not timestamps or len(set(timestamps)) != len(timestamps):
+            return None
+        
+        # Select the first decoded frame at or past each timestamp. An exact
+        # eq(t,ts) would rarely hit: frame times fall between whole seconds.
+        # prev_t is NAN on the first frame, so not(gte(...)) still selects it.
+        select_expr = "+".join(
+            f"gte(t,{ts})*not(gte(prev_t,{ts}))" for ts in sorted(timestamps)
+        )
+        cmd = [
+            'ffmpeg', '-i', video_path,
+            '-vf', f"select='{select_expr}',{FRAME_SCALE_FILTER},setpts=N/TB",
+            '-vsync', '0', '-q:v', FRAME_JPEG_QUALITY,
+            '-f', 'image2pipe', '-vcodec', 'mjpeg', '-'
+        ]
+        
+        try:
+            # Security: shell=False (list args), explicit timeout
+            result = subprocess.run(cmd, capture_output=True, timeout=60, shell=False)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Single-pass frame extraction failed: {e}")
+            return None
+        
+        jpegs = _split_jpegs(result.stdout)
+        if result.returncode != 0 or len(jpegs) != len(timestamps):
+            logger.warning("Single-pass frame extraction incomplete, extracting frames one by one")
+            return None
+        
+        # Frames come out in time order; map back to the caller's order
+        by_ts = dict(zip(sorted(timestamps), jpegs))
+        return [by_ts[ts] for ts in timestamps]
+    
+    async def _post_with_retry(self, payload: dict) -> httpx.Response:
+        """POST a chat completion, paced by the rate limiter; 429s are retried
+        after the server's Retry-After (or an exponential backoff)"""
+        body = _dump_json(payload)
+        delay = 1.0
+        for attempt in range(VISION_MAX_RETRIES):
+            async with self._rate_limiter:
+                response = await self.client.post(
+                    OPENAI_CHAT_COMPLETIONS_URL,
+                    content=body,
+                    headers=_JSON_HEADERS,
+                )
+            if response.status_code != 429 or attempt == VISION_MAX_RETRIES - 1:
+                return response
+            try:
+                wait = float(response.headers.get("retry-after", delay))
+            except ValueError:  # HTTP-date form
+                wait = delay
+            logger.warning(f"Vision API rate limited, retrying in {wait:.1f}s (attempt {attempt+1}/{VISION_MAX_RETRIES})...")
+            await asyncio.sleep(min(wait, MAX_RETRY_AFTER_SECONDS))
+            delay *= 2.0
+    
     async def _analyze_frame(self, frame_data: dict, frame_num: int) -> dict:
         """Analyze a single frame using GPT-4 Vision"""
-        
-        prompt = """Analyze this video frame for safety concerns. Look for:
-
-1. **AI/Fake Content Detection**: 
-   - Is this image AI-generated? Look for: unnatural lighting, distorted hands/faces, weird textures, impossible physics, artifacts
-   - Signs of deepfake or manipulated content
-   
-2. **Physical Safety Hazards**:
-   - Dangerous activities without proper safety equipment
-   - Risky stunts, unsafe practices
-   - Electrical hazards, fire risks, chemical dangers
-   
-3. **Misleading Content**:
-   - Medical misinformation being demonstrated
-   - Dangerous DIY techniques
-   - Stunts presented as safe when they're not
-
-Respond in this JSON format:
-{
-    "is_ai_generated": true/false,
-    "ai_confidence": 0-100,
-    "ai_indicators": ["list of AI tells if any"],
-    "safety_issues": true/false,
-    "concerns": ["list of specific safety concerns"],
-    "description": "brief description of what's in the frame"
-}
-
-Be conservative - only flag clear issues. If unsure, don't flag."""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-4o",  # Vision-capable model
+            async with self._request_semaphore:
+                response = await self._post_with_retry({
+                        "model": VISION_MODEL,
                         "messages": [
                             {
                                 "role": "user",
                                 "content": [
-                                    {"type": "text", "text": prompt},
+                                    {"type": "text", "text": VISION_PROMPT},
                                     {
                                         "type": "image_url",
                                         "image_url": {
@@ -244,15 +558,13 @@ Be conservative - only flag clear issues. If unsure, don't flag."""
                             }
                         ],
                         "max_tokens": 500
-                    }
-                )
+                    })
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = _load_json(response.content)
                     content = result['choices'][0]['message']['content']
                     
                     # Parse JSON from response
-                    import json
                     try:
                         # Extract JSON from response (might be wrapped in markdown)
                         if '```json' in content:
@@ -260,7 +572,7 @@ Be conservative - only flag clear issues. If unsure, don't flag."""
                         elif '```' in content:
                             content = content.split('```')[1].split('```')[0]
                         
-                        analysis = json.loads(content.strip())
+                        analysis = _load_json(content.strip())
                         analysis['frame_num'] = frame_num
                         analysis['timestamp'] = frame_data['timestamp']
                         return analysis
@@ -4,15 +4,30 @@ Fetches video metadata, comments, and other data using YouTube Data API
 """
 
 import re
+import functools
+from collections import OrderedDict
 import httpx
 import logging
 from typing import Optional
 from dataclasses import dataclass
 
+try:
+    import h2  # Optional: HTTP/2 for the YouTube Data API connection (httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import re2  # Optional: linear-time (RE2) engine for the combined comment scans
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 # --- Comment analysis constants ---
 MAX_COMMENT_TEXT_LENGTH = 1000     # Truncation limit per comment (ReDoS prevention)
+COMMENT_CLASSIFY_CACHE_SIZE = 4096 # Distinct comment texts whose classification is memoized
+ETAG_CACHE_SIZE = 256              # Video metadata responses kept for If-None-Match revalidation
 LIKE_WEIGHT_DIVISOR = 10           # Divisor for comment likes weighting
 MAX_SAFETY_WARNINGS = 10           # Max safety warning comments to collect
 MAX_AI_WARNINGS = 5                # Max AI content warning comments to collect
@@ -37,6 +52,12 @@ class Comment:
     author: str
 
 
+# (url, params without the API key) -> (ETag, parsed JSON body). Module-level:
+# a fetcher is created per analysis, so re-analyses revalidate across them.
+# Only small video metadata bodies are kept, never comment pages.
+_etag_cache: OrderedDict[tuple, tuple[str, dict]] = OrderedDict()
+
+
 class YouTubeDataFetcher:
     """
     Fetches YouTube video data including comments.
@@ -46,7 +67,14 @@ class YouTubeDataFetcher:
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with optional YouTube Data API key."""
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # The metadata and comment requests of one analysis share a
+        # keep-alive connection (multiplexed over HTTP/2 when h2 is
+        # installed). httpx already negotiates gzip for response bodies.
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
 
     async def __aenter__(self) -> "YouTubeDataFetcher":
         return self
@@ -65,7 +93,8 @@ class YouTubeDataFetcher:
         else:
             return await self._scrape_comments(video_id, max_results)
     
-    async def _make_request_with_retry(self, url: str, params: dict, retries: int = 3) -> Optional[httpx.Response]:
+    async def _make_request_with_retry(self, url: str, params: dict, retries: int = 3,
+                                       headers: Optional[dict] = None) -> Optional[httpx.Response]:
         """Make HTTP request with retry logic for transient errors"""
         import asyncio
         delay = 1.0
@@ -73,7 +102,7 @@ class YouTubeDataFetcher:
         
         for attempt in range(retries):
             try:
-                response = await self.client.get(url, params=params)
+                response = await self.client.get(url, params=params, headers=headers)
                 # Success or client error (4xx) - return immediately
                 # 429 (Too Many Requests) or 403 (Forbidden) with quote errors should arguably stop retries, 
                 # but for simplicity we treat 5xx as retryable
@@ -95,6 +124,35 @@ class YouTubeDataFetcher:
             raise last_exception
         return None
 
+    async def _get_json(self, url: str, params: dict,
+                        revalidate: bool = False) -> tuple[Optional[int], Optional[dict]]:
+        """
+        GET an API resource as (status code, parsed body). With revalidate,
+        a previously fetched copy is revalidated with its ETag: a 304 Not
+        Modified reply has no body and serves the cached parse.
+        """
+        cache_key = (url, tuple(sorted((k, v) for k, v in params.items() if k != "key")))
+        cached = _etag_cache.get(cache_key) if revalidate else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = await self._make_request_with_retry(url, params, headers=headers)
+        if response is None:
+            return None, None
+        if response.status_code == 304 and cached:
+            _etag_cache.move_to_end(cache_key)
+            return 200, cached[1]
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if revalidate and etag:
+            _etag_cache[cache_key] = (etag, data)
+            _etag_cache.move_to_end(cache_key)
+            if len(_etag_cache) > ETAG_CACHE_SIZE:
+                _etag_cache.popitem(last=False)
+        return 200, data
+
     async def _fetch_comments_api(self, video_id: str, max_results: int) -> list[Comment]:
         """Fetch comments using official YouTube Data API"""
         url = "https://www.googleapis.com/youtube/v3/commentThreads"
@@ -107,9 +165,8 @@ class YouTubeDataFetcher:
         }
         
         try:
-            response = await self._make_request_with_retry(url, params)
-            if response and response.status_code == 200:
-                data = response.json()
+            status, data = await self._get_json(url, params)
+            if status == 200:
                 comments = []
                 for item in data.get("items", []):
                     snippet = item["snippet"]["topLevelComment"]["snippet"]
@@ -120,7 +177,7 @@ class YouTubeDataFetcher:
                     ))
                 return comments
             else:
-                logger.error(f"YouTube API error: {response.status_code}")
+                logger.error(f"YouTube API error: {status}")
                 return []
         except Exception as e:
             logger.error(f"Error fetching comments: {e}")
@@ -152,9 +209,8 @@ class YouTubeDataFetcher:
         }
         
         try:
-            response = await self._make_request_with_retry(url, params)
-            if response and response.status_code == 200:
-                data = response.json()
+            status, data = await self._get_json(url, params, revalidate=True)
+            if status == 200:
                 if data.get("items"):
                     snippet = data["items"][0]["snippet"]
                     return VideoMetadata(
@@ -244,6 +300,56 @@ AI_CONTENT_PATTERNS = [
 ]]
 
 
+def _combine_patterns(patterns: list, engine=re):
+    """One alternation of all patterns, for a single scan over a comment."""
+    return engine.compile("(?i)" + "|".join(f"(?:{pattern.pattern})" for pattern, _, _ in patterns))
+
+
+COMBINED_WARNING_PATTERN = _combine_patterns(COMMENT_WARNING_PATTERNS)
+COMBINED_AI_PATTERN = _combine_patterns(AI_CONTENT_PATTERNS)
+# The same alternations compiled with RE2 (linear time regardless of the
+# patterns' backtracking) when google-re2 is installed
+RE2_WARNING_PATTERN = _combine_patterns(COMMENT_WARNING_PATTERNS, re2) if re2 else None
+RE2_AI_PATTERN = _combine_patterns(AI_CONTENT_PATTERNS, re2) if re2 else None
+
+
+def _first_matching(text: str, patterns: list, combined, combined_re2=None) -> Optional[tuple]:
+    """
+    The first (pattern, severity, description) in ``patterns`` whose pattern
+    matches ``text``, using one scan of the combined alternation to rule out
+    the common no-match case.
+    """
+    # RE2's $ doesn't match before a trailing newline and its \b is
+    # ASCII-only, so its verdict only equals re's on ASCII text without one
+    if combined_re2 is not None and text.isascii() and not text.endswith("\n"):
+        combined = combined_re2
+    if combined.search(text) is None:
+        return None
+    # List order decides, not the alternation's leftmost match
+    return next((entry for entry in patterns if entry[0].search(text)), None)
+
+
+@functools.lru_cache(maxsize=COMMENT_CLASSIFY_CACHE_SIZE)
+def _classify_comment(text: str) -> tuple[bool, str, str] | None:
+    """
+    (is_ai, severity, description) of the first safety warning pattern
+    matching truncated, lowercased comment text, else of the first AI
+    content pattern; None if neither matches. Memoized: duplicate comments
+    (bot spam, copy-pasted warnings) and re-analyzed videos skip the regexes.
+    """
+    entry = _first_matching(text, COMMENT_WARNING_PATTERNS, COMBINED_WARNING_PATTERN, RE2_WARNING_PATTERN)
+    if entry is not None:
+        return False, entry[1], entry[2]
+    entry = _first_matching(text, AI_CONTENT_PATTERNS, COMBINED_AI_PATTERN, RE2_AI_PATTERN)
+    if entry is not None:
+        return True, entry[1], entry[2]
+    return None
+
+
+def _comment_message(text: str) -> str:
+    return f"Comment: \"{text[:100]}...\"" if len(text) > 100 else f"Comment: \"{text}\""
+
+
 def analyze_comments(comments: list[Comment]) -> dict:
     """
     Analyze comments for safety warnings and AI content detection.
@@ -261,59 +367,55 @@ def analyze_comments(comments: list[Comment]) -> dict:
     
     concern_counts = {}
     ai_concern_counts = {}
+    ai_warning_count = 0
     
     for comment in comments:
         text = comment.text[:MAX_COMMENT_TEXT_LENGTH].lower()  # Truncate to prevent ReDoS
-        matched = False
-
-        # Check safety warning patterns
-        for pattern, severity, description in COMMENT_WARNING_PATTERNS:
-            if pattern.search(text):
-                results["warning_comments"] += 1
-                matched = True
-
-                # Weight by likes (popular warnings are more significant)
-                weight = 1 + (comment.likes / LIKE_WEIGHT_DIVISOR)
-
-                if description not in concern_counts:
-                    concern_counts[description] = {"count": 0, "weight": 0, "severity": severity}
-                concern_counts[description]["count"] += 1
-                concern_counts[description]["weight"] += weight
-
-                if len(results["warnings"]) < MAX_SAFETY_WARNINGS:
-                    results["warnings"].append({
-                        "severity": severity,
-                        "category": "Community Warning",
-                        "message": f"Comment: \"{comment.text[:100]}...\"" if len(comment.text) > 100 else f"Comment: \"{comment.text}\"",
-                        "likes": comment.likes,
-                        "source": f"@{comment.author}"
-                    })
-                break
-
-        # Check AI content patterns (separate from safety)
-        if not matched:
-            for pattern, severity, description in AI_CONTENT_PATTERNS:
-                if pattern.search(text):
-                    results["ai_comments"] += 1
-                    results["has_ai_content"] = True
-
-                    weight = 1 + (comment.likes / LIKE_WEIGHT_DIVISOR)
-
-                    if description not in ai_concern_counts:
-                        ai_concern_counts[description] = {"count": 0, "weight": 0, "severity": severity}
-                    ai_concern_counts[description]["count"] += 1
-                    ai_concern_counts[description]["weight"] += weight
-
-                    # Add AI warnings separately
-                    if len([w for w in results["warnings"] if w["category"] == "AI Content"]) < MAX_AI_WARNINGS:
-                        results["warnings"].append({
-                            "severity": severity,
-                            "category": "AI Content",
-                            "message": f"Comment: \"{comment.text[:100]}...\"" if len(comment.text) > 100 else f"Comment: \"{comment.text}\"",
-                            "likes": comment.likes,
-                            "source": f"@{comment.author}"
-                        })
-                    break
+        match = _classify_comment(text)
+        if match is None:
+            continue
+        is_ai, severity, description = match
+
+        # Weight by likes (popular warnings are more significant)
+        weight = 1 + (comment.likes / LIKE_WEIGHT_DIVISOR)
+
+        if not is_ai:
+            # Safety warning
+            results["warning_comments"] += 1
+
+            if description not in concern_counts:
+                concern_counts[description] = {"count": 0, "weight": 0, "severity": severity}
+            concern_counts[description]["count"] += 1
+            concern_counts[description]["weight"] += weight
+
+            if len(results["warnings"]) < MAX_SAFETY_WARNINGS:
+                results["warnings"].append({
+                    "severity": severity,
+                    "category": "Community Warning",
+                    "message": _comment_message(comment.text),
+                    "likes": comment.likes,
+                    "source": f"@{comment.author}"
+                })
+        else:
+            # AI content (separate from safety)
+            results["ai_comments"] += 1
+            results["has_ai_content"] = True
+
+            if description not in ai_concern_counts:
+                ai_concern_counts[description] = {"count": 0, "weight": 0, "severity": severity}
+            ai_concern_counts[description]["count"] += 1
+            ai_concern_counts[description]["weight"] += weight
+
+            # Add AI warnings separately
+            if ai_warning_count < MAX_AI_WARNINGS:
+                ai_warning_count += 1
+                results["warnings"].append({
+                    "severity": severity,
+                    "category": "AI Content",
+                    "message": _comment_message(comment.text),
+                    "likes": comment.likes,
+                    "source": f"@{comment.author}"
+                })
 
     # Calculate warning score based on community feedback
     if comments:
@@ -1,9 +1,15 @@
-# Create simple placeholder PNG icons using pure Python
-# This creates minimal valid PNG files
+# Create simple placeholder PNG icons
+# Uses Pillow when installed (as generate_icons.py does); otherwise writes
+# minimal valid PNG files in pure Python
 
 import struct
 import zlib
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 def create_png(width, height, color):
     """Create a minimal PNG file with solid color"""
     
@@ -21,11 +27,8 @@ def create_png(width, height, color):
     
     # IDAT chunk (image data)
     r, g, b = color
-    raw_data = b''
-    for y in range(height):
-        raw_data += b'\x00'  # filter byte
-        for x in range(width):
-            raw_data += bytes([r, g, b])
+    row = b'\x00' + bytes([r, g, b]) * width  # filter byte + pixels
+    raw_data = row * height
     
     compressed = zlib.compress(raw_data)
     idat = png_chunk(b'IDAT', compressed)
@@ -38,10 +41,18 @@ def create_png(width, height, color):
 # Create icons with dark blue color
 color = (26, 26, 46)  # #1a1a2e
 
+
+def write_icon(size):
+    if Image is not None:
+        Image.new('RGB', (size, size), color).save(f'icon{size}.png', 'PNG')
+    else:
+        png_data = create_png(size, size, color)
+        with open(f'icon{size}.png', 'wb') as f:
+            f.write(png_data)
+
+
 for size in [16, 48, 128]:
-    png_data = create_png(size, size, color)
-    with open(f'icon{size}.png', 'wb') as f:
-        f.write(png_data)
+    write_icon(size)
     print(f'Created icon{size}.png')
 
 print('Done! Icons created.')
@@ -3,6 +3,10 @@ Generate YouTube Safety Inspector extension icons.
 Shield with checkmark design in the extension's dark theme colors.
 """
 from PIL import Image, ImageDraw, ImageFont
+from PIL.PngImagePlugin import PngInfo
+import functools
+import hashlib
+import io
 import math
 import os
 
@@ -14,65 +18,59 @@ SHIELD_EDGE  = (50, 200, 100)    # Slightly lighter green for edge highlight
 BG_COLOR     = (0, 0, 0, 0)      # Transparent background
 
 
-def draw_shield(draw, cx, cy, w, h, fill, outline, outline_width=1):
-    """Draw a shield shape centered at (cx, cy) with given width and height."""
+@functools.lru_cache(maxsize=None)
+def _unit_shield_points(steps=12, taper_steps=16):
+    """Shield outline (clockwise from top-left) as linear terms, returned as
+    columns (kxs, khs, kws): the i-th point for a shield centered at (cx, cy)
+    of size w x h is (cx + w*kxs[i], cy + h*khs[i] + w*kws[i]). The corner
+    radius follows the width, so the arcs' y depends on both w and h.
+    Computed once; every shield drawn is an affine copy of it.
+    """
     # Shield is composed of:
     # - Top: rounded rectangle (top half)
     # - Bottom: pointed triangle / curved taper
+    hw = 0.5            # half width, in units of w
+    r = hw * 0.35       # corner radius, in units of w
+    top = -0.5          # top edge, in units of h (the middle is at 0)
+    bot_h = 0.5         # bottom pointed section height, in units of h
+    ctrl = 0.5 - bot_h * 0.05   # bezier control point height, in units of h
 
-    hw = w / 2
-    top_h = h * 0.5     # top rectangular section height
-    bot_h = h * 0.5     # bottom pointed section height
-
-    top_y = cy - h / 2
-    mid_y = top_y + top_h
-    bot_y = cy + h / 2
-
-    # Corner radius for top
-    r = hw * 0.35
-
-    # Build shield polygon points (clockwise from top-left)
-    points = []
-    steps = 12
+    terms = []
 
     # Top-left corner arc
     for i in range(steps + 1):
         angle = math.pi + (math.pi / 2) * (i / steps)
-        px = (cx - hw + r) + r * math.cos(angle)
-        py = (top_y + r) + r * math.sin(angle)
-        points.append((px, py))
+        terms.append((-hw + r + r * math.cos(angle), top, r + r * math.sin(angle)))
 
     # Top-right corner arc
     for i in range(steps + 1):
         angle = -math.pi / 2 + (math.pi / 2) * (i / steps)
-        px = (cx + hw - r) + r * math.cos(angle)
-        py = (top_y + r) + r * math.sin(angle)
-        points.append((px, py))
+        terms.append((hw - r + r * math.cos(angle), top, r + r * math.sin(angle)))
 
     # Right side down to mid
-    points.append((cx + hw, mid_y))
-
-    # Bottom point - curved taper
-    taper_steps = 16
-    for i in range(taper_steps + 1):
-        t = i / taper_steps
-        # Quadratic bezier from (cx+hw, mid_y) through (cx+hw*0.3, bot_y-bot_h*0.1) to (cx, bot_y)
-        x = (1-t)**2 * (cx + hw) + 2*(1-t)*t * (cx + hw*0.15) + t**2 * cx
-        y = (1-t)**2 * mid_y + 2*(1-t)*t * (bot_y - bot_h*0.05) + t**2 * bot_y
-        points.append((x, y))
-
-    # Left taper back up
-    for i in range(taper_steps + 1):
-        t = i / taper_steps
-        x = (1-t)**2 * cx + 2*(1-t)*t * (cx - hw*0.15) + t**2 * (cx - hw)
-        y = (1-t)**2 * bot_y + 2*(1-t)*t * (bot_y - bot_h*0.05) + t**2 * mid_y
-        points.append((x, y))
+    terms.append((hw, 0.0, 0.0))
+
+    # Bottom point - curved taper: quadratic bezier from (hw, mid) through
+    # (hw*0.15, ctrl) to (0, bottom), then mirrored back up the left side
+    weights = [((1-t)**2, 2*(1-t)*t, t**2) for t in (i / taper_steps for i in range(taper_steps + 1))]
+    terms += [(a*hw + b*hw*0.15, b*ctrl + c*0.5, 0.0) for a, b, c in weights]
+    terms += [(-b*hw*0.15 - c*hw, a*0.5 + b*ctrl, 0.0) for a, b, c in weights]
 
     # Close back to top-left
-    points.append((cx - hw, mid_y))
+    terms.append((-hw, 0.0, 0.0))
+    return tuple(zip(*terms))
+
+
+def draw_shield(draw, cx, cy, w, h, fill):
+    """Draw a shield shape centered at (cx, cy) with given width and height."""
+    kxs, khs, kws = _unit_shield_points()
+    # Flat [x0, y0, x1, y1, ...] (accepted by draw.polygon): no per-point tuples
+    points = [0.0] * (2 * len(kxs))
+    points[0::2] = [cx + w*kx for kx in kxs]
+    points[1::2] = [cy + h*kh + w*kw for kh, kw in zip(khs, kws)]
 
     # Draw filled shield
-    draw.polygon(points, fill=fill, outline=outline, width=outline_width)
+    draw.polygon(points, fill=fill)
     return points
 
 
@@ -88,8 +86,30 @@ def draw_checkmark(draw, cx, cy, size, color, width):
     draw.line([p1, p2, p3], fill=color, width=width, joint="curve")
 
 
+def icon_signature(size: int) -> str:
+    """Hash of this script (colors, geometry, sampling) and the icon size."""
+    with open(__file__, 'rb') as f:
+        source = f.read()
+    return hashlib.blake2b(source + str(size).encode()).hexdigest()
+
+
+def is_up_to_date(output_path: str, signature: str) -> bool:
+    """True if output_path was rendered by this script at this size."""
+    try:
+        with Image.open(output_path) as existing:
+            return existing.info.get('sig') == signature
+    except OSError:
+        return False
+
+
 def generate_icon(size: int, output_path: str):
     """Generate a single icon at the given size."""
+    # Skip the render when the PNG already carries this script's signature
+    signature = icon_signature(size)
+    if is_up_to_date(output_path, signature):
+        print(f"  Skipped {output_path} ({size}x{size}, up to date)")
+        return
+
     # Use 4x supersampling for anti-aliasing
     ss = 4
     ss_size = size * ss
@@ -108,16 +128,16 @@ def generate_icon(size: int, output_path: str):
     shadow_offset = ss_size * 0.02
     draw_shield(draw, cx + shadow_offset, cy + shadow_offset, 
                 shield_w, shield_h, 
-                fill=(0, 0, 0, 60), outline=None)
+                fill=(0, 0, 0, 60))
     
     # Outer shield (green border)
     border = ss_size * 0.06
     draw_shield(draw, cx, cy, shield_w, shield_h,
-                fill=SHIELD_OUTER, outline=None)
+                fill=SHIELD_OUTER)
     
     # Inner shield (dark fill)
     draw_shield(draw, cx, cy, shield_w - border*2, shield_h - border*2,
-                fill=SHIELD_INNER + (255,), outline=None)
+                fill=SHIELD_INNER + (255,))
     
     # Checkmark
     check_size = shield_w * 0.65
@@ -125,12 +145,19 @@ def generate_icon(size: int, output_path: str):
     draw_checkmark(draw, cx, cy - ss_size * 0.02, check_size, 
                    CHECK_COLOR + (255,), check_width)
     
-    # Downsample with LANCZOS for clean anti-aliasing
-    img = img.resize((size, size), Image.LANCZOS)
-    img.save(output_path, 'PNG')
+    # Downsample for anti-aliasing: ss_size is an exact multiple of size, so
+    # a box average of each ss x ss block is as clean as LANCZOS and cheaper
+    img = img.resize((size, size), Image.BOX)
+    pnginfo = PngInfo()
+    pnginfo.add_text('sig', signature)
+    # Encode in memory: the buffer length is the file size, no stat needed
+    buf = io.BytesIO()
+    img.save(buf, 'PNG', optimize=True, pnginfo=pnginfo)
+    data = buf.getvalue()
+    with open(output_path, 'wb') as f:
+        f.write(data)
     
-    file_size = os.path.getsize(output_path)
-    print(f"  Created {output_path} ({size}x{size}, {file_size:,} bytes)")
+    print(f"  Created {output_path} ({size}x{size}, {len(data):,} bytes)")
 
 
 def main():